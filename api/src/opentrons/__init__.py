@@ -1,27 +1,51 @@
 import os
 import sys
 import json
+from typing import TYPE_CHECKING
 HERE = os.path.abspath(os.path.dirname(__file__))
 from opentrons import config  # noqa(E402)
-from opentrons.data_storage import database_migration  # noqa(E402)
-
-if os.environ.get('OT_UPDATE_SERVER') != 'true'\
-   and not config.feature_flags.use_protocol_api_v2():
-    database_migration.check_version_and_perform_full_migration()
-elif not config.feature_flags.use_protocol_api_v2():
-    # Need to minimally build the database for CI
-    database_migration.check_version_and_perform_minimal_migrations()
-
-
-if not config.feature_flags.use_protocol_api_v2():
-    from .legacy_api.api import (robot,   # noqa(E402)
-                                 reset,
-                                 instruments,
-                                 containers,
-                                 labware,
-                                 modules)
-    names_list = [
-        'containers', 'instruments', 'robot', 'reset', 'modules', 'labware']
+from opentrons.config import feature_flags as ff  # noqa(E402)
+# The legacy and new apis import each other, and only do so successfully
+# when the labware database module is imported first, so it still is.
+# Migrating the database and building the robot are what is deferred
+from opentrons.data_storage import database_migration  # noqa(E402, F401)
+
+#: Names provided by the legacy api when API v2 is not enabled. They are
+#: only loaded (and the labware database migrated) the first time one of
+#: them is used, since that is slow and most imports of opentrons don't
+#: need them
+_LEGACY_NAMES = [
+    'containers', 'instruments', 'robot', 'reset', 'modules', 'labware']
+
+if TYPE_CHECKING:
+    from .legacy_api.api import (  # noqa(F401)
+        containers, instruments, robot, reset, modules, labware)
+
+
+def __getattr__(name):
+    """ Load the legacy api when one of its names is first used (PEP 562) """
+    if name in _LEGACY_NAMES and not ff.use_protocol_api_v2():
+        from .legacy_api import api
+        for legacy_name in _LEGACY_NAMES:
+            globals()[legacy_name] = getattr(api, legacy_name)
+        return globals()[name]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+if sys.version_info < (3, 7):
+    # Not plain "import types", which would hide the opentrons.types module
+    import types as _types
+
+    # Module __getattr__ is new in python 3.7
+    class _LazyModule(_types.ModuleType):
+        def __getattr__(self, name):
+            return __getattr__(name)
+
+    sys.modules[__name__].__class__ = _LazyModule
+
+
+if not ff.use_protocol_api_v2():
+    names_list = _LEGACY_NAMES
 else:
     names_list = []
 
@@ -15,7 +15,7 @@ from opentrons.types import Location, Point
 from opentrons.protocol_api import (ProtocolContext,
                                     labware)
 from opentrons.protocol_api.execute import run_protocol
-from opentrons.hardware_control import adapters, API
+from opentrons.hardware_control import adapters
 from .models import Container, Instrument, Module
 
 from opentrons.legacy_api.containers.placeable import (
@@ -73,6 +73,10 @@ class SessionManager(object):
             session_short_id = hex(uuid4().fields[0])
             session_logger = self._command_logger.getChild(session_short_id)
             self._broker.set_logger(session_logger)
+            # Give back the old session's simulator first, so the new one
+            # can be simulated with it
+            if self.session:
+                self.session.release()
             self.session = Session.build_and_prep(
                 name=name,
                 contents=_contents,
@@ -92,6 +96,7 @@ class SessionManager(object):
 
         if self.session:
             self._hardware.reset()
+            self.session.release()
         self.session = None
         self._broker.set_logger(self._command_logger)
 
@@ -122,10 +127,15 @@ class Session(object):
         self._hardware = hardware
         self._simulating_ctx = ProtocolContext.build_using(
             self._protocol, loop=self._loop, broker=self._broker)
+        self._simulator = None
         self.state = None
         self.commands = []
         self.command_log = {}
         self.errors = []
+        # Bumped whenever errors changes, so state updates only include
+        # errors when clients haven't seen the latest ones
+        self._errors_version = 0
+        self._published_errors_version = None
 
         self._containers = []
         self._instruments = []
@@ -180,9 +190,20 @@ class Session(object):
             for module in self._modules
         ]
 
+    def release(self):
+        """ Give back the simulator of the last simulation to the pool. The
+        objects from that simulation must not be used afterwards. """
+        # The context built with the session, before any simulation, has a
+        # simulator of its own
+        self._simulating_ctx._hw_manager.release()
+        if self._simulator is not None:
+            adapters.simulator_pool.release(self._simulator)
+            self._simulator = None
+
     def clear_logs(self):
         self.command_log.clear()
         self.errors.clear()
+        self._errors_version += 1
 
     @_motion_lock
     def _simulate(self):
@@ -228,12 +249,15 @@ class Session(object):
                     if pip:
                         instrs[mount] = {'model': pip['model'],
                                          'id': pip.get('pipette_id', '')}
-                sim = adapters.SynchronousAdapter.build(
-                    API.build_hardware_simulator,
+                # The last simulation's context is replaced, so its
+                # simulator can be reused
+                self.release()
+                sim = adapters.simulator_pool.acquire(
                     instrs,
                     [mod.name()
                      for mod in self._hardware.attached_modules.values()],
                     strict_attached_instruments=False)
+                self._simulator = sim
                 sim.home()
                 self._simulating_ctx = ProtocolContext(
                     loop=self._loop,
@@ -431,6 +455,7 @@ class Session(object):
                 'error': error
             }
         )
+        self._errors_version += 1
 
     def _reset(self):
         self._hardware.reset()
@@ -441,7 +466,9 @@ class Session(object):
             payload = copy(self)
         else:
             if self.command_log.keys():
-                idx = sorted(self.command_log.keys())[-1]
+                # log_append numbers commands consecutively from 0, so the
+                # last one is found without sorting the whole log every time
+                idx = len(self.command_log) - 1
                 timestamp = self.command_log[idx]
                 last_command = {'id': idx, 'handledAt': timestamp}
             else:
@@ -450,9 +477,13 @@ class Session(object):
             payload = {
                 'state': self.state,
                 'startTime': self.startTime,
-                'errors': self.errors,
                 'lastCommand': last_command
             }
+            # Clients keep the errors they have if they are left out, which
+            # saves sending them with every command of a long run
+            if self._errors_version != self._published_errors_version:
+                payload['errors'] = self.errors
+        self._published_errors_version = self._errors_version
         return {
             'topic': Session.TOPIC,
             'payload': payload
@@ -51,6 +51,9 @@ class Broker:
 
         return unsubscribe
 
+    def has_subscribers(self, topic):
+        return bool(self.subscriptions.get(topic))
+
     def publish(self, topic, message):
         [handler(message) for handler in self.subscriptions.get(topic, [])]
 
@@ -4,7 +4,10 @@ from opentrons.broker import Broker
 
 import functools
 import inspect
-from typing import Union, Sequence, List, Any
+import logging
+import weakref
+from typing import (Union, Sequence, List, Any, Iterable, Sized, Callable,
+                    Dict, NamedTuple, Tuple)
 
 from opentrons.legacy_api.containers import (Well as OldWell,
                                              Container as OldContainer,
@@ -15,13 +18,26 @@ from opentrons.types import Location
 from opentrons.drivers import utils
 
 
+def is_lazy_loc(location: Any) -> bool:
+    """ Whether ``location`` is an iterable of locations without a length,
+    like a generator, which can only be looked through once (by whatever is
+    using the locations, so commands must not iterate it themselves)
+    """
+    return isinstance(location, Iterable)\
+        and not isinstance(location, (Sized, str))
+
+
 def is_new_loc(location: Union[Location, Well, None,
                                OldWell, OldContainer,
                                OldSlot, Sequence]) -> bool:
-    return isinstance(listify(location)[0], (Location, Well))
+    # Only the new protocol api accepts lazy iterables of locations
+    return is_lazy_loc(location)\
+        or isinstance(listify(location)[0], (Location, Well))
 
 
 def listify(location: Any) -> List:
+    if is_lazy_loc(location):
+        return []
     if isinstance(location, list):
         try:
             return listify(location[0])
@@ -91,6 +107,10 @@ def _stringify_legacy_loc(loc: Union[OldWell, OldContainer,
 def stringify_location(location: Union[Location, None,
                                        OldWell, OldContainer,
                                        OldSlot, Sequence]) -> str:
+    if is_lazy_loc(location):
+        # Describing the iterable itself would mean consuming it, and its
+        # repr (an address) means nothing to the user
+        return 'each location in the lazy plan'
     if is_new_loc(location):
         loc_str_list = [_stringify_new_loc(loc)
                         for loc in listify(location)]
@@ -521,28 +541,73 @@ def resume():
     )
 
 
+class _ArgSpec(NamedTuple):
+    """ The parts of a function's signature needed to bind a call to it """
+    args: Tuple[str, ...]
+    defaults: Dict[str, Any]
+
+
+_arg_specs: 'weakref.WeakKeyDictionary[Callable, _ArgSpec]'\
+    = weakref.WeakKeyDictionary()
+
+
+def _arg_spec(f: Callable) -> _ArgSpec:
+    """ Get (and remember) the argument names and defaults of ``f``.
+
+    Bound methods share the spec of their function, which (like
+    :py:func:`inspect.getfullargspec`) still includes ``self``.
+    """
+    func = getattr(f, '__func__', f)
+    try:
+        return _arg_specs[func]
+    except (KeyError, TypeError):
+        pass
+    spec = inspect.getfullargspec(func)
+    args = tuple(spec.args)
+    defaults = dict(zip(reversed(args), reversed(spec.defaults or ())))
+    res = _ArgSpec(args, defaults)
+    try:
+        _arg_specs[func] = res
+    except TypeError:
+        # Not weak-referenceable (like a builtin); just don't cache it
+        pass
+    return res
+
+
+def _should_publish(broker) -> bool:
+    return broker.has_subscribers(command_types.COMMAND)
+
+
+def _should_log(broker, when) -> bool:
+    return when == 'before' and broker.logger.isEnabledFor(logging.INFO)
+
+
 def do_publish(broker, cmd, f, when, res, meta, *args, **kwargs):
     """ Implement the publish so it can be called outside the decorator """
-    publish_command = functools.partial(
-        broker.publish,
-        topic=command_types.COMMAND)
-    call_args = _get_args(f, args, kwargs)
-    if when == 'before':
+    publishing = _should_publish(broker)
+    if not publishing and not _should_log(broker, when):
+        return
+    _do_publish(broker, cmd, _arg_spec(cmd), f, _arg_spec(f),
+                when, meta, publishing, args, kwargs)
+
+
+def _do_publish(broker, cmd, cmd_spec: _ArgSpec, f, f_spec: _ArgSpec,
+                when, meta, publishing: bool, args, kwargs):
+    call_args = _bind_args(f_spec, args, kwargs)
+    if _should_log(broker, when):
         broker.logger.info("{}: {}".format(
             f.__qualname__,
             {k: v for k, v in call_args.items() if str(k) != 'self'}))
-    command_args = dict(
-        zip(
-            reversed(inspect.getfullargspec(cmd).args),
-            reversed(inspect.getfullargspec(cmd).defaults
-                     or [])))
+    if not publishing:
+        return
+    command_args = dict(cmd_spec.defaults)
 
     # TODO (artyom, 20170927): we are doing this to be able to use
     # the decorator in Instrument class methods, in which case
     # self is effectively an instrument.
     # To narrow the scope of this hack, we are checking if the
     # command is expecting instrument first.
-    if 'instrument' in inspect.getfullargspec(cmd).args:
+    if 'instrument' in cmd_spec.args:
         # We are also checking if call arguments have 'self' and
         # don't have instruments specified, in which case
         # instruments should take precedence.
@@ -551,9 +616,8 @@ def do_publish(broker, cmd, f, when, res, meta, *args, **kwargs):
 
     command_args.update({
         key: call_args[key]
-        for key in
-        (set(inspect.getfullargspec(cmd).args)
-         & call_args.keys())
+        for key in cmd_spec.args
+        if key in call_args
     })
 
     if meta:
@@ -561,15 +625,17 @@ def do_publish(broker, cmd, f, when, res, meta, *args, **kwargs):
 
     payload = cmd(**command_args)
 
-    message = {**payload, '$': when}
-    if when == 'after':
-        message['return'] = res
-    publish_command(
-        message={**payload, '$': when})
+    broker.publish(
+        topic=command_types.COMMAND, message={**payload, '$': when})
 
 
 def _publish_dec(before, after, command, meta=None):
     def decorator(f):
+        # Work out how to bind calls to the command once here rather than
+        # on every call
+        cmd_spec = _arg_spec(command)
+        f_spec = _arg_spec(f)
+
         @functools.wraps(f, updated=functools.WRAPPER_UPDATES+('__globals__',))
         def decorated(*args, **kwargs):
             try:
@@ -577,13 +643,16 @@ def _publish_dec(before, after, command, meta=None):
             except AttributeError:
                 raise RuntimeError("Only methods of CommandPublisher \
                     classes should be decorated.")
-            if before:
-                do_publish(
-                    broker, command, f, 'before', None, meta, *args, **kwargs)
+            # Decide once per call so that subscribers always see both
+            # halves of a command or neither
+            publishing = _should_publish(broker)
+            if before and (publishing or _should_log(broker, 'before')):
+                _do_publish(broker, command, cmd_spec, f, f_spec, 'before',
+                            meta, publishing, args, kwargs)
             res = f(*args, **kwargs)
-            if after:
-                do_publish(
-                    broker, command, f, 'after', res, meta, *args, **kwargs)
+            if after and publishing:
+                _do_publish(broker, command, cmd_spec, f, f_spec, 'after',
+                            meta, publishing, args, kwargs)
             return res
         return decorated
 
@@ -609,17 +678,15 @@ class publish:
 
 
 def _get_args(f, args, kwargs):
-    # Create the initial dictionary with args that have defaults
-    res = {}
+    return _bind_args(_arg_spec(f), args, kwargs)
+
 
-    if inspect.getfullargspec(f).defaults:
-        res = dict(
-            zip(
-                reversed(inspect.getfullargspec(f).args),
-                reversed(inspect.getfullargspec(f).defaults)))
+def _bind_args(spec: _ArgSpec, args, kwargs) -> Dict[str, Any]:
+    # Start with the args that have defaults
+    res = dict(spec.defaults)
 
     # Update / insert values for positional args
-    res.update(dict(zip(inspect.getfullargspec(f).args, args)))
+    res.update(zip(spec.args, args))
 
     # Update it with values for named args
     res.update(kwargs)
@@ -1,3 +1,13 @@
+class CommandTree(list):
+    """ The command tree built by :py:func:`from_list`.
+
+    It is never modified once built, so it is marked static for
+    serialization (see :py:class:`opentrons.server.serialize.SubtreeCache`).
+    """
+    __slots__ = ('__weakref__',)
+    _serialize_static = True
+
+
 def from_list(commands):
     """
     Given a list of tuples of form (depth, text)
@@ -30,4 +40,4 @@ def from_list(commands):
             for key, subtree in subtrees(commands, level)
         ]
 
-    return walk(commands)
+    return CommandTree(walk(commands))
@@ -2,6 +2,7 @@ import json
 import logging
 import os
 import sys
+import threading
 from typing import Any, Dict, Mapping, Tuple, Union, Optional, TYPE_CHECKING
 
 from opentrons.config import CONFIG, ARCHITECTURE, SystemArchitecture
@@ -11,9 +12,19 @@ if TYPE_CHECKING:
 
 SettingsMap = Dict[str, Optional[bool]]
 SettingsData = Tuple[SettingsMap, int]
+#: Enough of a file's stat result to tell whether it changed
+FileStamp = Tuple[int, int, int]
 
 log = logging.getLogger(__name__)
 
+# The settings as last read from or written to disk, along with the path and
+# stamp of the file they came from. Settings are read often (feature flags
+# are checked all over), so they are only read from disk again when the file
+# has changed
+_cache_lock = threading.RLock()
+_cache: Optional[Tuple[str, FileStamp, SettingsData]] = None
+_disk_reads = 0
+
 
 class Setting:
     def __init__(self, _id: str, title: str, description: str,
@@ -94,6 +105,15 @@ settings = [
                     'you are a developer or testing; it is not yet feature '
                     'complete.',
         show_if=('useProtocolApi2', True)
+    ),
+    Setting(
+        _id='enableSmoothieStreaming',
+        title='Stream motion commands to the motor controller',
+        description='Queue several moves at a time on the motor controller '
+                    'instead of waiting for each one to finish before '
+                    'sending the next, which shortens protocol run times. '
+                    'A restart of the robot is required.',
+        restart_required=True
     )
 ]
 
@@ -110,11 +130,12 @@ settings_by_id = {s.id: s for s in settings}
 settings_by_old_id = {s.old_id: s for s in settings}
 
 
-# TODO: LRU cache?
 def get_adv_setting(setting: str) -> Optional[bool]:
     setting = _clean_id(setting)
-    s = get_all_adv_settings()
-    return s[setting]['value']  # type: ignore
+    if setting not in settings_by_id:
+        raise KeyError(setting)
+    values, _ = _read_settings_file(CONFIG['feature_flags_file'])
+    return values[setting]
 
 
 def get_all_adv_settings() -> Dict[str, Dict[str, Union[str, bool, None]]]:
@@ -137,9 +158,34 @@ def get_all_adv_settings() -> Dict[str, Dict[str, Union[str, bool, None]]]:
 def set_adv_setting(_id: str, value: Optional[bool]):
     _id = _clean_id(_id)
     settings_file = CONFIG['feature_flags_file']
-    settings, version = _read_settings_file(settings_file)
-    settings[_id] = value
-    _write_settings_file(settings, version, settings_file)
+    with _cache_lock:
+        settings, version = _read_settings_file(settings_file)
+        settings[_id] = value
+        _write_settings_file(settings, version, settings_file)
+
+
+def disk_reads() -> int:
+    """ How many times the settings file has been read from disk (rather
+    than from memory) by this process """
+    return _disk_reads
+
+
+def _file_stamp(path: Union[str, 'Path']) -> Optional[FileStamp]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _remember(settings_file: Union[str, 'Path'], data: SettingsData):
+    global _cache
+    stamp = _file_stamp(settings_file)
+    if stamp is None:
+        _cache = None
+    else:
+        settings, version = data
+        _cache = (str(settings_file), stamp, (dict(settings), version))
 
 
 def _clean_id(_id: str) -> str:
@@ -168,17 +214,30 @@ def _read_settings_file(settings_file: 'Path') -> SettingsData:
     key. If the key is one of the old IDs (kebab case), replace it with the
     new ID and rewrite the settings file
 
+    The file is only read from disk if it has changed since it was last read
+    or written.
+
     :param settings_file: the path to the settings file
     :return: a dict with all new settings IDs as the keys, and boolean values
         (the values stored in the settings file, or `False` if the key was not
         found).
     """
-    # Read settings from persistent file
-    data = _read_json_file(settings_file)
-    settings, version = _migrate(data)
-
-    if (data.get('_version') != version):
-        _write_settings_file(settings, version, settings_file)
+    global _disk_reads
+    with _cache_lock:
+        if _cache and _cache[0] == str(settings_file)\
+                and _cache[1] == _file_stamp(settings_file):
+            settings, version = _cache[2]
+            return dict(settings), version
+
+        # Read settings from persistent file
+        _disk_reads += 1
+        data = _read_json_file(settings_file)
+        settings, version = _migrate(data)
+
+        if (data.get('_version') != version):
+            _write_settings_file(settings, version, settings_file)
+        else:
+            _remember(settings_file, (settings, version))
 
     return settings, version
 
@@ -186,14 +245,19 @@ def _read_settings_file(settings_file: 'Path') -> SettingsData:
 def _write_settings_file(data: Mapping[str, Any],
                          version: int,
                          settings_file: 'Path'):
-    try:
-        with settings_file.open('w') as fd:
-            json.dump({**data, '_version': version}, fd)
-            fd.flush()
-            os.fsync(fd.fileno())
-    except OSError:
-        log.exception(
-            f'Failed to write advanced settings file to {settings_file}')
+    global _cache
+    with _cache_lock:
+        try:
+            with settings_file.open('w') as fd:
+                json.dump({**data, '_version': version}, fd)
+                fd.flush()
+                os.fsync(fd.fileno())
+        except OSError:
+            log.exception(
+                f'Failed to write advanced settings file to {settings_file}')
+            _cache = None
+        else:
+            _remember(settings_file, (dict(data), version))
 
 
 def _migrate0to1(previous: Mapping[str, Any]) -> SettingsMap:
@@ -237,7 +301,17 @@ def _migrate2to3(previous: SettingsMap) -> SettingsMap:
     return newmap
 
 
-_MIGRATIONS = [_migrate0to1, _migrate1to2, _migrate2to3]
+def _migrate3to4(previous: SettingsMap) -> SettingsMap:
+    """
+    Migration to version 4 of the feature flags file. Adds the
+    enableSmoothieStreaming config element.
+    """
+    newmap = {k: v for k, v in previous.items()}
+    newmap['enableSmoothieStreaming'] = None
+    return newmap
+
+
+_MIGRATIONS = [_migrate0to1, _migrate1to2, _migrate2to3, _migrate3to4]
 """
 List of all migrations to apply, indexed by (version - 1). See _migrate below
 for how the migration functions are applied. Each migration function should
@@ -27,3 +27,7 @@ def use_old_aspiration_functions():
 
 def enable_back_compat():
     return advs.get_setting_with_env_overload('enableApi1BackCompat')
+
+
+def enable_smoothie_streaming():
+    return advs.get_setting_with_env_overload('enableSmoothieStreaming')
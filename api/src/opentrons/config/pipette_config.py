@@ -6,6 +6,7 @@ from typing import Any, Dict, List, Union, Tuple, Sequence, Optional
 import pkgutil
 
 from opentrons.config import feature_flags as ff, CONFIG
+from opentrons.util.definitions import DefinitionCache, freeze
 
 
 log = logging.getLogger(__name__)
@@ -67,6 +68,9 @@ Z_OFFSET_P50 = 0
 Z_OFFSET_P300 = 0
 Z_OFFSET_P1000 = 20  # shortest single-channel pipette
 
+#: Pipette configs loaded so far, shared by everything that loads them
+config_cache = DefinitionCache()
+
 
 def model_config() -> Dict[str, Any]:
     """ Load the per-pipette-model config file from within the wheel """
@@ -78,12 +82,15 @@ def model_config() -> Dict[str, Any]:
 
 
 def name_config() -> Dict[str, Any]:
-    """ Load the per-pipette-name config file from within the wheel """
-    return json.loads(
-        pkgutil.get_data(
-            'opentrons',
-            'shared_data/pipette/definitions/pipetteNameSpecs.json')
-        or '{}')
+    """ Load the per-pipette-name config file from within the wheel. This is
+    only read once, and what it returns is frozen """
+    return config_cache.get(
+        'pipetteNameSpecs',
+        lambda: json.loads(
+            pkgutil.get_data(
+                'opentrons',
+                'shared_data/pipette/definitions/pipetteNameSpecs.json')
+            or '{}'))
 
 
 config_models = list(model_config()['config'].keys())
@@ -112,8 +119,10 @@ def load(pipette_model: str, pipette_id: str = None) -> pipette_config:
     - any config overrides found in
       ``opentrons.config.CONFIG['pipette_config_overrides_dir']``
 
-    This function reads from disk each time, so changes to the overrides
-    will be picked up in subsequent calls.
+    Loaded configs are cached, but the overrides file is checked each time,
+    so changes to the overrides will be picked up in subsequent calls. The
+    config returned is shared and frozen (see
+    :py:mod:`opentrons.util.definitions`).
 
     :param str pipette_model: The pipette model name (i.e. "p10_single_v1.3")
                               for which to load configuration
@@ -130,7 +139,21 @@ def load(pipette_model: str, pipette_id: str = None) -> pipette_config:
 
     :returns pipette_config: The configuration, loaded and checked
     """
-
+    override_dir = CONFIG['pipette_config_overrides_dir']
+    old_functions = ff.use_old_aspiration_functions()
+    watch = [override_dir/f'{pipette_id}.json'] if pipette_id else []
+    if pipette_id and not watch[0].exists():
+        # Loading saves default overrides for a new pipette, which would
+        # make the cached config stale straight away, so don't cache it
+        return freeze(_load(pipette_model, pipette_id, old_functions))
+    return config_cache.get(
+        (pipette_model, pipette_id, override_dir, old_functions),
+        lambda: _load(pipette_model, pipette_id, old_functions),
+        watch)
+
+
+def _load(pipette_model: str, pipette_id: Optional[str],
+          old_functions: bool) -> pipette_config:
     # Load the model config and update with the name config
     cfg = copy.deepcopy(configs[pipette_model])
     cfg.update(copy.deepcopy(name_config()[cfg['name']]))
@@ -157,7 +180,7 @@ def load(pipette_model: str, pipette_id: str = None) -> pipette_config:
     # and last elements are the same, which is fine). If we add more in the
     # future, we’ll have to change this code to select items more
     # intelligently
-    if ff.use_old_aspiration_functions():
+    if old_functions:
         log.info("Using old aspiration functions")
         ul_per_mm = cfg['ulPerMm'][0]
     else:
@@ -259,6 +282,8 @@ def save_overrides(
     assert model in config_models
     existing['model'] = model
     json.dump(existing, (override_dir/f'{pipette_id}.json').open('w'))
+    # Changing the model's configs affects pipettes without overrides too
+    config_cache.clear()
 
 
 def change_quirks(override_quirks, existing, model_configs):
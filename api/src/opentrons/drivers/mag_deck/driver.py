@@ -2,10 +2,10 @@ from os import environ
 import logging
 from threading import Event
 from time import sleep
-from typing import Optional
+from typing import Any, Dict, Optional
 from serial.serialutil import SerialException  # type: ignore
 
-from opentrons.drivers import serial_communication
+from opentrons.drivers import serial_reactor
 from opentrons.drivers.serial_communication import SerialNoResponse
 
 '''
@@ -192,6 +192,17 @@ class MagDeck:
             return ''
         return self._connection.port
 
+    @property
+    def poll_rate(self) -> Optional[serial_reactor.PollRate]:
+        # The mag deck only changes when it is told to, so it isn't polled
+        return None
+
+    @property
+    def serial_metrics(self) -> Dict[str, Any]:
+        if not self._connection:
+            return {}
+        return self._connection.metrics
+
     def home(self) -> str:
         '''
         Homes the magnet
@@ -288,23 +299,11 @@ class MagDeck:
         return ''
 
     def _recursive_write_and_return(self, cmd, timeout, retries):
-        try:
-            return serial_communication.write_and_return(
-                cmd,
-                MAG_DECK_ACK,
-                self._connection,
-                timeout,
-                tag=f'magdeck {id(self)}')
-        except SerialNoResponse as e:
-            retries -= 1
-            if retries <= 0:
-                raise e
-            sleep(DEFAULT_STABILIZE_DELAY)
-            if self._connection:
-                self._connection.close()
-                self._connection.open()
-            return self._recursive_write_and_return(
-                cmd, timeout, retries)
+        if not self._connection:
+            raise SerialException('Mag-Deck is not connected')
+        # The reactor retries, reopening the port, if there is no response
+        return self._connection.send(
+            cmd, MAG_DECK_ACK, timeout, retries=retries)
 
     def _wait_for_ack(self):
         '''
@@ -331,10 +330,11 @@ class MagDeck:
     def _connect_to_port(self, port=None):
         try:
             mag_deck = environ.get('OT_MAG_DECK_ID')
-            self._connection = serial_communication.connect(
+            self._connection = serial_reactor.connect(
                 device_name=mag_deck,
                 port=port,
-                baudrate=MAG_DECK_BAUDRATE
+                baudrate=MAG_DECK_BAUDRATE,
+                tag=f'magdeck {id(self)}'
             )
         except SerialException:
             # if another process is using the port, pyserial raises an
@@ -103,6 +103,39 @@ def _attempt_command_recovery(command, ack, serial_conn, tag=None):
     return response
 
 
+def write(command, serial_connection, tag=None):
+    '''Write a command without clearing the input buffer or waiting for
+    its response, for callers that keep several commands in flight and
+    collect their acks later with read_response()'''
+    if not tag:
+        tag = serial_connection.port
+    encoded_write = command.encode()
+    log.debug(f'{tag}: Write -> {encoded_write}')
+    serial_connection.write(encoded_write)
+
+
+def read_response(
+        ack, serial_connection,
+        timeout=DEFAULT_WRITE_TIMEOUT, tag=None):
+    '''Read the response to a previously written command, up to and
+    including its ack, and return the parsed response'''
+    if not tag:
+        tag = serial_connection.port
+    encoded_ack = ack.encode()
+    with serial_with_temp_timeout(
+            serial_connection, timeout) as device_connection:
+        response = device_connection.read_until(encoded_ack)
+    log.debug(f'{tag}: Read <- {response}')
+    if encoded_ack not in response:
+        raise SerialNoResponse(
+            'No response from serial port after {} second(s)'.format(
+                timeout))
+    clean_response = _parse_serial_response(response, encoded_ack)
+    if clean_response:
+        return clean_response.decode()
+    return ''
+
+
 def write_and_return(
         command, ack, serial_connection,
         timeout=DEFAULT_WRITE_TIMEOUT, tag=None):
@@ -0,0 +1,477 @@
+""" One thread for the serial communication of every attached module.
+
+Each connection to a module is a :py:class:`SerialChannel`. The channel's
+port is read without blocking from the event loop of the
+:py:class:`SerialReactor`, which runs in a single thread however many modules
+are attached. Commands to a module go through the channel's queue one at a
+time, with commands from callers sent before status polls.
+
+Polls run at a :py:class:`PollRate`, which drivers speed up while their
+module's state is changing and let back off while it is steady, and every
+poll of a channel is sent again as soon as a command to it completes.
+"""
+import asyncio
+import concurrent.futures
+import contextlib
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import serial  # type: ignore
+from serial.serialutil import SerialException  # type: ignore
+
+from opentrons.drivers.serial_communication import (
+    SerialNoResponse, get_ports_by_name, _parse_serial_response)
+
+log = logging.getLogger(__name__)
+
+#: Priority of commands sent by drivers on behalf of their callers
+COMMAND_PRIORITY = 0
+#: Priority of status polls, which wait for queued commands to be sent
+POLL_PRIORITY = 10
+
+DEFAULT_STABILIZE_DELAY = 0.1
+
+#: How much longer each poll of a steady module waits than the last
+DEFAULT_BACKOFF = 2.0
+#: How many times the fastest interval a steady module is polled at, at most
+DEFAULT_MAX_BACKOFF = 16
+
+_QueuedCommand = Tuple[int, int, str, str, float, int,
+                       concurrent.futures.Future]
+_Unsolicited = Tuple[bytes, Callable[[bytes], Any]]
+
+
+class SerialReactor:
+    """ Runs an event loop in a thread, started the first time a channel is
+    opened, that does the serial communication of all channels """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if not self._thread or not self._thread.is_alive():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run, args=(self._loop,),
+                    name='Module serial reactor', daemon=True)
+                self._thread.start()
+            assert self._loop
+            return self._loop
+
+    @staticmethod
+    def _run(loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    @property
+    def in_reactor_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def run(self, coro) -> concurrent.futures.Future:
+        """ Schedule a coroutine on the reactor from any thread """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def open(self, port: str, baudrate: int,
+             tag: str = None) -> 'SerialChannel':
+        """ Open a port and return the channel that communicates with it """
+        return SerialChannel(self, port, baudrate, tag)
+
+
+#: The reactor used by the module drivers
+reactor = SerialReactor()
+
+
+class PollRate:
+    """ How often to poll a module.
+
+    Polls run at the fastest interval while the driver reports the module's
+    state as :py:meth:`changing` or while anyone is :py:meth:`watch` ing it,
+    and each poll that finds it :py:meth:`steady` waits ``backoff`` times
+    longer than the last, up to the slowest interval.
+    """
+
+    def __init__(self, fastest: float, slowest: float = None,
+                 backoff: float = DEFAULT_BACKOFF) -> None:
+        self._fastest = fastest
+        self._slowest = max(
+            fastest * DEFAULT_MAX_BACKOFF if slowest is None else slowest,
+            fastest)
+        self._backoff = backoff
+        self._interval = fastest
+        self._watchers = 0
+        self._lock = threading.Lock()
+        self._wakers: List[Callable[[], Any]] = []
+
+    @property
+    def interval(self) -> float:
+        """ How long, in seconds, the next poll waits """
+        if self._watchers:
+            return self._fastest
+        return self._interval
+
+    def changing(self):
+        """ The module's state is changing, so poll as often as possible """
+        slowed = self._interval > self._fastest
+        self._interval = self._fastest
+        if slowed:
+            self._wake()
+
+    def steady(self):
+        """ The module's state is settled, so poll less often """
+        self._interval = min(self._interval * self._backoff, self._slowest)
+
+    @contextlib.contextmanager
+    def watch(self):
+        """ Poll as often as possible for as long as the context is entered,
+        for instance while a client streams the module's data """
+        with self._lock:
+            self._watchers += 1
+        self._wake()
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._watchers -= 1
+
+    def add_waker(self, waker: Callable[[], Any]):
+        """ Call ``waker`` whenever polls waiting for a slower interval
+        should be sent now """
+        with self._lock:
+            self._wakers.append(waker)
+
+    def remove_waker(self, waker: Callable[[], Any]):
+        with self._lock:
+            self._wakers.remove(waker)
+
+    def _wake(self):
+        with self._lock:
+            wakers = list(self._wakers)
+        for waker in wakers:
+            waker()
+
+
+class SerialChannel:
+    """ The connection to one module, with its own queue of commands.
+
+    Commands can be sent from any thread except the reactor's own, either
+    blocking with :py:meth:`send` or from another event loop with
+    :py:meth:`send_async`.
+    """
+
+    def __init__(self, reactor: SerialReactor,
+                 port: str, baudrate: int, tag: str = None) -> None:
+        self._reactor = reactor
+        self._tag = tag or port
+        self._connection = serial.Serial(
+            port=port, baudrate=baudrate, timeout=0)
+        if not hasattr(self._connection, 'fileno'):
+            self._connection.close()
+            raise SerialException(
+                f'Cannot watch serial port {port} on this platform')
+        self._buffer = bytearray()
+        self._queue: List[_QueuedCommand] = []
+        self._order = itertools.count()
+        self._in_flight = False
+        self._closed = False
+        self._unsolicited: Optional[_Unsolicited] = None
+        self._polls: List[concurrent.futures.Future] = []
+        self._poll_rates: List[PollRate] = []
+        self._poll_wakeups: List[asyncio.Event] = []
+        self._opened_at = time.monotonic()
+        self._busy_time = 0.0
+        self._commands_sent = 0
+        self._polls_sent = 0
+        self._reactor.run(self._start()).result()
+
+    async def _start(self):
+        self._loop = asyncio.get_event_loop()
+        self._pending = asyncio.Event()
+        self._received = asyncio.Event()
+        self._loop.add_reader(self._connection.fileno(), self._on_readable)
+        self._worker = self._loop.create_task(self._work())
+
+    @property
+    def port(self) -> str:
+        return self._connection.port
+
+    @property
+    def is_open(self) -> bool:
+        return not self._closed and self._connection.is_open
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """ How busy the channel has been since it was opened: how many
+        commands and polls it has sent, the fraction of the time a response
+        was awaited, and the interval of each of its polls """
+        elapsed = time.monotonic() - self._opened_at
+        return {
+            'commandsSent': self._commands_sent,
+            'pollsSent': self._polls_sent,
+            'utilization': self._busy_time / elapsed if elapsed else 0.0,
+            'pollIntervals': [rate.interval for rate in self._poll_rates]
+        }
+
+    def submit(self, command: str, ack: str, timeout: float,
+               retries: int = 1,
+               priority: int = COMMAND_PRIORITY) -> concurrent.futures.Future:
+        """ Queue a command, returning a future for its parsed response.
+
+        :param command: The full command line to write
+        :param ack: What the response ends with
+        :param timeout: How long, in seconds, to wait for each attempt's
+                        response
+        :param retries: How many attempts to make, reopening the port
+                        between them, before failing with
+                        :py:class:`.SerialNoResponse`
+        :param priority: Commands with a lower value are sent first
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        if self._closed:
+            future.set_exception(
+                SerialException(f'{self._tag}: connection closed'))
+            return future
+        entry = (priority, next(self._order),
+                 command, ack, timeout, retries, future)
+        self._loop.call_soon_threadsafe(self._enqueue, entry)
+        return future
+
+    def send(self, command: str, ack: str, timeout: float,
+             retries: int = 1, priority: int = COMMAND_PRIORITY) -> str:
+        """ Send a command and wait for its response. See :py:meth:`submit`
+        """
+        if self._reactor.in_reactor_thread:
+            raise RuntimeError('Cannot wait for a response in the reactor')
+        return self.submit(command, ack, timeout, retries, priority).result()
+
+    async def send_async(self, command: str, ack: str, timeout: float,
+                         retries: int = 1,
+                         priority: int = COMMAND_PRIORITY) -> str:
+        """ Send a command and wait for its response without blocking the
+        calling event loop. See :py:meth:`submit` """
+        return await asyncio.wrap_future(
+            self.submit(command, ack, timeout, retries, priority))
+
+    def poll(self, command: str, ack: str, timeout: float,
+             rate: Union[float, PollRate],
+             callback: Callable[[str], Any],
+             priority: int = POLL_PRIORITY) -> concurrent.futures.Future:
+        """ Send a command repeatedly until cancelled, and call ``callback``
+        with each response from the reactor's thread.
+
+        :param rate: How often to send the command: a fixed interval in
+                     seconds, or a :py:class:`PollRate` the callback can
+                     speed up or slow down. Either way the command is sent
+                     again as soon as any command sent by :py:meth:`submit`
+                     completes.
+
+        Cancel the returned future to stop polling.
+        """
+        if not isinstance(rate, PollRate):
+            rate = PollRate(rate, rate)
+        poll = self._reactor.run(self._poll(
+            command, ack, timeout, rate, callback, priority))
+        self._polls.append(poll)
+        return poll
+
+    def on_unsolicited(self, terminator: str,
+                       callback: Callable[[bytes], Any]):
+        """ Call ``callback`` from the reactor's thread with each line, up to
+        and including ``terminator``, that the module sends while no command
+        is waiting for a response """
+        self._unsolicited = (terminator.encode(), callback)
+
+    def close(self):
+        """ Stop polling, fail the queued commands and close the port """
+        if self._closed:
+            return
+        self._closed = True
+        for poll in self._polls:
+            poll.cancel()
+        stopped = self._reactor.run(self._stop())
+        if not self._reactor.in_reactor_thread:
+            stopped.result()
+
+    async def _stop(self):
+        self._worker.cancel()
+        while self._queue:
+            future = heapq.heappop(self._queue)[-1]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(
+                    SerialException(f'{self._tag}: connection closed'))
+        self._loop.remove_reader(self._connection.fileno())
+        self._connection.close()
+
+    def _enqueue(self, entry: _QueuedCommand):
+        heapq.heappush(self._queue, entry)
+        self._pending.set()
+
+    async def _work(self):
+        while True:
+            await self._pending.wait()
+            priority, _, command, ack, timeout, retries, future\
+                = heapq.heappop(self._queue)
+            if not self._queue:
+                self._pending.clear()
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = time.monotonic()
+            try:
+                response = await self._exchange(command, ack, timeout, retries)
+            except asyncio.CancelledError:
+                future.set_exception(
+                    SerialException(f'{self._tag}: connection closed'))
+                raise
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(response)
+            finally:
+                self._busy_time += time.monotonic() - started
+            if priority < POLL_PRIORITY:
+                self._commands_sent += 1
+                # Whatever the command changed should be seen right away
+                for wakeup in self._poll_wakeups:
+                    wakeup.set()
+            else:
+                self._polls_sent += 1
+
+    async def _exchange(self, command: str, ack: str,
+                        timeout: float, retries: int) -> str:
+        encoded_write = command.encode()
+        encoded_ack = ack.encode()
+        for attempt in range(max(retries, 1)):
+            if attempt:
+                await asyncio.sleep(DEFAULT_STABILIZE_DELAY)
+                self._reopen()
+            self._connection.reset_input_buffer()
+            self._buffer.clear()
+            log.debug(f'{self._tag}: Write -> {encoded_write!r}')
+            self._in_flight = True
+            try:
+                self._connection.write(encoded_write)
+                response = await asyncio.wait_for(
+                    self._read_until(encoded_ack), timeout)
+            except asyncio.TimeoutError:
+                log.debug(f'{self._tag}: Read <- {bytes(self._buffer)!r}')
+                continue
+            finally:
+                self._in_flight = False
+            log.debug(f'{self._tag}: Read <- {response!r}')
+            # Anything after the response was sent on the module's own
+            # accord, and would be cleared by the next command
+            self._dispatch_unsolicited()
+            clean_response = _parse_serial_response(response, encoded_ack)
+            if clean_response:
+                return clean_response.decode()
+            return ''
+        raise SerialNoResponse(
+            'No response from serial port after {} second(s)'.format(
+                timeout))
+
+    async def _read_until(self, ack: bytes) -> bytes:
+        while ack not in self._buffer:
+            self._received.clear()
+            await self._received.wait()
+        end = self._buffer.index(ack) + len(ack)
+        response = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return response
+
+    def _on_readable(self):
+        try:
+            data = self._connection.read(self._connection.in_waiting or 1)
+        except SerialException as e:
+            # The module has most likely been unplugged. Stop reading until
+            # a command reopens the port
+            log.warning(f'{self._tag}: {e}')
+            self._loop.remove_reader(self._connection.fileno())
+            return
+        self._buffer.extend(data)
+        self._received.set()
+        if not self._in_flight:
+            self._dispatch_unsolicited()
+
+    def _dispatch_unsolicited(self):
+        if not self._unsolicited:
+            self._buffer.clear()
+            return
+        terminator, callback = self._unsolicited
+        while terminator in self._buffer:
+            end = self._buffer.index(terminator) + len(terminator)
+            line = bytes(self._buffer[:end])
+            del self._buffer[:end]
+            log.debug(f'{self._tag}: Unsolicited <- {line}')
+            try:
+                callback(line)
+            except Exception:
+                log.exception(f'{self._tag}: unsolicited message callback')
+
+    def _reopen(self):
+        try:
+            self._loop.remove_reader(self._connection.fileno())
+        except (ValueError, OSError):
+            pass
+        self._connection.close()
+        self._connection.open()
+        self._loop.add_reader(self._connection.fileno(), self._on_readable)
+
+    async def _poll(self, command: str, ack: str, timeout: float,
+                    rate: PollRate, callback: Callable[[str], Any],
+                    priority: int):
+        wakeup = asyncio.Event()
+
+        def wake():
+            self._loop.call_soon_threadsafe(wakeup.set)
+
+        self._poll_wakeups.append(wakeup)
+        self._poll_rates.append(rate)
+        rate.add_waker(wake)
+        try:
+            while True:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), rate.interval)
+                wakeup.clear()
+                await self._poll_once(command, ack, timeout,
+                                      callback, priority)
+        finally:
+            self._poll_wakeups.remove(wakeup)
+            self._poll_rates.remove(rate)
+            rate.remove_waker(wake)
+
+    async def _poll_once(self, command: str, ack: str, timeout: float,
+                         callback: Callable[[str], Any], priority: int):
+        try:
+            response = await asyncio.wrap_future(
+                self.submit(command, ack, timeout, priority=priority))
+        except (SerialException, SerialNoResponse) as e:
+            log.debug(f'{self._tag}: poll of {command.strip()}: {e}')
+            return
+        try:
+            callback(response)
+        except Exception:
+            log.exception(f'{self._tag}: poll of {command.strip()}')
+
+
+def connect(device_name: str = None, port: str = None,
+            baudrate: int = 115200, tag: str = None) -> SerialChannel:
+    """ Open a channel on the module reactor.
+
+    :param device_name: If ``port`` is not given, the name of the device to
+                        connect to
+    :param port: The port to connect to
+    :param baudrate: integer frequency for serial communication
+    """
+    if not port:
+        port = get_ports_by_name(device_name=device_name)[0]
+    if not port:
+        raise SerialException(f'No port found for {device_name}')
+    log.debug("Device name: {}, Port: {}".format(device_name, port))
+    return reactor.open(port, baudrate, tag)
@@ -1,10 +1,11 @@
 import asyncio
 import contextlib
+from collections import deque
 from os import environ
 import logging
 from time import sleep
 from threading import Event, RLock
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, Optional, Tuple
 
 from numpy import isclose  # type: ignore
 from serial.serialutil import SerialException  # type: ignore
@@ -101,6 +102,29 @@ GCODE_ROUNDING_PRECISION = 3
 SMOOTHIE_COMMAND_TERMINATOR = '\r\n\r\n'
 SMOOTHIE_ACK = 'ok\r\nok\r\n'
 
+# In streaming mode, the maximum number of commands that may be written to
+# smoothie before we read back the ack of the oldest one
+DEFAULT_STREAMING_WINDOW = 4
+
+# In streaming mode, commands made up only of these gcodes are written
+# without a trailing M400, so they queue up in smoothie's motion planner.
+# Anything else (homing, probing, position and switch reads, pipette
+# memory access, delays, disengages, resets) is a synchronization point:
+# every streamed command is acknowledged and motion is allowed to finish
+# before it is sent.
+STREAMABLE_GCODES = (
+    GCODES['MOVE'],
+    GCODES['SET_SPEED'],
+    GCODES['PUSH_SPEED'],
+    GCODES['POP_SPEED'],
+    GCODES['SET_MAX_SPEED'],
+    GCODES['ACCELERATION'],
+    GCODES['ABSOLUTE_COORDS'],
+    GCODES['RELATIVE_COORDS'],
+    GCODES['SET_CURRENT'],
+    GCODES['DWELL']
+)
+
 
 class SmoothieError(Exception):
     def __init__(self, ret_code: str = None, command: str = None) -> None:
@@ -277,7 +301,8 @@ def _parse_homing_status_values(raw_homing_status_values):
 
 
 class SmoothieDriver_3_0_0:
-    def __init__(self, config, handle_locks=True):
+    def __init__(self, config, handle_locks=True, streaming=False,
+                 streaming_window=DEFAULT_STREAMING_WINDOW):
         self.run_flag = Event()
         self.run_flag.set()
 
@@ -344,7 +369,9 @@ class SmoothieDriver_3_0_0:
             'C': False
         })
 
-        if handle_locks:
+        # While streaming, a pause from another thread waits for motion
+        # while moves may be in flight, so the port is always locked
+        if handle_locks or streaming:
             self._serial_lock = RLock()
         else:
             class DummyLock:
@@ -357,6 +384,20 @@ class SmoothieDriver_3_0_0:
             self._serial_lock = DummyLock()
         self._is_hard_halting = Event()
 
+        # Streaming mode: commands that have been written to smoothie but
+        # whose acks have not yet been read, oldest first, along with the
+        # timeout to use when reading the ack
+        self._streaming = streaming
+        self._streaming_window = max(1, streaming_window)
+        self._in_flight: Deque[Tuple[str, float]] = deque()
+        self._streamed_current: Optional[str] = None
+        # Whether anything has been streamed since the last M400
+        self._motion_queued = False
+
+    @property
+    def streaming(self) -> bool:
+        return self._streaming
+
     @property
     def homed_position(self):
         return self._homed_position.copy()
@@ -915,7 +956,6 @@ class SmoothieDriver_3_0_0:
         self._send_command(GCODES['RESET_FROM_ERROR'])
         self.update_homed_flags()
 
-    # Potential place for command optimization (buffering, flushing, etc)
     def _send_command(
             self,
             command,
@@ -941,6 +981,11 @@ class SmoothieDriver_3_0_0:
         In this case, the message should not be logged, so the caller of this
         function should specify `supress_error_msg=True`.
 
+        In streaming mode, moves and motion settings are instead queued
+        without waiting for them to complete (see _send_command_streaming),
+        and an error reported for one of them is raised against the queued
+        command that caused it rather than the one being submitted.
+
         :param command: the GCODE to submit to the robot
         :param timeout: the time to wait before returning (indefinite wait if
             this is set to none
@@ -951,8 +996,18 @@ class SmoothieDriver_3_0_0:
             return
         try:
             with self._serial_lock:
+                if self._streaming:
+                    return self._send_command_streaming(command, timeout)
                 return self._send_command_unsynchronized(command, timeout)
+        except SmoothieAlarm:
+            self._discard_stream()
+            raise
         except SmoothieError as se:
+            # In streaming mode the error may have been reported for an
+            # earlier command whose ack we only just read; smoothie drops
+            # everything after an alarm, so forget the rest of the stream
+            failed_command = se.command or command
+            self._discard_stream()
             # XXX: This is a reentrancy error because another command could
             # swoop in here. We're already resetting though and errors (should
             # be) rare so it's probably fine, but the actual solution to this
@@ -961,13 +1016,15 @@ class SmoothieDriver_3_0_0:
             error_axis = se.ret_code.strip()[-1]
             if not suppress_error_msg:
                 log.warning(
-                        f"alarm/error: command={command}, resp={se.ret_code}")
-            if GCODES['MOVE'] in command or GCODES['PROBE'] in command:
+                    f"alarm/error: command={failed_command}, "
+                    f"resp={se.ret_code}")
+            if GCODES['MOVE'] in failed_command\
+                    or GCODES['PROBE'] in failed_command:
                 if error_axis not in 'XYZABC':
                     error_axis = AXES
                 log.info("Homing after alarm/error")
                 self.home(error_axis)
-            raise SmoothieError(se.ret_code, command)
+            raise SmoothieError(se.ret_code, failed_command)
 
     def _send_command_unsynchronized(self,
                                      command,
@@ -977,6 +1034,11 @@ class SmoothieDriver_3_0_0:
             5.0, DEFAULT_COMMAND_RETRIES)
         cmd_ret = self._remove_unwanted_characters(command, cmd_ret)
         self._handle_return(cmd_ret)
+        self._send_wait()
+        return cmd_ret.strip()
+
+    def _send_wait(self):
+        self._motion_queued = False
         wait_ret = serial_communication.write_and_return(
             GCODES['WAIT'] + SMOOTHIE_COMMAND_TERMINATOR,
             SMOOTHIE_ACK, self._connection, timeout=12000,
@@ -984,7 +1046,112 @@ class SmoothieDriver_3_0_0:
         wait_ret = self._remove_unwanted_characters(
             GCODES['WAIT'], wait_ret)
         self._handle_return(wait_ret)
-        return cmd_ret.strip()
+
+    def _send_command_streaming(self, command, timeout):
+        """
+        Streaming-mode counterpart of _send_command_unsynchronized. Moves and
+        motion settings are written without an M400 and without waiting for
+        their ack, keeping up to the streaming window of commands in flight
+        so smoothie's planner always has the next move queued. Anything else
+        is a synchronization point and waits for all queued motion to finish
+        before being sent the normal way.
+        """
+        if command == GCODES['WAIT']:
+            self._wait_for_streamed_motion()
+            return ''
+
+        if not self._is_streamable(command):
+            self._drain_stream()
+            ret = self._send_command_unsynchronized(command, timeout)
+            self._record_current(command)
+            return ret
+
+        if self._changes_current(command):
+            # smoothie applies current changes as soon as it parses them
+            # rather than in planner order, so the moves already queued
+            # (e.g. a plunger move before the pick up tip current is set)
+            # have to finish first
+            self._wait_for_streamed_motion()
+
+        while len(self._in_flight) >= self._streaming_window:
+            self._read_streamed_ack()
+
+        serial_communication.write(
+            command + SMOOTHIE_COMMAND_TERMINATOR,
+            self._connection, tag='smoothie')
+        self._in_flight.append((command, timeout))
+        self._motion_queued = True
+        self._record_current(command)
+        return ''
+
+    def _is_streamable(self, command: str) -> bool:
+        gcodes = [word for word in command.split() if word[0] in 'GM']
+        if not gcodes or gcodes[0].startswith(GCODES['DWELL']):
+            # Empty commands are used to wait for a boot ack, and bare
+            # dwells are delays whose timeout covers the whole duration
+            return False
+        return all(
+            any(gcode.startswith(allowed) for allowed in STREAMABLE_GCODES)
+            for gcode in gcodes)
+
+    @staticmethod
+    def _current_setting(command: str) -> Optional[str]:
+        if not command.startswith(GCODES['SET_CURRENT']):
+            return None
+        return command.split(GCODES['DWELL'])[0].strip()
+
+    def _changes_current(self, command: str) -> bool:
+        current = self._current_setting(command)
+        return current is not None and current != self._streamed_current
+
+    def _record_current(self, command: str):
+        current = self._current_setting(command)
+        if current is not None:
+            self._streamed_current = current
+
+    def _read_streamed_ack(self):
+        """ Read the ack for the oldest command in flight, raising any error
+        or alarm in its response against that command """
+        command, timeout = self._in_flight.popleft()
+        ret = serial_communication.read_response(
+            SMOOTHIE_ACK, self._connection, timeout=timeout, tag='smoothie')
+        ret = self._remove_unwanted_characters(command, ret)
+        try:
+            self._handle_return(ret)
+        except SmoothieAlarm as sa:
+            raise SmoothieAlarm(sa.ret_code, command)
+        except SmoothieError as se:
+            raise SmoothieError(se.ret_code, command)
+
+    def _drain_stream(self):
+        while self._in_flight:
+            self._read_streamed_ack()
+
+    def _wait_for_streamed_motion(self):
+        self._drain_stream()
+        if self._motion_queued:
+            self._send_wait()
+
+    def _discard_stream(self):
+        """ Forget any commands still in flight without reading their acks,
+        for use after an error or a halt when smoothie has dropped them """
+        self._streamed_current = None
+        if not self._in_flight:
+            return
+        log.debug(f"discarding {len(self._in_flight)} streamed commands")
+        self._in_flight.clear()
+        if self._connection:
+            serial_communication.clear_buffer(self._connection)
+
+    def wait_for_motion(self):
+        """
+        Block until every command sent to smoothie has been acknowledged and
+        all queued motion has completed. Outside of streaming mode every
+        command already waits for this, so this does nothing.
+        """
+        if not self._streaming:
+            return
+        self._send_command(GCODES['WAIT'], timeout=DEFAULT_MOVEMENT_TIMEOUT)
 
     def _handle_return(self, ret_code: str):
         """ Check the return string from smoothie for an error condition.
@@ -1262,7 +1429,7 @@ class SmoothieDriver_3_0_0:
             1) Smoothieware boots or resets, 2) if a HALT gcode or signal
             is sent, or 3) a homing/limitswitch error occured.
         '''
-        self.run_flag.wait()
+        self._wait_for_run_flag()
 
         def valid_movement(coords, axis):
             return not (
@@ -1326,7 +1493,7 @@ class SmoothieDriver_3_0_0:
 
     def home(self, axis=AXES, disabled=DISABLE_AXES):
 
-        self.run_flag.wait()
+        self._wait_for_run_flag()
 
         axis = axis.upper()
 
@@ -1484,8 +1651,18 @@ class SmoothieDriver_3_0_0:
             self.pop_active_current()
             self.pop_axis_max_speed()
 
+    def _wait_for_run_flag(self):
+        if not self.run_flag.is_set():
+            # let streamed moves finish so the robot comes to rest here
+            # rather than somewhere inside the streaming window
+            self.wait_for_motion()
+        self.run_flag.wait()
+
     def pause(self):
         if not self.simulating:
+            # Let streamed moves finish, so that the robot is at rest while
+            # it is paused
+            self.wait_for_motion()
             self.run_flag.clear()
 
     def resume(self):
@@ -1558,6 +1735,7 @@ class SmoothieDriver_3_0_0:
         """
         log.debug("kill")
         self.hard_halt()
+        self._discard_stream()
         self._reset_from_error()
         self._setup()
 
@@ -1,12 +1,14 @@
 from os import environ
 import logging
 import asyncio
-from threading import Event, Thread
+import concurrent.futures
+import functools
+from threading import Event
 from time import sleep
-from typing import Optional, Mapping
+from typing import Any, Callable, Dict, Optional, Mapping
 from serial.serialutil import SerialException  # type: ignore
 
-from opentrons.drivers import serial_communication, utils
+from opentrons.drivers import serial_reactor, utils
 from opentrons.drivers.serial_communication import SerialNoResponse
 
 '''
@@ -55,7 +57,8 @@ class TempDeck:
         self._config = config
 
         self._temperature = {'current': 25, 'target': None}
-        self._update_thread = None
+        self._poll: Optional[concurrent.futures.Future] = None
+        self._poll_rate: Optional[serial_reactor.PollRate] = None
 
     def connect(self, port=None) -> Optional[str]:
         if environ.get('ENABLE_VIRTUAL_SMOOTHIE', '').lower() == 'true':
@@ -69,6 +72,7 @@ class TempDeck:
         return ''
 
     def disconnect(self):
+        self.stop_polling()
         if self.is_connected():
             self._connection.close()
         self._connection = None
@@ -120,21 +124,48 @@ class TempDeck:
         self._temperature.update({'target': celsius})
         return ''
 
-    def update_temperature(self, default=None) -> str:
-        if self._update_thread and self._update_thread.is_alive():
-            updated_temperature = default or self._temperature.copy()
-            self._temperature.update(updated_temperature)
-        else:
-            try:
-                self._update_thread = Thread(
-                    target=self._recursive_update_temperature,
-                    args=[DEFAULT_COMMAND_RETRIES],
-                    name='Tempdeck recursive update temperature')
-                self._update_thread.start()
-            except (TempDeckError, SerialException, SerialNoResponse) as e:
-                return str(e)
+    def update_temperature(self) -> str:
+        try:
+            self._recursive_update_temperature(DEFAULT_COMMAND_RETRIES)
+        except (TempDeckError, SerialException, SerialNoResponse) as e:
+            return str(e)
         return ''
 
+    def start_polling(self, interval: float,
+                      callback: Callable[[], None] = None):
+        '''
+        Keep the temperature up to date by asking for it from the serial
+        reactor, rather than from a thread per deck: every `interval` seconds
+        while the deck is heating or cooling, and less and less often while
+        it holds its target or is idle. `callback` is called from the reactor
+        after each update
+        '''
+        self.stop_polling()
+        if self.is_connected():
+            self._poll_rate = serial_reactor.PollRate(interval)
+            self._poll = self._connection.poll(
+                GCODES['GET_TEMP'] + ' ' + TEMP_DECK_COMMAND_TERMINATOR,
+                TEMP_DECK_ACK,
+                DEFAULT_TEMP_DECK_TIMEOUT,
+                self._poll_rate,
+                functools.partial(self._polled_temperature, callback))
+
+    def stop_polling(self):
+        if self._poll:
+            self._poll.cancel()
+            self._poll = None
+        self._poll_rate = None
+
+    @property
+    def poll_rate(self) -> Optional[serial_reactor.PollRate]:
+        return self._poll_rate
+
+    @property
+    def serial_metrics(self) -> Dict[str, Any]:
+        if not self._connection:
+            return {}
+        return self._connection.metrics
+
     @property
     def target(self) -> int:
         return self._temperature.get('target')
@@ -197,10 +228,11 @@ class TempDeck:
     def _connect_to_port(self, port=None):
         try:
             temp_deck = environ.get('OT_TEMP_DECK_ID', None)
-            self._connection = serial_communication.connect(
+            self._connection = serial_reactor.connect(
                 device_name=temp_deck,
                 port=port,
-                baudrate=TEMP_DECK_BAUDRATE
+                baudrate=TEMP_DECK_BAUDRATE,
+                tag=f'tempdeck {id(self)}'
             )
         except SerialException:
             # if another process is using the port, pyserial raises an
@@ -237,26 +269,12 @@ class TempDeck:
 
         return ret_code.strip()
 
-    def _recursive_write_and_return(self, cmd, timeout, retries, tag=None):
-        if not tag:
-            tag = f'tempdeck {id(self)}'
-        try:
-            return serial_communication.write_and_return(
-                cmd,
-                TEMP_DECK_ACK,
-                self._connection,
-                timeout,
-                tag=tag)
-        except SerialNoResponse as e:
-            retries -= 1
-            if retries <= 0:
-                raise e
-            sleep(DEFAULT_STABILIZE_DELAY)
-            if self._connection:
-                self._connection.close()
-                self._connection.open()
-            return self._recursive_write_and_return(
-                cmd, timeout, retries, tag=tag)
+    def _recursive_write_and_return(self, cmd, timeout, retries):
+        if not self._connection:
+            raise SerialException('Temp-Deck is not connected')
+        # The reactor retries, reopening the port, if there is no response
+        return self._connection.send(
+            cmd, TEMP_DECK_ACK, timeout, retries=retries)
 
     def _recursive_update_temperature(self, retries):
         try:
@@ -274,6 +292,23 @@ class TempDeck:
             sleep(DEFAULT_STABILIZE_DELAY)
             return self._recursive_update_temperature(retries)
 
+    def _polled_temperature(self, callback, response):
+        try:
+            res = utils.parse_temperature_response(
+                response.strip(), utils.TEMPDECK_GCODE_ROUNDING_PRECISION)
+        except utils.ParseError as e:
+            # The next poll will try again
+            log.debug(f'Unexpected temperature from Temp-Deck: {e}')
+            return
+        self._temperature.update(res)
+        if self._poll_rate:
+            if self.status in ('holding at target', 'idle'):
+                self._poll_rate.steady()
+            else:
+                self._poll_rate.changing()
+        if callback:
+            callback()
+
     def _recursive_get_info(self, retries) -> Mapping[str, str]:
         try:
             device_info = self._send_command(GCODES['DEVICE_INFO'])
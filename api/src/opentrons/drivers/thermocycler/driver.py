@@ -1,18 +1,9 @@
 import asyncio
 import logging
-import os
-import threading
 import serial  # type: ignore
-from queue import Queue
-try:
-    import select
-except ModuleNotFoundError:
-    select = None  # type: ignore
-from time import sleep
-from typing import Optional, Mapping
+from typing import Any, Callable, Dict, Optional, Mapping
 from serial.serialutil import SerialException  # type: ignore
-from opentrons.drivers import serial_communication, utils
-from opentrons.drivers.serial_communication import SerialNoResponse
+from opentrons.drivers import serial_reactor, utils
 
 
 log = logging.getLogger(__name__)
@@ -59,7 +50,6 @@ TC_ACK = 'ok' + SERIAL_ACK + 'ok' + SERIAL_ACK
 ERROR_KEYWORD = 'error'
 DEFAULT_TC_TIMEOUT = 40
 DEFAULT_COMMAND_RETRIES = 3
-DEFAULT_STABILIZE_DELAY = 0.1
 POLLING_FREQUENCY_MS = 1000
 TEMP_THRESHOLD = 0.5
 
@@ -68,179 +58,40 @@ class ThermocyclerError(Exception):
     pass
 
 
-class TCPoller(threading.Thread):
-    def __init__(self, port, interrupt_callback, temp_status_callback,
-                 lid_status_callback, lid_temp_status_callback):
-        if not select:
-            raise RuntimeError("Cannot connect to a Thermocycler from Windows")
-        self._port = port
-        self._connection = self._connect_to_port()
-        self._interrupt_callback = interrupt_callback
-        self._temp_status_callback = temp_status_callback
-        self._lid_status_callback = lid_status_callback
-        self._lid_temp_status_callback = lid_temp_status_callback
-        self._lock = threading.Lock()
-        self._command_queue = Queue()
-
-        # Note: the options and order of operations for opening file
-        # descriptors is very specific. For more info, see:
-        # http://pubs.opengroup.org/onlinepubs/007908799/xsh/open.html
-        self._send_path = '/var/run/tc_send_fifo_{}'.format(hash(self))
-        os.mkfifo(self._send_path)
-        send_read_fd = os.open(
-            self._send_path, flags=os.O_RDONLY | os.O_NONBLOCK)
-        self._send_read_file = os.fdopen(send_read_fd, 'rb')
-        self._send_write_fd = open(self._send_path, 'wb', buffering=0)
-
-        self._halt_path = '/var/run/tc_halt_fifo_{}'.format(hash(self))
-        os.mkfifo(self._halt_path)
-        halt_read_fd = os.open(
-            self._halt_path, flags=os.O_RDONLY | os.O_NONBLOCK)
-        self._halt_read_file = os.fdopen(halt_read_fd, 'rb')
-        self._halt_write_fd = open(self._halt_path, 'wb', buffering=0)
-
-        self._poller = select.poll()
-        self._poller.register(self._send_read_file, select.POLLIN)
-        self._poller.register(self._halt_read_file, select.POLLIN)
-        self._poller.register(self._connection, select.POLLIN)
-
-        serial_thread_name = 'tc_serial_poller_{}'.format(hash(self))
-        super().__init__(target=self._serial_poller, name=serial_thread_name)
-        log.info("Starting TC thread {}".format(serial_thread_name))
-        super().start()
-
-    @property
-    def port(self):
-        return self._port
-
-    def _serial_poller(self):
-        """ Priority-sorted list of checks
-
-        Highest priority is the 'halt' channel, which is used to kill the
-        thread and the serial communication channel and allow everything to be
-        cleaned up.
-
-        Second is the lid-open interrupt, which should trigger a callback
-        (typically to halt the robot).
-
-        Third is an enqueued command to send to the Thermocycler.
-
-        Fourth (if no other work is available) is to query the Thermocycler for
-        its current temp, target temp, and time remaining in its current cycle.
-        """
-        while True:
-            _next = dict(self._poller.poll(POLLING_FREQUENCY_MS))
-            if self._halt_read_file.fileno() in _next:
-                log.debug("Poller [{}]: halt".format(hash(self)))
-                self._halt_read_file.read()
-                # Note: this is discarded because we send a set message to halt
-                # the thread--don't currently need to parse it
-                break
-
-            elif self._connection.fileno() in _next:
-                # Lid-open interrupt
-                log.debug("Poller [{}]: interrupt".format(hash(self)))
-                res = self._connection.read_until(SERIAL_ACK)
-                self._interrupt_callback(res)
-
-            elif self._send_read_file.fileno() in _next:
-                self._send_read_file.read(1)
-                command, callback = self._command_queue.get()
-                log.debug("Poller [{}]: send {}".format(hash(self), command))
-                res = self._send_command(command)
-                callback(res)
-            else:
-                # Nothing else to do--update device status
-                log.debug("Poller [{}]: updating temp".format(hash(self)))
-                res = self._send_command(GCODES['GET_PLATE_TEMP'])
-                self._temp_status_callback(res)
-                res = self._send_command(GCODES['GET_LID_STATUS'])
-                self._lid_status_callback(res)
-                res = self._send_command(GCODES['GET_LID_TEMP'])
-                self._lid_temp_status_callback(res)
-        log.info("Exiting TC poller loop [{}]".format(hash(self)))
-
-    def _wait_for_ack(self):
-        """
-        This method writes a sequence of newline characters, which will
-        guarantee the device responds with 'ok\r\nok\r\n' within 1 second
-        """
-        self._send_command(SERIAL_ACK, timeout=DEFAULT_TC_TIMEOUT)
-
-    def _send_command(self, command, timeout=DEFAULT_TC_TIMEOUT):
-        command_line = command + ' ' + TC_COMMAND_TERMINATOR
-        ret_code = self._recursive_write_and_return(
-            command_line, timeout, DEFAULT_COMMAND_RETRIES)
-        if ERROR_KEYWORD in ret_code.lower():
-            log.error('Received error message from Thermocycler: {}'.format(
-                ret_code))
-            raise ThermocyclerError(ret_code)
-        return ret_code.strip()
-
-    def _recursive_write_and_return(self, cmd, timeout, retries):
-        try:
-            return serial_communication.write_and_return(
-                cmd, TC_ACK, self._connection, timeout,
-                tag=f'thermocycler {id(self)}')
-        except SerialNoResponse as e:
-            retries -= 1
-            if retries <= 0:
-                raise e
-            sleep(DEFAULT_STABILIZE_DELAY)
-            if self._connection:
-                self._connection.close()
-                self._connection.open()
-            return self._recursive_write_and_return(
-                cmd, timeout, retries)
-
-    def _connect_to_port(self):
-        try:
-            return serial_communication.connect(port=self._port,
-                                                baudrate=TC_BAUDRATE)
-        except SerialException:
-            raise SerialException(
-                "Thermocycler device not found on {}".format(self._port))
-
-    def send(self, command, callback):
-        with self._lock:
-            self._command_queue.put((command, callback))
-            self._send_write_fd.write(b'c')
-
-    def close(self):
-        self._halt_write_fd.write(b'q')
-
-    def __del__(self):
-        """ Clean up thread fifos"""
-        try:
-            os.unlink(self._send_path)
-        except NameError:
-            pass
-        try:
-            os.unlink(self._halt_path)
-        except NameError:
-            pass
-
-
 class Thermocycler:
-    def __init__(self, interrupt_callback):
-        self._poller = None
-        self._update_thread = None
-        self._current_temp = None
-        self._target_temp = None
-        self._ramp_rate = None
-        self._hold_time = None
-        self._lid_status = None
+    def __init__(self, interrupt_callback,
+                 status_callback: Callable[[], None] = None):
+        self._connection: Optional[serial_reactor.SerialChannel] = None
+        self._poll_rate: Optional[serial_reactor.PollRate] = None
+        self._status_cb = status_callback
+        self._current_temp: Optional[float] = None
+        self._target_temp: Optional[float] = None
+        self._ramp_rate: Optional[float] = None
+        self._hold_time: Optional[float] = None
+        self._lid_status: Optional[str] = None
         self._interrupt_cb = interrupt_callback
-        self._lid_target = None
-        self._lid_temp = None
+        self._lid_target: Optional[float] = None
+        self._lid_temp: Optional[float] = None
 
     async def connect(self, port: str) -> 'Thermocycler':
         self.disconnect()
-        self._poller = TCPoller(
-            port, self._interrupt_callback,
-            self._temp_status_update_callback,
-            self._lid_status_update_callback,
-            self._lid_temp_status_callback)
+        self._connection = self._connect_to_port(port)
+        # Lid-open interrupts arrive while no command is in flight
+        self._connection.on_unsolicited(SERIAL_ACK, self._interrupt_callback)
+        # When there is nothing else to send, keep the device status up to
+        # date, polling less often while nothing is changing
+        self._poll_rate = serial_reactor.PollRate(
+            POLLING_FREQUENCY_MS / 1000)
+        for gcode, callback in (
+                ('GET_PLATE_TEMP', self._temp_status_update_callback),
+                ('GET_LID_STATUS', self._lid_status_update_callback),
+                ('GET_LID_TEMP', self._lid_temp_status_callback)):
+            self._connection.poll(
+                GCODES[gcode] + ' ' + TC_COMMAND_TERMINATOR,
+                TC_ACK,
+                DEFAULT_TC_TIMEOUT,
+                self._poll_rate,
+                callback)
 
         # Check initial device lid state
         _lid_status_res = await self._write_and_wait(GCODES['GET_LID_STATUS'])
@@ -250,19 +101,19 @@ class Thermocycler:
         return self
 
     def disconnect(self) -> 'Thermocycler':
-        if self.is_connected():
-            self._poller.close()
-            self._poller.join()
-        self._poller = None
+        if self._connection and self._connection.is_open:
+            self._connection.close()
+        self._connection = None
+        self._poll_rate = None
         return self
 
     async def deactivate(self):
         await self._write_and_wait(GCODES['DEACTIVATE'])
 
     def is_connected(self) -> bool:
-        if not self._poller:
+        if not self._connection:
             return False
-        return self._poller.is_alive()
+        return self._connection.is_open
 
     async def open(self):
         await self._write_and_wait(GCODES['OPEN_LID'])
@@ -330,6 +181,9 @@ class Thermocycler:
         self._current_temp = val_dict['C']
         self._target_temp = val_dict['T']
         self._hold_time = val_dict['H']
+        self._update_poll_rate()
+        if self._status_cb:
+            self._status_cb()
 
     def _lid_temp_status_callback(self, lid_temp_res):
         # Payload is shaped like `T:95.0 C:77.4` where T is the
@@ -344,8 +198,26 @@ class Thermocycler:
             val_dict[key] = value
         self._lid_temp = val_dict['C']
         self._lid_target = val_dict['T']
+        if self._status_cb:
+            self._status_cb()
+
+    def _update_poll_rate(self):
+        # Temperatures ramp and hold times count down between polls, so the
+        # polls can only back off once neither is happening
+        if not self._poll_rate:
+            return
+        settled = ('holding at target', 'idle')
+        lid_settled = self.lid_target is None or (
+            self.lid_temp is not None and self.lid_temp_status in settled)
+        if self.status in settled and not self.hold_time and lid_settled:
+            self._poll_rate.steady()
+        else:
+            self._poll_rate.changing()
 
     def _interrupt_callback(self, interrupt_response):
+        # The lid was moved by hand, so catch up with it right away
+        if self._poll_rate:
+            self._poll_rate.changing()
         # TODO sanitize response and then call the callback
         parsed_response = interrupt_response
         self._interrupt_cb(parsed_response)
@@ -400,9 +272,19 @@ class Thermocycler:
 
     @property
     def port(self) -> Optional[str]:
-        if not self._poller:
+        if not self._connection:
             return None
-        return self._poller.port
+        return self._connection.port
+
+    @property
+    def poll_rate(self) -> Optional[serial_reactor.PollRate]:
+        return self._poll_rate
+
+    @property
+    def serial_metrics(self) -> Dict[str, Any]:
+        if not self._connection:
+            return {}
+        return self._connection.metrics
 
     @property
     def lid_status(self):
@@ -428,18 +310,26 @@ class Thermocycler:
             raise ThermocyclerError("Thermocycler did not return device info")
 
     async def _write_and_wait(self, command):
-        ret = None
-
-        def cb(cmd):
-            nonlocal ret
-            ret = cmd
-
-        self._poller.send(command, cb)
+        if not self._connection:
+            raise SerialException('Thermocycler is not connected')
+        command_line = command + ' ' + TC_COMMAND_TERMINATOR
+        ret_code = await self._connection.send_async(
+            command_line, TC_ACK, DEFAULT_TC_TIMEOUT,
+            retries=DEFAULT_COMMAND_RETRIES)
+        if ERROR_KEYWORD in ret_code.lower():
+            log.error('Received error message from Thermocycler: {}'.format(
+                ret_code))
+            raise ThermocyclerError(ret_code)
+        return ret_code.strip()
 
-        while None is ret:
-            await asyncio.sleep(0.05)
-            pass
-        return ret
+    def _connect_to_port(self, port) -> serial_reactor.SerialChannel:
+        try:
+            return serial_reactor.connect(port=port,
+                                          baudrate=TC_BAUDRATE,
+                                          tag=f'thermocycler {id(self)}')
+        except SerialException:
+            raise SerialException(
+                "Thermocycler device not found on {}".format(port))
 
     async def enter_programming_mode(self):
         trigger_connection = serial.Serial(
@@ -449,6 +339,6 @@ class Thermocycler:
 
     def __del__(self):
         try:
-            self._poller.close()
+            self.disconnect()
         except Exception:
             log.exception('Exception while cleaning up Thermocycler:')
@@ -12,11 +12,12 @@ functions are available elsewhere.
 
 import asyncio
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import contextlib
 import functools
 import inspect
 import logging
-from typing import Any, Dict, Union, List, Optional, Tuple
+from typing import Any, Dict, Union, List, Optional, Sequence, Tuple
 from opentrons import types as top_types
 from opentrons.util import linal
 from .simulator import Simulator
@@ -33,6 +34,10 @@ from .types import Axis, HardwareAPILike, CriticalPoint
 
 mod_log = logging.getLogger(__name__)
 
+#: How long to wait before looking for modules again after failing to build
+#: one, when :py:meth:`API.watch_modules` is running
+MODULE_RETRY_S = 1.0
+
 
 def _log_call(func):
     if inspect.iscoroutinefunction(func):
@@ -103,6 +108,7 @@ class API(HardwareAPILike):
             top_types.Mount.RIGHT: None
         }
         self._attached_modules: Dict[str, Any] = {}
+        self._watching_modules = False
         self._last_moved_mount: Optional[top_types.Mount] = None
         # The motion lock synchronizes calls to long-running physical tasks
         # involved in motion. This fixes issue where for instance a move()
@@ -110,6 +116,21 @@ class API(HardwareAPILike):
         # current_position(), which will not be updated until the move() or
         # home() call succeeds or fails.
         self._motion_lock = asyncio.Lock(loop=self._loop)
+        # Calls into a real hardware backend block for as long as it takes
+        # the smoothie to respond (up to the length of a move), so they are
+        # run in a dedicated worker thread rather than on the event loop.
+        # Having exactly one worker keeps them in the order they were made.
+        # The simulator returns immediately, so it is called inline.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        if not self.is_simulator_sync:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='hardware_control')
+
+    def __del__(self):
+        # Let the worker thread exit once it is done with what it was given
+        executor = getattr(self, '_executor', None)
+        if executor:
+            executor.shutdown(wait=False)
 
     @classmethod
     async def build_hardware_controller(
@@ -184,6 +205,27 @@ class API(HardwareAPILike):
     def is_simulator_sync(self):
         return isinstance(self._backend, Simulator)
 
+    @property
+    def simulated_time(self) -> Optional[float]:
+        """ The estimated time, in seconds, that the actions performed so far
+        would have taken on a real robot, or ``None`` if this is not a
+        simulator.
+        """
+        if isinstance(self._backend, Simulator):
+            return self._backend.clock.elapsed
+        return None
+
+    async def _backend_call(self, func, *args, **kwargs):
+        """ Call a (blocking) backend method without blocking the loop """
+        if not self._executor:
+            return func(*args, **kwargs)
+        # The running loop rather than self._loop, since a wrapping
+        # SynchronousAdapter may have moved us to its own thread's loop
+        # while the server still calls us from the main loop
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs))
+
     async def register_callback(self, cb):
         """ Allows the caller to register a callback, and returns a closure
         that can be used to unregister the provided callback
@@ -252,8 +294,19 @@ class API(HardwareAPILike):
     async def delay(self, duration_s: int):
         """ Delay execution by pausing and sleeping.
         """
+        # Wait for streamed moves in the worker, rather than on the loop
+        # when the backend pauses
+        await self.wait_for_motion()
         await self._backend.delay(duration_s)
 
+    async def wait_for_motion(self):
+        """ Wait until the motion already sent to the hardware has finished.
+
+        Moves normally finish before the call that made them returns, but
+        when the smoothie driver streams its commands they may not have.
+        """
+        await self._backend_call(self._backend.wait_for_motion)
+
     @_log_call
     async def cache_instruments(self,
                                 require:
@@ -275,7 +328,8 @@ class API(HardwareAPILike):
 
         """
         self._log.info("Updating instrument model cache")
-        found = self._backend.get_attached_instruments(require or {})
+        found = await self._backend_call(
+            self._backend.get_attached_instruments, require or {})
 
         for mount, instrument_data in found.items():
             model = instrument_data.get('model')
@@ -318,11 +372,14 @@ class API(HardwareAPILike):
 
             mount_axis = Axis.by_mount(mount)
             plunger_axis = Axis.of_plunger(mount)
-            self._backend._smoothie_driver.update_steps_per_mm(
-                {plunger_axis.name: steps_mm})
-            self._backend._smoothie_driver.update_pipette_config(
+            driver = self._backend._smoothie_driver
+            await self._backend_call(
+                driver.update_steps_per_mm, {plunger_axis.name: steps_mm})
+            await self._backend_call(
+                driver.update_pipette_config,
                 mount_axis.name, {'home': home_pos})
-            self._backend._smoothie_driver.update_pipette_config(
+            await self._backend_call(
+                driver.update_pipette_config,
                 plunger_axis.name, {'max_travel': max_travel})
         mod_log.info("Instruments found: {}".format(
             self._attached_instruments))
@@ -440,10 +497,10 @@ class API(HardwareAPILike):
         """ Immediately stop motion.
 
         Calls to :py:meth:`stop` through the synch adapter while other calls
-        are ongoing will typically wait until those calls are done, since most
-        of the async calls here in fact block the loop while they talk to
-        smoothie. To provide actual immediate halting, call this method which
-        does not require use of the loop.
+        are ongoing will typically wait until those calls are done, since
+        communication with the smoothie is done in order in a single worker
+        thread. To provide actual immediate halting, call this method which
+        does not require use of the loop or the worker.
 
         After this call, the smoothie will be in a bad state until a call to
         :py:meth:`stop`.
@@ -459,7 +516,7 @@ class API(HardwareAPILike):
         see :py:meth:`pause` for more detail), then home and reset the
         robot.
         """
-        self._backend.halt()
+        await self._backend_call(self._backend.halt)
         self._log.info("Recovering from halt")
         self._call_on_attached_modules("cancel")
         await self.reset()
@@ -510,7 +567,7 @@ class API(HardwareAPILike):
         checked_axes = axes or [ax for ax in Axis]
         gantry = [ax for ax in checked_axes if ax in Axis.gantry_axes()]
         smoothie_gantry = [ax.name.upper() for ax in gantry]
-        smoothie_pos = {}
+        smoothie_pos: Dict[str, float] = {}
         plungers = [ax for ax in checked_axes
                     if ax not in Axis.gantry_axes()]
 
@@ -527,13 +584,14 @@ class API(HardwareAPILike):
         }
         async with self._motion_lock:
             if smoothie_gantry:
-                smoothie_pos.update(self._backend.home(smoothie_gantry))
+                smoothie_pos.update(await self._backend_call(
+                    self._backend.home, smoothie_gantry))
             if smoothie_plungers:
                 for smoothie_plunger, current in smoothie_plungers.items():
                     self._backend.set_active_current(
                         smoothie_plunger, current)
-                    smoothie_pos.update(
-                        self._backend.home([smoothie_plunger.name.upper()]))
+                    smoothie_pos.update(await self._backend_call(
+                        self._backend.home, [smoothie_plunger.name.upper()]))
             self._current_position = self._deck_from_smoothie(smoothie_pos)
 
     async def add_tip(
@@ -626,7 +684,7 @@ class API(HardwareAPILike):
         async with self._motion_lock:
             if refresh:
                 self._current_position = self._deck_from_smoothie(
-                    self._backend.update_position())
+                    await self._backend_call(self._backend.update_position))
             if mount == mount.RIGHT:
                 offset = top_types.Point(0, 0, 0)
             else:
@@ -709,6 +767,56 @@ class API(HardwareAPILike):
             await self.home()
 
         await self._cache_and_maybe_retract_mount(mount)
+        target_position = self._target_for(mount, abs_position, critical_point)
+        await self._move(target_position, speed=speed, max_speeds=max_speeds)
+
+    @_log_call
+    async def move_through(
+            self, mount: top_types.Mount,
+            moves: Sequence[Tuple[top_types.Point, Optional[CriticalPoint]]],
+            speed: float = None,
+            max_speeds: Dict[Axis, float] = None):
+        """ Move the critical point of the specified mount through a
+        sequence of locations relative to the deck, such as the arc planned by
+        :py:func:`.protocol_api.geometry.plan_moves`.
+
+        This is the same as calling :py:meth:`move_to` with each
+        ``(abs_position, critical_point)`` pair in ``moves`` and the same
+        ``speed`` and ``max_speeds``, except that every position is
+        transformed and checked before the first move and the moves are made
+        in one call to the backend.
+        """
+        if not self._current_position:
+            await self.home()
+
+        await self._cache_and_maybe_retract_mount(mount)
+        target_positions = [
+            self._target_for(mount, abs_position, critical_point)
+            for abs_position, critical_point in moves]
+        smoothie_positions = [
+            self._smoothie_from_deck(target_position)
+            for target_position in target_positions]
+        checked_maxes = max_speeds or {}
+        str_maxes = {ax.name: val for ax, val in checked_maxes.items()}
+        async with self._motion_lock:
+            try:
+                await self._backend_call(
+                    self._backend.move_through, smoothie_positions,
+                    speed=speed, axis_max_speeds=str_maxes)
+            except Exception:
+                self._log.exception('Move failed')
+                self._current_position.clear()
+                raise
+            else:
+                for target_position in target_positions:
+                    self._current_position.update(target_position)
+
+    def _target_for(
+            self, mount: top_types.Mount, abs_position: top_types.Point,
+            critical_point: CriticalPoint = None
+    ) -> 'OrderedDict[Axis, float]':
+        """ The deck position of the mount that puts the critical point at
+        ``abs_position`` (see :py:meth:`move_to`) """
         z_axis = Axis.by_mount(mount)
         if mount == top_types.Mount.LEFT:
             offset = top_types.Point(*self._config.mount_offset)
@@ -716,14 +824,12 @@ class API(HardwareAPILike):
             offset = top_types.Point(0, 0, 0)
         cp = self._critical_point_for(mount, critical_point)
 
-        target_position = OrderedDict(
+        return OrderedDict(
             ((Axis.X, abs_position.x - offset.x - cp.x),
              (Axis.Y, abs_position.y - offset.y - cp.y),
              (z_axis, abs_position.z - offset.z - cp.z))
         )
 
-        await self._move(target_position, speed=speed, max_speeds=max_speeds)
-
     @_log_call
     async def move_rel(self, mount: top_types.Mount, delta: top_types.Point,
                        speed: float = None,
@@ -790,6 +896,29 @@ class API(HardwareAPILike):
         at most one of a ZA or BC components. The frame in which to move
         is identified by the presence of (ZA) or (BC).
         """
+        smoothie_pos = self._smoothie_from_deck(target_position)
+        checked_maxes = max_speeds or {}
+        str_maxes = {ax.name: val for ax, val in checked_maxes.items()}
+        async with self._motion_lock:
+            try:
+                await self._backend_call(
+                    self._backend.move, smoothie_pos, speed=speed,
+                    home_flagged_axes=home_flagged_axes,
+                    axis_max_speeds=str_maxes)
+            except Exception:
+                self._log.exception('Move failed')
+                self._current_position.clear()
+                raise
+            else:
+                self._current_position.update(target_position)
+
+    def _smoothie_from_deck(
+            self, target_position: 'OrderedDict[Axis, float]'
+    ) -> Dict[str, float]:
+        """ Build the position to send to the backend for a move to
+        ``target_position`` (see :py:meth:`_move`), warning about any axis that
+        would be out of bounds.
+        """
         # Transform only the x, y, and (z or a) axes specified since this could
         # get the b or c axes as well
         to_transform = tuple((tp
@@ -840,19 +969,7 @@ class API(HardwareAPILike):
                                 smoothie_pos[ax.name],
                                 deck_mins[ax], deck_max[ax],
                                 bounds[ax.name][0], bounds[ax.name][1]))
-        checked_maxes = max_speeds or {}
-        str_maxes = {ax.name: val for ax, val in checked_maxes.items()}
-        async with self._motion_lock:
-            try:
-                self._backend.move(smoothie_pos, speed=speed,
-                                   home_flagged_axes=home_flagged_axes,
-                                   axis_max_speeds=str_maxes)
-            except Exception:
-                self._log.exception('Move failed')
-                self._current_position.clear()
-                raise
-            else:
-                self._current_position.update(target_position)
+        return smoothie_pos
 
     async def get_engaged_axes(self) -> Dict[Axis, bool]:
         """ Which axes are engaged and holding. """
@@ -862,7 +979,8 @@ class API(HardwareAPILike):
     engaged_axes = property(fget=get_engaged_axes)
 
     async def disengage_axes(self, which: List[Axis]):
-        self._backend.disengage_axes([ax.name for ax in which])
+        await self._backend_call(
+            self._backend.disengage_axes, [ax.name for ax in which])
 
     @_log_call
     async def retract(self, mount: top_types.Mount, margin: float = 10):
@@ -872,7 +990,8 @@ class API(HardwareAPILike):
         """
         smoothie_ax = Axis.by_mount(mount).name.upper()
         async with self._motion_lock:
-            smoothie_pos = self._backend.fast_home(smoothie_ax, margin)
+            smoothie_pos = await self._backend_call(
+                self._backend.fast_home, smoothie_ax, margin)
             self._current_position = self._deck_from_smoothie(smoothie_pos)
 
     def _critical_point_for(
@@ -1219,7 +1338,8 @@ class API(HardwareAPILike):
             if home_after:
                 safety_margin = abs(bottom-droptip)
                 async with self._motion_lock:
-                    smoothie_pos = self._backend.fast_home(
+                    smoothie_pos = await self._backend_call(
+                        self._backend.fast_home,
                         plunger_ax.name.upper(), safety_margin)
                     self._current_position = self._deck_from_smoothie(
                         smoothie_pos)
@@ -1354,22 +1474,74 @@ class API(HardwareAPILike):
 
     @_log_call
     async def discover_modules(self):
+        """ Find the attached modules, building any that are new.
+
+        While :py:meth:`watch_modules` is running, the modules it last found
+        are returned without looking for them again.
+        """
+        if not self._watching_modules:
+            await self._update_modules()
+        return list(self._attached_modules.values())
+
+    async def _update_modules(self):
         discovered = {port + model: (port, model)
                       for port, model in self._backend.get_attached_modules()}
-        these = set(discovered.keys())
-        known = set(self._attached_modules.keys())
-        new = these - known
-        gone = known - these
+        gone = [mod for mod in self._attached_modules
+                if mod not in discovered]
+        new = [mod for mod in discovered
+               if mod not in self._attached_modules]
         for mod in gone:
             self._attached_modules.pop(mod)
             self._log.info(f"Module {mod} disconnected")
-        for mod in new:
-            self._attached_modules[mod]\
-                = await self._backend.build_module(discovered[mod][0],
-                                                   discovered[mod][1],
-                                                   self.pause_with_message)
-            self._log.info(f"Module {mod} discovered and attached")
-        return list(self._attached_modules.values())
+        built = await asyncio.gather(
+            *[self._backend.build_module(discovered[mod][0],
+                                         discovered[mod][1],
+                                         self.pause_with_message)
+              for mod in new],
+            return_exceptions=True)
+        errors = []
+        for mod, result in zip(new, built):
+            if isinstance(result, BaseException):
+                self._log.error(f"Module {mod} could not be built: {result}")
+                errors.append(result)
+            else:
+                self._attached_modules[mod] = result
+                self._log.info(f"Module {mod} discovered and attached")
+        if errors:
+            raise errors[0]
+
+    async def watch_modules(self):
+        """ Keep the attached modules up to date as they are plugged in and
+        unplugged, until cancelled.
+
+        Modules are only looked for when the backend sees them change, and
+        in the meantime :py:meth:`discover_modules` returns the modules found
+        last time. If the backend can't watch for changes, the modules are
+        discovered once.
+        """
+        watcher = self._backend.module_watcher(asyncio.get_event_loop())
+        if not watcher:
+            await self._update_modules()
+            return
+        self._watching_modules = True
+        try:
+            while True:
+                try:
+                    await self._update_modules()
+                except Exception:
+                    self._log.exception("Failed to update attached modules")
+                    # A module may not be ready just after it shows up, so
+                    # look again soon even if nothing changes
+                    try:
+                        await asyncio.wait_for(
+                            watcher.changed(), MODULE_RETRY_S)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await watcher.changed()
+        finally:
+            self._watching_modules = False
+            watcher.close()
 
     @_log_call
     async def update_module(
@@ -1444,7 +1616,8 @@ class API(HardwareAPILike):
             # Probe and retrieve the position afterwards
             async with self._motion_lock:
                 self._current_position = self._deck_from_smoothie(
-                    self._backend.probe(
+                    await self._backend_call(
+                        self._backend.probe,
                         to_probe.name.lower(), hs.probe_distance))
             xyz = await self.gantry_position(mount)
             # Store the upated position.
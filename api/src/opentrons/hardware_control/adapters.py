@@ -4,11 +4,17 @@ import asyncio
 import copy
 import functools
 import threading
-from typing import List, Mapping
+from collections import deque
+from typing import Deque, Dict, List, Mapping, Optional
 
+from opentrons import types as top_types
+from opentrons.config import robot_configs
 from . import API
 from .types import Axis, HardwareAPILike
 
+#: How many idle simulators a :py:class:`SimulatorPool` keeps by default
+SIMULATOR_POOL_SIZE = 4
+
 
 class SynchronousAdapter(HardwareAPILike, threading.Thread):
     """ A wrapper to make every call into :py:class:`.hardware_control.API`
@@ -46,7 +52,8 @@ class SynchronousAdapter(HardwareAPILike, threading.Thread):
 
     def __init__(self,
                  api: API,
-                 loop: asyncio.AbstractEventLoop = None) -> None:
+                 loop: asyncio.AbstractEventLoop = None,
+                 daemon: bool = False) -> None:
         """ Build the SynchronousAdapter.
 
         :param api: The API instance to wrap
@@ -56,6 +63,8 @@ class SynchronousAdapter(HardwareAPILike, threading.Thread):
                      be run elsewhere. If not specified (which should be the
                      normal use case) the adapter will start a new event loop
                      for the worker thread.
+        :param daemon: Whether the worker thread should be a daemon thread,
+                       which does not keep the process from exiting.
         """
         checked_loop = loop or asyncio.new_event_loop()
         api.set_loop(checked_loop)
@@ -65,7 +74,8 @@ class SynchronousAdapter(HardwareAPILike, threading.Thread):
         self._cached_sync_mods: Mapping[str, SynchronousAdapter] = {}
         super().__init__(
             target=self._event_loop_in_thread,
-            name='SynchAdapter thread for {}'.format(repr(api)))
+            name='SynchAdapter thread for {}'.format(repr(api)),
+            daemon=daemon)
         super().start()
 
     def __repr__(self):
@@ -82,6 +92,17 @@ class SynchronousAdapter(HardwareAPILike, threading.Thread):
             thread_loop.call_soon_threadsafe(lambda: thread_loop.stop())
         super().join()
 
+    def replace_api(self, api: API):
+        """ Wrap a different API instance, which will run in this adapter's
+        thread. Adapters for modules discovered through the old instance are
+        joined.
+        """
+        api.set_loop(object.__getattribute__(self, '_loop'))
+        for mod in self._cached_sync_mods.values():
+            mod.join()
+        self._cached_sync_mods = {}
+        self._api = api
+
     def __del__(self):
         try:
             thread_loop = object.__getattribute__(self, '_loop')
@@ -145,6 +166,83 @@ class SynchronousAdapter(HardwareAPILike, threading.Thread):
         return attr
 
 
+class SimulatorPool:
+    """ A pool of :py:class:`SynchronousAdapter` instances around hardware
+    simulators.
+
+    Building an adapter starts a thread with a new event loop, and joining it
+    waits for that thread to stop. An adapter released to the pool keeps its
+    thread and is handed out again around a newly built simulator, so it
+    starts from a clean state: nothing homed, attached or loaded.
+
+    Pooled adapters run in daemon threads, so idle ones don't keep the
+    process from exiting.
+    """
+
+    def __init__(self, maxsize: int = SIMULATOR_POOL_SIZE) -> None:
+        #: The most idle adapters to keep; more are joined when released
+        self.maxsize = maxsize
+        #: How many adapters the pool has had to build
+        self.builds = 0
+        self._idle: Deque[SynchronousAdapter] = deque()
+
+    def acquire(
+            self,
+            attached_instruments: Dict[top_types.Mount, Dict[str, Optional[str]]] = None,  # noqa E501
+            attached_modules: List[str] = None,
+            config: robot_configs.robot_config = None,
+            strict_attached_instruments: bool = True) -> SynchronousAdapter:
+        """ Get an adapter around a new hardware simulator, built with the
+        arguments as in :py:meth:`.API.build_hardware_simulator`.
+
+        The adapter should be given back with :py:meth:`release` when it is
+        no longer used.
+        """
+        adapter = None
+        while adapter is None:
+            try:
+                adapter = self._idle.pop()
+            except IndexError:
+                break
+            # The threads of adapters inherited across a fork don't run
+            if not adapter.is_alive():
+                adapter = None
+        if adapter is None:
+            loop = asyncio.new_event_loop()
+        else:
+            loop = object.__getattribute__(adapter, '_loop')
+        api = API.build_hardware_simulator(
+            attached_instruments, attached_modules, config, loop,
+            strict_attached_instruments)
+        if adapter is None:
+            self.builds += 1
+            return SynchronousAdapter(api, loop, daemon=True)
+        adapter.replace_api(api)
+        return adapter
+
+    def release(self, adapter: SynchronousAdapter):
+        """ Give back an adapter from :py:meth:`acquire`. It must not be used
+        afterwards.
+        """
+        if adapter.is_alive() and len(self._idle) < self.maxsize:
+            self._idle.append(adapter)
+        else:
+            adapter.join()
+
+    def clear(self):
+        """ Join all the idle adapters """
+        while True:
+            try:
+                adapter = self._idle.pop()
+            except IndexError:
+                return
+            adapter.join()
+
+
+#: The pool of simulators used for protocol contexts and simulation
+simulator_pool = SimulatorPool()
+
+
 class SingletonAdapter(HardwareAPILike):
     """ A wrapper to use as a global singleton to control hardware.
 
@@ -1,11 +1,12 @@
 import asyncio
 from contextlib import contextmanager, ExitStack
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from opentrons.drivers.smoothie_drivers import driver_3_0
 from opentrons.drivers.rpi_drivers import gpio
 import opentrons.config
+from opentrons.config import feature_flags as ff
 from opentrons.types import Mount
 
 from . import modules
@@ -36,7 +37,8 @@ class Controller:
         self.config = config or opentrons.config.robot_configs.load()
         # We handle our own locks in the hardware controller thank you
         self._smoothie_driver = driver_3_0.SmoothieDriver_3_0_0(
-            config=self.config, handle_locks=False)
+            config=self.config, handle_locks=False,
+            streaming=ff.enable_smoothie_streaming())
         self._cached_fw_version: Optional[str] = None
 
     def update_position(self) -> Dict[str, float]:
@@ -57,6 +59,23 @@ class Controller:
             self._smoothie_driver.move(
                 target_position, home_flagged_axes=home_flagged_axes)
 
+    def move_through(self, target_positions: Sequence[Dict[str, float]],
+                     home_flagged_axes: bool = True, speed: float = None,
+                     axis_max_speeds: Dict[str, float] = None):
+        """ Make several moves one after another, setting (and restoring)
+        the speeds once for all of them rather than around each move """
+        with ExitStack() as cmstack:
+            if speed:
+                cmstack.enter_context(
+                    self._smoothie_driver.restore_speed(speed))
+            if axis_max_speeds:
+                cmstack.enter_context(
+                    self._smoothie_driver.restore_axis_max_speed(
+                        axis_max_speeds))
+            for target_position in target_positions:
+                self._smoothie_driver.move(
+                    target_position, home_flagged_axes=home_flagged_axes)
+
     def home(self, axes: List[str] = None) -> Dict[str, float]:
         if axes:
             args: Tuple[Any, ...] = (''.join(axes),)
@@ -113,6 +132,11 @@ class Controller:
     def get_attached_modules(self) -> List[Tuple[str, str]]:
         return modules.discover()
 
+    def module_watcher(
+            self, loop: asyncio.AbstractEventLoop
+    ) -> Optional[modules.DirectoryWatcher]:
+        return modules.DirectoryWatcher(modules.MODULES_DIR, loop)
+
     async def build_module(self,
                            port: str,
                            model: str,
@@ -178,6 +202,9 @@ class Controller:
         return {'button': gpio.get_button_light()[2],
                 'rails': gpio.get_rail_lights()}
 
+    def wait_for_motion(self):
+        self._smoothie_driver.wait_for_motion()
+
     def pause(self):
         self._smoothie_driver.pause()
 
@@ -198,6 +225,8 @@ class Controller:
     async def delay(self, duration_s: int):
         """ Pause and sleep
         """
+        # Streamed moves have to finish before the delay starts
+        self.wait_for_motion()
         self.pause()
         await asyncio.sleep(duration_s)
         self.resume()
@@ -5,13 +5,18 @@ import re
 from typing import List, Optional, Tuple
 
 from opentrons.config import IS_ROBOT
+from ..time_estimate import SimulatedClock
 from .mod_abc import AbstractModule
+from .watcher import DirectoryWatcher  # noqa(W0611)
 # Must import tempdeck and magdeck (and other modules going forward) so they
 # actually create the subclasses
 from . import update, tempdeck, magdeck, thermocycler  # noqa(W0611)
 
 log = logging.getLogger(__name__)
 
+#: Where the robot's udev rules link attached modules
+MODULES_DIR = '/dev/modules'
+
 
 class UnsupportedModuleError(Exception):
     pass
@@ -33,16 +38,22 @@ async def build(
         port: str,
         which: str,
         simulating: bool,
-        interrupt_callback) -> AbstractModule:
+        interrupt_callback,
+        sim_clock: SimulatedClock = None) -> AbstractModule:
     return await MODULE_TYPES[which].build(
-        port, interrupt_callback=interrupt_callback, simulating=simulating)
+        port, interrupt_callback=interrupt_callback, simulating=simulating,
+        sim_clock=sim_clock)
 
 
-def discover() -> List[Tuple[str, str]]:
+def discover(directory: str = None) -> List[Tuple[str, str]]:
     """ Scan for connected modules and instantiate handler classes
+
+    :param directory: Where to look for modules. By default,
+                      :py:data:`MODULES_DIR` on a robot and nowhere otherwise.
     """
-    if IS_ROBOT and os.path.isdir('/dev/modules'):
-        devices = os.listdir('/dev/modules')
+    checked_dir = directory or (MODULES_DIR if IS_ROBOT else '')
+    if checked_dir and os.path.isdir(checked_dir):
+        devices = os.listdir(checked_dir)
     else:
         devices = []
 
@@ -57,7 +68,7 @@ def discover() -> List[Tuple[str, str]]:
                 log.warning("Unexpected module connected: {} on {}"
                             .format(name, port))
                 continue
-            absolute_port = '/dev/modules/{}'.format(port)
+            absolute_port = os.path.join(checked_dir, port)
             discovered_modules.append((absolute_port, name))
     log.debug('Discovered modules: {}'.format(discovered_modules))
 
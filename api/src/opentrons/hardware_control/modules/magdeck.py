@@ -1,10 +1,15 @@
 import asyncio
-from typing import Union
+from typing import Optional, Union
 from opentrons.drivers.mag_deck import MagDeck as MagDeckDriver
+from ..time_estimate import SimulatedClock
 from . import update, mod_abc
+from .telemetry import SampleHistory
 
 LABWARE_ENGAGE_HEIGHT = {'biorad-hardshell-96-PCR': 18}    # mm
 MAX_ENGAGE_HEIGHT = 45  # mm from home position
+# Approximate speed of the magnets, used to estimate move times when
+# simulating
+SIM_MOVE_SPEED_MM_PER_SEC = 50
 
 
 class MissingDevicePortError(Exception):
@@ -12,17 +17,26 @@ class MissingDevicePortError(Exception):
 
 
 class SimulatingDriver:
-    def __init__(self):
+    def __init__(self, sim_clock: SimulatedClock = None):
         self._port = None
         self._height = 0
+        self._position = 0
+        self._sim_clock = sim_clock
+
+    def _move_magnets(self, position):
+        if self._sim_clock:
+            self._sim_clock.advance(
+                abs(position - self._position) / SIM_MOVE_SPEED_MM_PER_SEC)
+        self._position = position
 
     def probe_plate(self):
         pass
 
     def home(self):
-        pass
+        self._move_magnets(0)
 
     def move(self, location):
+        self._move_magnets(location)
         self._height = location
 
     def get_device_info(self):
@@ -39,6 +53,14 @@ class SimulatingDriver:
     def enter_programming_mode(self):
         pass
 
+    @property
+    def poll_rate(self):
+        return None
+
+    @property
+    def serial_metrics(self):
+        return {}
+
     @property
     def plate_height(self):
         return self._height
@@ -53,10 +75,11 @@ class MagDeck(mod_abc.AbstractModule):
                     port,
                     interrupt_callback,
                     simulating=False,
-                    loop: asyncio.AbstractEventLoop = None):
+                    loop: asyncio.AbstractEventLoop = None,
+                    sim_clock: SimulatedClock = None):
         # MagDeck does not currently use interrupts, so the callback is not
         # passed on
-        mod = cls(port, simulating, loop)
+        mod = cls(port, simulating, loop, sim_clock)
         await mod._connect()
         return mod
 
@@ -74,19 +97,22 @@ class MagDeck(mod_abc.AbstractModule):
 
     @staticmethod
     def _build_driver(
-            simulating: bool) -> Union['SimulatingDriver', 'MagDeckDriver']:
+            simulating: bool,
+            sim_clock: Optional[SimulatedClock] = None)\
+            -> Union['SimulatingDriver', 'MagDeckDriver']:
         if simulating:
-            return SimulatingDriver()
+            return SimulatingDriver(sim_clock)
         else:
             return MagDeckDriver()
 
     def __init__(self,
                  port: str,
                  simulating: bool,
-                 loop: asyncio.AbstractEventLoop = None) -> None:
+                 loop: asyncio.AbstractEventLoop = None,
+                 sim_clock: SimulatedClock = None) -> None:
         self._engaged = False
         self._port = port
-        self._driver = self._build_driver(simulating)
+        self._driver = self._build_driver(simulating, sim_clock)
 
         if None is loop:
             self._loop = asyncio.get_event_loop()
@@ -94,6 +120,7 @@ class MagDeck(mod_abc.AbstractModule):
             self._loop = loop
 
         self._device_info = None
+        self._history = SampleHistory(('engaged',))
 
     def calibrate(self):
         """
@@ -102,6 +129,7 @@ class MagDeck(mod_abc.AbstractModule):
         self._driver.probe_plate()
         # return if successful or not?
         self._engaged = False
+        self._record_sample()
 
     def engage(self, height):
         """
@@ -112,6 +140,7 @@ class MagDeck(mod_abc.AbstractModule):
                 MAX_ENGAGE_HEIGHT))
         self._driver.move(height)
         self._engaged = True
+        self._record_sample()
 
     def deactivate(self):
         """
@@ -119,6 +148,7 @@ class MagDeck(mod_abc.AbstractModule):
         """
         self._driver.home()
         self._engaged = False
+        self._record_sample()
 
     @property
     def device_info(self):
@@ -141,10 +171,25 @@ class MagDeck(mod_abc.AbstractModule):
             }
         }
 
+    @property
+    def history(self):
+        return self._history
+
+    def _record_sample(self):
+        self._history.record(self.live_data['data'])
+
     @property
     def port(self):
         return self._port
 
+    @property
+    def poll_rate(self):
+        return self._driver.poll_rate
+
+    @property
+    def serial_metrics(self):
+        return self._driver.serial_metrics
+
     @property
     def is_simulated(self):
         return isinstance(self._driver, SimulatingDriver)
@@ -168,6 +213,7 @@ class MagDeck(mod_abc.AbstractModule):
         """
         self._driver.connect(self._port)
         self._device_info = self._driver.get_device_info()
+        self._record_sample()
 
     def _disconnect(self):
         """
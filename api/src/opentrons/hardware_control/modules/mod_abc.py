@@ -1,5 +1,8 @@
 import abc
-from typing import Dict, Callable, Any, Tuple, Awaitable
+from typing import Dict, Callable, Any, Tuple, Awaitable, Optional
+from ..time_estimate import SimulatedClock
+from .telemetry import SampleHistory
+from opentrons.drivers.serial_reactor import PollRate
 
 InterruptCallback = Callable[[str], None]
 UploadFunction = Callable[[str, str, Dict[str, Any]],
@@ -14,11 +17,17 @@ class AbstractModule(abc.ABC):
     async def build(cls,
                     port: str,
                     interrupt_callback,
-                    simulating: bool = False) -> 'AbstractModule':
+                    simulating: bool = False,
+                    *,
+                    sim_clock: Optional[SimulatedClock] = None)\
+            -> 'AbstractModule':
         """ Modules should always be created using this factory.
 
         This lets the (perhaps blocking) work of connecting to and initializing
         a module be in a place that can be async.
+
+        If ``sim_clock`` is specified, a simulating module advances it by
+        the time its actions would have taken on real hardware.
         """
         pass
 
@@ -45,6 +54,24 @@ class AbstractModule(abc.ABC):
         """ Return a dict of the module's dynamic information """
         pass
 
+    @property
+    @abc.abstractmethod
+    def history(self) -> SampleHistory:
+        """ The history of the module's dynamic information """
+        pass
+
+    @property
+    @abc.abstractmethod
+    def poll_rate(self) -> Optional[PollRate]:
+        """ How often the module's status is polled, or None if it isn't """
+        pass
+
+    @property
+    @abc.abstractmethod
+    def serial_metrics(self) -> Dict[str, Any]:
+        """ Return a dict of how busy the module's serial connection is """
+        pass
+
     @property
     @abc.abstractmethod
     def is_simulated(self) -> bool:
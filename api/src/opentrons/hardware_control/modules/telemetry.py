@@ -0,0 +1,113 @@
+""" Histories of the live data modules report.
+
+Samples are recorded as the drivers poll their modules (and after commands
+change what a module is doing), so clients can read or stream a module's
+history rather than asking for its live data over and over.
+"""
+import asyncio
+import math
+import threading
+import time
+from array import array
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+#: How many samples each module keeps. At one sample a second this is a
+#: little over an hour
+HISTORY_SIZE = 4096
+
+Sample = Dict[str, Optional[float]]
+
+
+class SampleHistory:
+    """ A fixed-size ring buffer of timestamped samples of some of a module's
+    live data.
+
+    Each field is kept in an array of floats, with ``None`` recorded as NaN
+    and booleans as 0 or 1. Samples may be recorded from any thread.
+    """
+
+    def __init__(self, fields: Sequence[str],
+                 size: int = HISTORY_SIZE) -> None:
+        self._fields = tuple(fields)
+        self._size = size
+        self._times = array('d', [0.0]) * size
+        self._values = [array('d', [math.nan]) * size for _ in self._fields]
+        #: How many samples have ever been recorded
+        self._count = 0
+        self._lock = threading.Lock()
+        self._waiters: List[Tuple[asyncio.AbstractEventLoop,
+                                  asyncio.Future]] = []
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return self._fields
+
+    @property
+    def count(self) -> int:
+        """ How many samples have been recorded, including any that have
+        since been overwritten """
+        return self._count
+
+    def record(self, data: Mapping[str, Any], timestamp: float = None):
+        """ Record the fields of ``data``, such as a module's
+        ``live_data['data']`` """
+        with self._lock:
+            index = self._count % self._size
+            self._times[index] = time.time() if timestamp is None\
+                else timestamp
+            for field, values in zip(self._fields, self._values):
+                value = data.get(field)
+                values[index] = math.nan if value is None else float(value)
+            self._count += 1
+            waiters, self._waiters = self._waiters, []
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def since(self, timestamp: float) -> Tuple[int, List[Sample]]:
+        """ The samples still held that were recorded at or after
+        ``timestamp``, oldest first, and the count they run up to """
+        with self._lock:
+            first = self._first_held()
+            lo, hi = first, self._count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if self._times[mid % self._size] < timestamp:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return self._count, self._samples(lo)
+
+    def after(self, count: int) -> Tuple[int, List[Sample]]:
+        """ The samples still held that were recorded after the first
+        ``count``, oldest first, and the count they run up to """
+        with self._lock:
+            return self._count, self._samples(max(count, self._first_held()))
+
+    async def wait(self, count: int):
+        """ Wait until more than ``count`` samples have been recorded """
+        loop = asyncio.get_event_loop()
+        with self._lock:
+            if self._count > count:
+                return
+            waiter = loop.create_future()
+            self._waiters.append((loop, waiter))
+        await waiter
+
+    def _first_held(self) -> int:
+        return max(self._count - self._size, 0)
+
+    def _samples(self, start: int) -> List[Sample]:
+        samples = []
+        for position in range(start, self._count):
+            index = position % self._size
+            sample: Sample = {'timestamp': self._times[index]}
+            for field, values in zip(self._fields, self._values):
+                value = values[index]
+                sample[field] = None if math.isnan(value) else value
+            samples.append(sample)
+        return samples
+
+
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
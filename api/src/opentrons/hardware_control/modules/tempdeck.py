@@ -1,10 +1,14 @@
 import asyncio
-from threading import Thread, Event
-from typing import Union
+from typing import Optional, Union
 from opentrons.drivers.temp_deck import TempDeck as TempDeckDriver
+from ..time_estimate import SimulatedClock, ramp_duration
 from . import update, mod_abc
+from .telemetry import SampleHistory
 
 TEMP_POLL_INTERVAL_SECS = 1
+# Approximate rate at which a temperature module heats or cools, used to
+# estimate ramp times when simulating
+SIM_RAMP_RATE_C_PER_SEC = 0.06
 
 
 class MissingDevicePortError(Exception):
@@ -12,12 +16,17 @@ class MissingDevicePortError(Exception):
 
 
 class SimulatingDriver:
-    def __init__(self):
+    def __init__(self, sim_clock: SimulatedClock = None):
         self._target_temp = 0
         self._active = False
         self._port = None
+        self._sim_clock = sim_clock
 
     async def set_temperature(self, celsius):
+        if self._sim_clock:
+            self._sim_clock.advance(ramp_duration(
+                self._target_temp if self._active else None,
+                celsius, SIM_RAMP_RATE_C_PER_SEC))
         self._target_temp = celsius
         self._active = True
 
@@ -28,6 +37,12 @@ class SimulatingDriver:
     def update_temperature(self):
         pass
 
+    def start_polling(self, interval, callback=None):
+        pass
+
+    def stop_polling(self):
+        pass
+
     def connect(self, port):
         self._port = port
 
@@ -37,6 +52,14 @@ class SimulatingDriver:
     def enter_programming_mode(self):
         pass
 
+    @property
+    def poll_rate(self):
+        return None
+
+    @property
+    def serial_metrics(self):
+        return {}
+
     @property
     def temperature(self):
         return self._target_temp
@@ -55,22 +78,6 @@ class SimulatingDriver:
                 'version': 'dummyVersionTD'}
 
 
-class Poller(Thread):
-    def __init__(self, driver):
-        self._driver_ref = driver
-        self._stop_event = Event()
-        super().__init__(target=self._poll_temperature,
-                         name='Temperature poller for tempdeck')
-
-    def _poll_temperature(self):
-        while not self._stop_event.wait(TEMP_POLL_INTERVAL_SECS):
-            self._driver_ref.update_temperature()
-
-    def join(self):
-        self._stop_event.set()
-        super().join()
-
-
 class TempDeck(mod_abc.AbstractModule):
     """
     Under development. API subject to change without a version bump
@@ -80,12 +87,13 @@ class TempDeck(mod_abc.AbstractModule):
                     port,
                     interrupt_callback,
                     simulating=False,
-                    loop: asyncio.AbstractEventLoop = None):
+                    loop: asyncio.AbstractEventLoop = None,
+                    sim_clock: SimulatedClock = None):
 
         """ Build and connect to a TempDeck"""
         # TempDeck does not currently use interrupts, so the callback is not
         # passed on
-        mod = cls(port, simulating, loop)
+        mod = cls(port, simulating, loop, sim_clock)
         await mod._connect()
         return mod
 
@@ -103,18 +111,21 @@ class TempDeck(mod_abc.AbstractModule):
 
     @staticmethod
     def _build_driver(
-            simulating: bool) -> Union['SimulatingDriver', 'TempDeckDriver']:
+            simulating: bool,
+            sim_clock: Optional[SimulatedClock] = None)\
+            -> Union['SimulatingDriver', 'TempDeckDriver']:
         if simulating:
-            return SimulatingDriver()
+            return SimulatingDriver(sim_clock)
         else:
             return TempDeckDriver()
 
     def __init__(self,
                  port,
                  simulating,
-                 loop: asyncio.AbstractEventLoop = None) -> None:
+                 loop: asyncio.AbstractEventLoop = None,
+                 sim_clock: SimulatedClock = None) -> None:
 
-        self._driver = self._build_driver(simulating)
+        self._driver = self._build_driver(simulating, sim_clock)
         if None is loop:
             self._loop = asyncio.get_event_loop()
         else:
@@ -122,7 +133,7 @@ class TempDeck(mod_abc.AbstractModule):
 
         self._port = port
         self._device_info = None
-        self._poller = None
+        self._history = SampleHistory(('currentTemp', 'targetTemp'))
 
     async def set_temperature(self, celsius):
         """
@@ -132,11 +143,14 @@ class TempDeck(mod_abc.AbstractModule):
         temperature display. Any input outside of this range will be clipped
         to the nearest limit
         """
-        return await self._driver.set_temperature(celsius)
+        res = await self._driver.set_temperature(celsius)
+        self._record_sample()
+        return res
 
     def deactivate(self):
         """ Stop heating/cooling and turn off the fan """
         self._driver.deactivate()
+        self._record_sample()
 
     @property
     def device_info(self):
@@ -152,6 +166,13 @@ class TempDeck(mod_abc.AbstractModule):
             }
         }
 
+    @property
+    def history(self):
+        return self._history
+
+    def _record_sample(self):
+        self._history.record(self.live_data['data'])
+
     @property
     def temperature(self):
         return self._driver.temperature
@@ -168,6 +189,14 @@ class TempDeck(mod_abc.AbstractModule):
     def port(self):
         return self._port
 
+    @property
+    def poll_rate(self):
+        return self._driver.poll_rate
+
+    @property
+    def serial_metrics(self):
+        return self._driver.serial_metrics
+
     @property
     def is_simulated(self):
         return isinstance(self._driver, SimulatingDriver)
@@ -189,22 +218,18 @@ class TempDeck(mod_abc.AbstractModule):
         Planned change- will connect to the correct port in case of multiple
         TempDecks
         """
-        if self._poller:
-            self._poller.join()
         self._driver.connect(self._port)
         self._device_info = self._driver.get_device_info()
-        self._poller = Poller(self._driver)
-        self._poller.start()
+        self._driver.start_polling(TEMP_POLL_INTERVAL_SECS,
+                                   self._record_sample)
+        self._record_sample()
 
     def __del__(self):
-        if hasattr(self, '_poller') and self._poller:
-            self._poller.join()
+        if hasattr(self, '_driver'):
+            self._driver.stop_polling()
 
     async def prep_for_update(self) -> str:
-        if self._poller:
-            self._poller.join()
-        del self._poller
-        self._poller = None
+        self._driver.stop_polling()
         model = self._device_info and self._device_info.get('model')
         new_port = await update.enter_bootloader(self._driver, model)
         return new_port or self.port
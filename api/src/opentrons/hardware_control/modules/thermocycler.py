@@ -1,29 +1,47 @@
 import asyncio
 from . import types, update, mod_abc
+from .telemetry import SampleHistory
 from typing import Union, Optional, List, Callable
 from opentrons.drivers.thermocycler.driver import (
     Thermocycler as ThermocyclerDriver)
+from ..time_estimate import SimulatedClock, ramp_duration
 import logging
 
 MODULE_LOG = logging.getLogger(__name__)
 
+# Approximate thermocycler performance, used to estimate how long actions
+# take when simulating
+SIM_BLOCK_HEATING_RATE_C_PER_SEC = 4.0
+SIM_BLOCK_COOLING_RATE_C_PER_SEC = 2.0
+SIM_LID_HEATING_RATE_C_PER_SEC = 0.5
+SIM_LID_MOVE_SECS = 20.0
+
 
 class SimulatingDriver:
-    def __init__(self):
-        self._target_temp = None
-        self._ramp_rate = None
-        self._hold_time = None
+    def __init__(self, sim_clock: SimulatedClock = None):
+        self._target_temp: Optional[float] = None
+        self._ramp_rate: Optional[float] = None
+        self._hold_time: Optional[float] = None
         self._active = False
         self._port = None
         self._lid_status = 'open'
-        self._lid_target = None
+        self._lid_target: Optional[float] = None
         self._lid_heating_active = False
+        self._sim_clock = sim_clock
+
+    def _advance_clock(self, seconds: float):
+        if self._sim_clock:
+            self._sim_clock.advance(seconds)
 
     async def open(self):
+        if self._lid_status != 'open':
+            self._advance_clock(SIM_LID_MOVE_SECS)
         self._lid_status = 'open'
         return self._lid_status
 
     async def close(self):
+        if self._lid_status != 'closed':
+            self._advance_clock(SIM_LID_MOVE_SECS)
         self._lid_status = 'closed'
         return self._lid_status
 
@@ -60,6 +78,14 @@ class SimulatingDriver:
     def lid_temp_status(self):
         return 'holding at target' if self._lid_heating_active else 'idle'
 
+    @property
+    def poll_rate(self):
+        return None
+
+    @property
+    def serial_metrics(self):
+        return {}
+
     @property
     def lid_temp(self):
         return self._lid_target
@@ -74,6 +100,14 @@ class SimulatingDriver:
                               temp: float,
                               hold_time: float,
                               ramp_rate: float) -> None:
+        start = self._target_temp
+        if start is not None and temp < start:
+            max_rate = SIM_BLOCK_COOLING_RATE_C_PER_SEC
+        else:
+            max_rate = SIM_BLOCK_HEATING_RATE_C_PER_SEC
+        rate = min(ramp_rate, max_rate) if ramp_rate else max_rate
+        self._advance_clock(
+            ramp_duration(start, temp, rate) + (hold_time or 0))
         self._target_temp = temp
         self._hold_time = hold_time
         self._ramp_rate = ramp_rate
@@ -81,6 +115,9 @@ class SimulatingDriver:
 
     async def set_lid_temperature(self, temp: Optional[float]):
         """ Set the lid temperature in deg Celsius """
+        if temp is not None:
+            self._advance_clock(ramp_duration(
+                self._lid_target, temp, SIM_LID_HEATING_RATE_C_PER_SEC))
         self._lid_heating_active = True
         self._lid_target = temp
 
@@ -114,11 +151,12 @@ class Thermocycler(mod_abc.AbstractModule):
                     port: str,
                     interrupt_callback: mod_abc.InterruptCallback,
                     simulating: bool = False,
-                    loop: asyncio.AbstractEventLoop = None):
+                    loop: asyncio.AbstractEventLoop = None,
+                    sim_clock: SimulatedClock = None):
         """Build and connect to a Thermocycler
         """
 
-        mod = cls(port, interrupt_callback, simulating, loop)
+        mod = cls(port, interrupt_callback, simulating, loop, sim_clock)
         await mod._connect()
         return mod
 
@@ -137,20 +175,26 @@ class Thermocycler(mod_abc.AbstractModule):
     @staticmethod
     def _build_driver(
             simulating: bool,
-            interrupt_cb: Callable[[str], None] = None)\
+            interrupt_cb: Callable[[str], None] = None,
+            sim_clock: SimulatedClock = None,
+            status_cb: Callable[[], None] = None)\
             -> Union['SimulatingDriver', 'ThermocyclerDriver']:
         if simulating:
-            return SimulatingDriver()
+            return SimulatingDriver(sim_clock)
         else:
-            return ThermocyclerDriver(interrupt_cb)
+            return ThermocyclerDriver(interrupt_cb, status_cb)
 
     def __init__(self,
                  port: str,
                  interrupt_callback: mod_abc.InterruptCallback = None,
                  simulating: bool = False,
-                 loop: asyncio.AbstractEventLoop = None) -> None:
+                 loop: asyncio.AbstractEventLoop = None,
+                 sim_clock: SimulatedClock = None) -> None:
         self._interrupt_cb = interrupt_callback
-        self._driver = self._build_driver(simulating, interrupt_callback)
+        self._history = SampleHistory(
+            ('currentTemp', 'targetTemp', 'holdTime', 'lidTemp', 'lidTarget'))
+        self._driver = self._build_driver(
+            simulating, interrupt_callback, sim_clock, self._record_sample)
 
         if None is loop:
             self._loop = asyncio.get_event_loop()
@@ -186,6 +230,7 @@ class Thermocycler(mod_abc.AbstractModule):
         self._total_step_count = None
         self._current_step_index = None
         await self._driver.deactivate()
+        self._record_sample()
 
     async def open(self) -> str:
         """ Open the lid if it is closed"""
@@ -205,6 +250,7 @@ class Thermocycler(mod_abc.AbstractModule):
         hold_time = total_seconds if total_seconds > 0 else 0
         await self._driver.set_temperature(
             temp=temperature, hold_time=hold_time, ramp_rate=ramp_rate)
+        self._record_sample()
         if hold_time:
             await self.wait_for_hold()
         else:
@@ -235,10 +281,13 @@ class Thermocycler(mod_abc.AbstractModule):
     async def set_lid_temperature(self, temp: float):
         """ Set the lid temperature in deg Celsius """
         await self._driver.set_lid_temperature(temp=temp)
+        self._record_sample()
         await self.wait_for_lid_temp()
 
     async def stop_lid_heating(self):
-        return await self._driver.stop_lid_heating()
+        res = await self._driver.stop_lid_heating()
+        self._record_sample()
+        return res
 
     async def wait_for_lid_temp(self):
         """
@@ -340,6 +389,14 @@ class Thermocycler(mod_abc.AbstractModule):
             }
         }
 
+    @property
+    def poll_rate(self):
+        return self._driver.poll_rate
+
+    @property
+    def serial_metrics(self):
+        return self._driver.serial_metrics
+
     @property
     def is_simulated(self):
         return isinstance(self._driver, SimulatingDriver)
@@ -348,8 +405,8 @@ class Thermocycler(mod_abc.AbstractModule):
     def interrupt_callback(self):
         """ Fetch the current interrupt callback
 
-        Exposes the interrupt callback used with the TCPoller, so it can be re-
-        hooked in the new module instance after a firmware update.
+        Exposes the interrupt callback used for lid-open interrupts, so it can
+        be re-hooked in the new module instance after a firmware update.
         """
         return self._interrupt_cb
 
@@ -364,6 +421,14 @@ class Thermocycler(mod_abc.AbstractModule):
     async def _connect(self):
         await self._driver.connect(self._port)
         self._device_info = await self._driver.get_device_info()
+        self._record_sample()
+
+    @property
+    def history(self):
+        return self._history
+
+    def _record_sample(self):
+        self._history.record(self.live_data['data'])
 
     @property
     def port(self):
@@ -0,0 +1,129 @@
+""" Watching the directory that attached modules show up in.
+
+On Linux the directory is watched with inotify (through libc, since there is
+no inotify in the standard library). Elsewhere, or if the directory doesn't
+exist yet, its modification time is polled instead.
+"""
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+from typing import Optional, Tuple
+
+log = logging.getLogger(__name__)
+
+#: How often to check the directory when it can't be watched with inotify
+POLL_INTERVAL_S = 1.0
+
+# From <sys/inotify.h>
+_IN_ATTRIB = 0x004
+_IN_MOVED_FROM = 0x040
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_DELETE_SELF = 0x400
+_IN_MOVE_SELF = 0x800
+_WATCH_MASK = _IN_ATTRIB | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE\
+    | _IN_DELETE | _IN_DELETE_SELF | _IN_MOVE_SELF
+
+
+def _inotify_fd(path: str) -> Optional[int]:
+    """ Open an inotify instance watching ``path``, or return ``None`` if
+    that isn't possible here """
+    libc_name = ctypes.util.find_library('c')
+    if not libc_name:
+        return None
+    try:
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    except (OSError, AttributeError):
+        return None
+    if fd < 0:
+        return None
+    if libc.inotify_add_watch(fd, os.fsencode(path), _WATCH_MASK) < 0:
+        os.close(fd)
+        return None
+    return fd
+
+
+class DirectoryWatcher:
+    """ Waits for entries to be added to or removed from a directory """
+
+    def __init__(self,
+                 path: str,
+                 loop: asyncio.AbstractEventLoop = None,
+                 poll_interval: float = POLL_INTERVAL_S) -> None:
+        """ Start watching.
+
+        :param path: The directory to watch. It need not exist yet.
+        :param loop: The event loop :py:meth:`changed` will be awaited in
+        :param poll_interval: How often, in seconds, to check the directory
+                              when it is polled
+        """
+        self._path = path
+        self._loop = loop or asyncio.get_event_loop()
+        self._poll_interval = poll_interval
+        self._event = asyncio.Event(loop=self._loop)
+        self._fd: Optional[int] = None
+        self._stamp = self._dir_stamp()
+        if self._stamp is not None:
+            self._start_inotify()
+
+    @property
+    def uses_inotify(self) -> bool:
+        return self._fd is not None
+
+    def _dir_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = os.stat(self._path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _start_inotify(self):
+        self._fd = _inotify_fd(self._path)
+        if self._fd is not None:
+            self._loop.add_reader(self._fd, self._on_events)
+        else:
+            log.debug(f'Polling {self._path} for changes')
+
+    def _stop_inotify(self):
+        if self._fd is not None:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def _on_events(self):
+        # Any event means the directory should be scanned again, so the
+        # events themselves don't matter
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        self._event.set()
+
+    async def changed(self):
+        """ Wait until the entries of the directory have (or may have)
+        changed """
+        if self._fd is not None:
+            await self._event.wait()
+            self._event.clear()
+            self._stamp = self._dir_stamp()
+            if self._stamp is None:
+                # The watch went away with the directory
+                self._stop_inotify()
+            return
+        while True:
+            await asyncio.sleep(self._poll_interval, loop=self._loop)
+            stamp = self._dir_stamp()
+            if stamp != self._stamp:
+                self._stamp = stamp
+                if stamp is not None:
+                    self._start_inotify()
+                return
+
+    def close(self):
+        """ Stop watching """
+        self._stop_inotify()
@@ -2,14 +2,18 @@ import asyncio
 import copy
 import logging
 from threading import Event
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Sequence, Tuple
 from contextlib import contextmanager
 from opentrons import types
 from opentrons.config.pipette_config import (config_models,
                                              config_names,
                                              configs)
+from opentrons.config.robot_configs import (DEFAULT_ACCELERATION,
+                                            DEFAULT_MAX_SPEEDS)
 from opentrons.drivers.smoothie_drivers import SimulatingDriver
+from opentrons.drivers.smoothie_drivers.driver_3_0 import DEFAULT_AXES_SPEED
 from . import modules
+from .time_estimate import SimulatedClock, move_duration
 
 
 MODULE_LOG = logging.getLogger(__name__)
@@ -100,6 +104,29 @@ class Simulator:
         self._run_flag.set()
         self._log = MODULE_LOG.getChild(repr(self))
         self._strict_attached = bool(strict_attached_instruments)
+        self._clock = SimulatedClock()
+
+    @property
+    def clock(self) -> SimulatedClock:
+        """ The virtual clock accumulating the estimated time the simulated
+        hardware actions would have taken on a robot.
+        """
+        return self._clock
+
+    def _advance_for_move(self, target_position: Dict[str, float],
+                          speed: float = None,
+                          axis_max_speeds: Dict[str, float] = None):
+        if self._config:
+            max_speeds = dict(self._config.default_max_speed)
+            accelerations = self._config.acceleration
+        else:
+            max_speeds = dict(DEFAULT_MAX_SPEEDS)
+            accelerations = DEFAULT_ACCELERATION
+        if axis_max_speeds:
+            max_speeds.update(axis_max_speeds)
+        self._clock.advance(move_duration(
+            self._position, target_position,
+            speed or DEFAULT_AXES_SPEED, max_speeds, accelerations))
 
     def update_position(self) -> Dict[str, float]:
         return self._position
@@ -107,13 +134,23 @@ class Simulator:
     def move(self, target_position: Dict[str, float],
              home_flagged_axes: bool = True, speed: float = None,
              axis_max_speeds: Dict[str, float] = None):
+        self._advance_for_move(target_position, speed, axis_max_speeds)
         self._position.update(target_position)
         self._engaged_axes.update({ax: True
                                    for ax in target_position})
 
+    def move_through(self, target_positions: Sequence[Dict[str, float]],
+                     home_flagged_axes: bool = True, speed: float = None,
+                     axis_max_speeds: Dict[str, float] = None):
+        for target_position in target_positions:
+            self.move(target_position, home_flagged_axes, speed,
+                      axis_max_speeds)
+
     def home(self, axes: List[str] = None) -> Dict[str, float]:
         # driver_3_0-> HOMED_POSITION
         checked_axes = axes or 'XYZABC'
+        self._advance_for_move({ax: _HOME_POSITION[ax]
+                                for ax in checked_axes})
         self._position.update({ax: _HOME_POSITION[ax]
                                for ax in checked_axes})
         self._engaged_axes.update({ax: True
@@ -121,6 +158,7 @@ class Simulator:
         return self._position
 
     def fast_home(self, axis: str, margin: float) -> Dict[str, float]:
+        self._advance_for_move({axis: _HOME_POSITION[axis]})
         self._position[axis] = _HOME_POSITION[axis]
         self._engaged_axes[axis] = True
         return self._position
@@ -197,6 +235,12 @@ class Simulator:
     def get_attached_modules(self) -> List[Tuple[str, str]]:
         return self._attached_modules
 
+    def module_watcher(
+            self, loop: asyncio.AbstractEventLoop
+    ) -> Optional[modules.DirectoryWatcher]:
+        # The simulated modules are fixed when the simulator is built
+        return None
+
     @contextmanager
     def save_current(self):
         yield
@@ -209,7 +253,8 @@ class Simulator:
             port=port,
             which=model,
             simulating=True,
-            interrupt_callback=interrupt_callback)
+            interrupt_callback=interrupt_callback,
+            sim_clock=self._clock)
 
     async def update_module(
             self, module: modules.AbstractModule,
@@ -252,6 +297,9 @@ class Simulator:
     async def identify(self):
         pass
 
+    def wait_for_motion(self):
+        pass
+
     def pause(self):
         self._run_flag.clear()
 
@@ -265,10 +313,15 @@ class Simulator:
         self._run_flag.set()
 
     def probe(self, axis: str, distance: float) -> Dict[str, float]:
-        self._position[axis.upper()] = self._position[axis.upper()] + distance
+        target = self._position[axis.upper()] + distance
+        self._advance_for_move({axis.upper(): target})
+        self._position[axis.upper()] = target
         return self._position
 
     async def delay(self, duration_s: int):
-        """ Pause and unpause, but without the actual delay """
+        """ Pause and unpause, but without the actual delay. The delay is
+        still counted on the virtual clock.
+        """
         self.pause()
         self.resume()
+        self._clock.advance(duration_s)
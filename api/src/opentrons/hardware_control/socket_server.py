@@ -1,14 +1,34 @@
 """ A server that can listen on a local socket and provide serialized access
 to a hardware controller.
+
+Messages are jsonrpc 2.0 objects. By default they are simply sent one after
+the other; a client may instead ask for newline-delimited or length-prefixed
+framing (see :py:class:`Framing`) by making its first call on a connection
+to the ``rpc.framing`` method, for instance
+
+.. code-block:: json
+
+    {"jsonrpc": "2.0", "method": "rpc.framing",
+     "params": {"framing": "length"}, "id": 0}
+
+The response to that call is sent unframed; everything after it, in both
+directions, uses the requested framing. Requests may be pipelined: they are
+run concurrently, and their responses are sent in the order the requests
+arrived.
 """
 
+import abc
 import asyncio
-from collections import namedtuple
+from collections import deque, namedtuple
+import enum
 import functools
 import inspect
 import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+import re
+import struct
+from typing import (Any, Awaitable, Callable, Deque, Dict, List, Optional,
+                    Set, Type)
 
 import jsonrpcserver  # type: ignore
 
@@ -149,22 +169,241 @@ def build_jrpc_methods(api: API) -> jsonrpcserver.methods.Methods:
     return methods
 
 
+FRAMING_METHOD = 'rpc.framing'
+
+# How much the stream decoder asks for from its reader at once
+READ_SIZE = 2 ** 16
+
+
+class Framing(enum.Enum):
+    """ How messages are delimited on a connection """
+    #: One json object after another, as the server always used to do
+    JSON = 'json'
+    #: One json object per line
+    NEWLINE = 'newline'
+    #: Each message is preceded by its length as a 4-byte big-endian integer
+    LENGTH = 'length'
+
+
+class _Framer(abc.ABC):
+    """ Splits a stream of bytes into messages and frames outgoing ones.
+
+    Data is added with :py:meth:`feed`, and each call to
+    :py:meth:`next_message` returns the next complete message (or ``None``).
+    Data is only looked at once, however it is split up.
+    """
+    framing: Framing
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        self._buf += data
+
+    @abc.abstractmethod
+    def next_message(self) -> Optional[bytes]:
+        """ Remove and return the next complete message, if there is one """
+        pass
+
+    def take_buffer(self) -> bytes:
+        """ Remove and return data not yet returned as messages """
+        data = bytes(self._buf)
+        self._buf.clear()
+        return data
+
+    @staticmethod
+    @abc.abstractmethod
+    def frame(message: bytes) -> bytes:
+        """ Frame ``message`` for sending """
+        pass
+
+
+_JSON_STRUCTURE = re.compile(rb'[{}"]')
+_JSON_STRING_END = re.compile(rb'["\\]')
+
+
+class _JsonFramer(_Framer):
+    """ Finds the end of each object by keeping track of how deeply nested
+    in braces (outside of strings) the data so far is.
+
+    Since the server only accepts jsonrpc, every message is an object and
+    anything between objects is discarded - otherwise a client that sent
+    something that can never become valid json (like "aaaa") would leave the
+    connection stuck.
+    """
+    framing = Framing.JSON
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+
+    def take_buffer(self) -> bytes:
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        return super().take_buffer()
+
+    def next_message(self) -> Optional[bytes]:  # noqa(C901)
+        buf = self._buf
+        while True:
+            if not self._depth:
+                start = buf.find(b'{')
+                if start < 0:
+                    buf.clear()
+                    return None
+                del buf[:start]
+                self._depth = 1
+                self._pos = 1
+            if self._in_string:
+                match = _JSON_STRING_END.search(buf, self._pos)
+                if not match:
+                    self._pos = len(buf)
+                    return None
+                if match.group() == b'"':
+                    self._in_string = False
+                    self._pos = match.end()
+                elif match.end() < len(buf):
+                    # Skip whatever is escaped
+                    self._pos = match.end() + 1
+                else:
+                    # Look at the escape again when we know what it escapes
+                    self._pos = match.start()
+                    return None
+                continue
+            match = _JSON_STRUCTURE.search(buf, self._pos)
+            if not match:
+                self._pos = len(buf)
+                return None
+            self._pos = match.end()
+            char = match.group()
+            if char == b'"':
+                self._in_string = True
+            elif char == b'{':
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if not self._depth:
+                    message = bytes(buf[:self._pos])
+                    del buf[:self._pos]
+                    self._pos = 0
+                    return message
+
+    @staticmethod
+    def frame(message: bytes) -> bytes:
+        return message
+
+
+class _NewlineFramer(_Framer):
+    framing = Framing.NEWLINE
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pos = 0
+
+    def take_buffer(self) -> bytes:
+        self._pos = 0
+        return super().take_buffer()
+
+    def next_message(self) -> Optional[bytes]:
+        buf = self._buf
+        while True:
+            end = buf.find(b'\n', self._pos)
+            if end < 0:
+                self._pos = len(buf)
+                return None
+            message = bytes(buf[:end]).strip()
+            del buf[:end + 1]
+            self._pos = 0
+            if message:
+                return message
+
+    @staticmethod
+    def frame(message: bytes) -> bytes:
+        return message + b'\n'
+
+
+_LENGTH_PREFIX = struct.Struct('>I')
+
+
+class _LengthFramer(_Framer):
+    framing = Framing.LENGTH
+
+    def next_message(self) -> Optional[bytes]:
+        buf = self._buf
+        if len(buf) < _LENGTH_PREFIX.size:
+            return None
+        length, = _LENGTH_PREFIX.unpack_from(buf)
+        end = _LENGTH_PREFIX.size + length
+        if len(buf) < end:
+            return None
+        message = bytes(buf[_LENGTH_PREFIX.size:end])
+        del buf[:end]
+        return message
+
+    @staticmethod
+    def frame(message: bytes) -> bytes:
+        return _LENGTH_PREFIX.pack(len(message)) + message
+
+
+_FRAMERS: Dict[Framing, Type[_Framer]] = {
+    framer.framing: framer
+    for framer in (_JsonFramer, _NewlineFramer, _LengthFramer)}
+
+
+def frame_message(message: bytes, framing: Framing = Framing.JSON) -> bytes:
+    """ Frame an encoded message for sending on a connection using
+    ``framing`` """
+    return _FRAMERS[framing].frame(message)
+
+
 class JsonStreamDecoder:
-    def __init__(self, reader: asyncio.StreamReader):
+    """ Reads messages from the server out of a stream """
+    def __init__(self, reader: asyncio.StreamReader,
+                 framing: Framing = Framing.JSON):
         self._reader = reader
-        self._buf = b''
-        self._decoder = json.JSONDecoder()
+        self._framer: _Framer = _FRAMERS[framing]()
+
+    def set_framing(self, framing: Framing):
+        """ Switch how messages are framed from the next one on """
+        framer = _FRAMERS[framing]()
+        framer.feed(self._framer.take_buffer())
+        self._framer = framer
 
     async def read_object(self) -> Any:
         while True:
-            self._buf += await self._reader.read(1)
-            try:
-                decoded, offset = self._decoder.raw_decode(self._buf.decode())
-            except json.JSONDecodeError:
-                pass
-            else:
-                self._buf = self._buf[offset:]
-                return decoded
+            message = self._framer.next_message()
+            if message is not None:
+                return json.loads(message)
+            data = await self._reader.read(READ_SIZE)
+            if not data:
+                raise asyncio.IncompleteReadError(
+                    self._framer.take_buffer(), None)
+            self._framer.feed(data)
+
+
+async def negotiate_framing(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+        framing: Framing) -> JsonStreamDecoder:
+    """ Ask the server to use ``framing`` on a new connection.
+
+    This must be the first call made on the connection. Requests sent after it
+    should be framed with :py:func:`frame_message`.
+
+    :returns: A decoder for the responses
+    :raises RuntimeError: If the server refuses
+    """
+    decoder = JsonStreamDecoder(reader)
+    writer.write(json.dumps({
+        'jsonrpc': '2.0', 'method': FRAMING_METHOD,
+        'params': {'framing': framing.value}, 'id': 0}).encode())
+    resp = await decoder.read_object()
+    if 'error' in resp:
+        raise RuntimeError(
+            f'Could not set framing: {resp["error"]["message"]}')
+    decoder.set_framing(framing)
+    return decoder
 
 
 class Server:
@@ -221,10 +460,13 @@ class JsonRpcProtocol(asyncio.Protocol):
         self._api = api
         self._loop = loop
         self._log = LOG.getChild('jsonrpc')
-        self._decoder = json.JSONDecoder()
-        self._buffer = ''
+        self._framer: _Framer = _JsonFramer()
+        # Framing can only be chosen by the first message on a connection
+        self._negotiable = True
         self._transport: Optional[asyncio.Transport] = None
         self._inflight: Set[asyncio.Future] = set()
+        # Every request whose response has not been sent yet, in order
+        self._responses: Deque[asyncio.Future] = deque()
         self._onclose = on_close
         self._dispatch = dispatch
 
@@ -245,60 +487,88 @@ class JsonRpcProtocol(asyncio.Protocol):
     def resume_writing(self):
         self._log.debug('resume writing')
 
-    def data_received(self, data: bytes):  # noqa(C901)
-        self._log.debug(f'data received: {data!r}')
-        self._buffer += data.decode()  # hope this isn't incomplete
-        try:
-            _, pos = self._decoder.raw_decode(self._buffer)
-        except json.JSONDecodeError:
-            # If someone sends us garbage that isn't valid json, we need to
-            # not get stuck in a bad state. If we're always accumulating data
-            # until we no longer get an error, then consider if the first thing
-            # we saw was "aaaaaaaa" - this would always be invalid because it's
-            # impossible to make it valid json just by adding more data.
-            # Since we are only accepting jsonrpc, every message should be an
-            # object and therefore should start with {.
-            if self._buffer[0] != '{':
-                obj_start = self._buffer.find('{')
-                if obj_start == -1:
-                    # There is no '{' character in the buffer, wait for more
-                    # data
-                    return
-                else:
-                    # Recurse now that we've made the buffer safe
-                    self._buffer = self._buffer[obj_start:]
-                    return self.data_received(b'')
-            else:
-                # This is an incomplete json object, we can't dispatch anything
-                # and should wait for more data
+    def data_received(self, data: bytes):
+        # Formatted lazily, since this may be a lot of data
+        self._log.debug('data received: %r', data)
+        self._framer.feed(data)
+        while True:
+            message = self._framer.next_message()
+            if message is None:
                 return
-        to_dispatch = self._buffer[:pos]
-        self._buffer = self._buffer[pos:]
-        task = self._loop.create_task(self._dispatch(to_dispatch))
+            if self._negotiable:
+                self._negotiable = False
+                if self._negotiate(message):
+                    continue
+            self._start_request(message)
+
+    def _negotiate(self, message: bytes) -> bool:
+        """ Handle ``message`` if it is a call to ``rpc.framing``.
+
+        :returns: Whether it was
+        """
+        if FRAMING_METHOD.encode() not in message:
+            return False
+        try:
+            request = json.loads(message)
+        except ValueError:
+            return False
+        if not isinstance(request, dict)\
+                or request.get('method') != FRAMING_METHOD:
+            return False
+        params = request.get('params') or {}
+        framing: Optional[Framing] = None
+        try:
+            framing = Framing(params['framing'])
+        except (TypeError, KeyError, ValueError) as e:
+            response = json.dumps({
+                'jsonrpc': '2.0', 'id': request.get('id'),
+                'error': {'code': -32602,  # jsonrpc invalid params
+                          'message': 'unknown framing',
+                          'data': repr(e)}})
+        else:
+            response = json.dumps({
+                'jsonrpc': '2.0', 'id': request.get('id'),
+                'result': {'framing': framing.value}})
+            self._log.info(f'Using {framing.value} framing')
+        # Nothing can be in flight yet, so this is the first response
+        fut = self._loop.create_future()
+        fut.set_result(response)
+        self._responses.append(fut)
+        self._send_responses()
+        if framing is not None:
+            framer = _FRAMERS[framing]()
+            framer.feed(self._framer.take_buffer())
+            self._framer = framer
+        return True
+
+    def _start_request(self, message: bytes):
+        task = self._loop.create_task(self._dispatch(message.decode()))
         self._inflight.add(task)
+        self._responses.append(task)
 
         def done_callback(fut):
+            self._inflight.discard(fut)
+            self._send_responses()
+
+        task.add_done_callback(done_callback)
+
+    def _send_responses(self):
+        """ Send the responses to requests that are done, up to the first
+        one that is not, so that responses are always in request order """
+        while self._responses and self._responses[0].done():
+            fut = self._responses.popleft()
             try:
                 res = fut.result()
-            except asyncio.InvalidStateError:
-                self._log.exception("Invalid state in jrpc dispatch")
-                pass
             except asyncio.CancelledError as e:
                 self._log.error("jsonrpc invocation cancelled")
-                self._transport.write(
-                    _build_jrpc_error('execution cancelled', e).encode())
+                res = _build_jrpc_error('execution cancelled', e)
             except Exception as e:
                 self._log.exception('Uncaught exception in jsonrpc dispatch')
-                self._transport.write(
-                    _build_jrpc_error('uncaught exception in dispatch',
-                                      e).encode())
-            else:
-                if self._transport:
-                    self._transport.write(res.encode())
-            finally:
-                self._inflight.remove(task)
-
-        task.add_done_callback(done_callback)
+                res = _build_jrpc_error('uncaught exception in dispatch', e)
+            # Notifications have no response, and an empty frame would
+            # confuse clients using length framing
+            if res and self._transport:
+                self._transport.write(self._framer.frame(res.encode()))
 
     def eof_received(self):
         self._log.info(f'eof received')
@@ -0,0 +1,100 @@
+""" Estimates of how long hardware actions take on a real robot.
+
+The simulator does not wait for anything, so instead it uses these functions
+to work out how long each action would have taken and accumulates the result
+in a :py:class:`SimulatedClock`.
+"""
+import math
+from typing import Dict, Optional
+
+# The temperature modules are assumed to start out at (and drift back to)
+# room temperature
+AMBIENT_TEMPERATURE = 25.0
+
+
+class SimulatedClock:
+    """ A virtual clock advanced by simulated hardware instead of time """
+
+    def __init__(self) -> None:
+        self._elapsed = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        """ The total simulated time, in seconds """
+        return self._elapsed
+
+    def advance(self, seconds: float):
+        """ Advance the clock by ``seconds`` (ignored if not positive) """
+        if seconds > 0:
+            self._elapsed += seconds
+
+    def reset(self):
+        self._elapsed = 0.0
+
+
+def trapezoid_duration(distance: float,
+                       speed: float,
+                       acceleration: float) -> float:
+    """ How long a move of ``distance`` takes when accelerating at
+    ``acceleration`` up to at most ``speed`` and then decelerating to a stop.
+
+    Short moves never reach ``speed`` and have a triangular velocity profile.
+    """
+    if distance <= 0 or speed <= 0:
+        return 0.0
+    if acceleration <= 0:
+        return distance / speed
+    if distance >= speed * speed / acceleration:
+        return distance / speed + speed / acceleration
+    return 2 * math.sqrt(distance / acceleration)
+
+
+def move_duration(start: Dict[str, float],
+                  target: Dict[str, float],
+                  speed: float,
+                  max_speeds: Dict[str, float],
+                  accelerations: Dict[str, float]) -> float:
+    """ Estimate the duration of a coordinated move the way the smoothie
+    plans it.
+
+    All the axes in ``target`` move together in a straight line. The
+    combined ``speed`` and the line's acceleration are both reduced until no
+    single axis exceeds its entry in ``max_speeds`` or ``accelerations``.
+
+    :param start: The position of each axis before the move
+    :param target: The position of each moving axis after the move
+    :param speed: The requested combined speed in mm/s
+    :param max_speeds: The maximum speed of each axis in mm/s
+    :param accelerations: The acceleration of each axis in mm/s^2
+    :returns: The estimated duration in seconds
+    """
+    deltas = {ax: abs(pos - start.get(ax, pos))
+              for ax, pos in target.items()}
+    deltas = {ax: dist for ax, dist in deltas.items() if dist > 0}
+    if not deltas:
+        return 0.0
+    length = math.sqrt(sum(dist * dist for dist in deltas.values()))
+    line_speed = speed
+    line_accel: Optional[float] = None
+    for ax, dist in deltas.items():
+        scale = length / dist
+        if ax in max_speeds:
+            line_speed = min(line_speed, max_speeds[ax] * scale)
+        if ax in accelerations:
+            ax_accel = accelerations[ax] * scale
+            line_accel = ax_accel if line_accel is None\
+                else min(line_accel, ax_accel)
+    return trapezoid_duration(length, line_speed, line_accel or 0)
+
+
+def ramp_duration(current: Optional[float],
+                  target: float,
+                  rate: float) -> float:
+    """ Estimate how long a temperature ramp takes at ``rate`` in C/s.
+
+    If ``current`` is ``None`` the ramp starts at room temperature.
+    """
+    start = AMBIENT_TEMPERATURE if current is None else current
+    if rate <= 0:
+        return 0.0
+    return abs(target - start) / rate
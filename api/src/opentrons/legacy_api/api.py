@@ -1,11 +1,23 @@
 import logging
+import os
 from . import (robot as _robot_module,
                instruments as inst,
                containers as cnt,
                modules)
-from opentrons.config import pipette_config
+from opentrons.config import pipette_config, feature_flags as ff
+from opentrons.data_storage import database_migration
 
 log = logging.getLogger(__name__)
+
+# The robot singleton needs the labware database, so it is migrated here,
+# when the legacy api is first used, rather than on import of opentrons
+if os.environ.get('OT_UPDATE_SERVER') != 'true'\
+   and not ff.use_protocol_api_v2():
+    database_migration.check_version_and_perform_full_migration()
+elif not ff.use_protocol_api_v2():
+    # Need to minimally build the database for CI
+    database_migration.check_version_and_perform_minimal_migrations()
+
 # Ignore the type here because well, this is exactly why this is the legacy_api
 robot = _robot_module.Robot()  # type: ignore
 modules.provide_singleton(robot)
@@ -204,7 +204,7 @@ class Pipette(CommandPublisher):
         self._working_volume = self.max_volume
 
         volume_fn_type = type(ul_per_mm)
-        if dict is volume_fn_type:
+        if isinstance(ul_per_mm, dict):
             self.ul_per_mm = ul_per_mm
         elif float is volume_fn_type or int is volume_fn_type:
             # assume float or int is static ul/mm
@@ -70,6 +70,7 @@ def load(name, slot):
     else:
         raise UnsupportedModuleError("{} is not a valid module".format(name))
 
+    module_instance._robot = _mod_robot
     return module_instance
 
 
@@ -24,12 +24,21 @@ class MagDeck(commands.CommandPublisher):
         self._engaged = False
         self._driver = None
         self._device_info = None
+        # The robot whose moves the module waits for, set when it is loaded
+        self._robot = None
+
+    def _wait_for_motion(self):
+        # The robot may still be running streamed moves, which should finish
+        # before the module does anything
+        if self._robot:
+            self._robot.wait_for_motion()
 
     @commands.publish.both(command=commands.magdeck_calibrate)
     def calibrate(self):
         '''
         Calibration involves probing for top plate to get the plate height
         '''
+        self._wait_for_motion()
         if self._driver and self._driver.is_connected():
             self._driver.probe_plate()
             # return if successful or not?
@@ -65,6 +74,7 @@ class MagDeck(commands.CommandPublisher):
         if height > MAX_ENGAGE_HEIGHT or height < 0:
             raise ValueError('Invalid engage height. Should be 0 to {}'.format(
                 MAX_ENGAGE_HEIGHT))
+        self._wait_for_motion()
         if self._driver and self._driver.is_connected():
             self._driver.move(height)
             self._engaged = True
@@ -74,6 +84,7 @@ class MagDeck(commands.CommandPublisher):
         '''
         Home the magnet
         '''
+        self._wait_for_motion()
         if self._driver and self._driver.is_connected():
             self._driver.home()
             self._engaged = False
@@ -1,4 +1,3 @@
-from threading import Thread, Event
 from opentrons.drivers.temp_deck import TempDeck as TempDeckDriver
 from opentrons import commands
 
@@ -24,7 +23,14 @@ class TempDeck(commands.CommandPublisher):
         self._port = port
         self._driver = None
         self._device_info = None
-        self._poll_stop_event = None
+        # The robot whose moves the module waits for, set when it is loaded
+        self._robot = None
+
+    def _wait_for_motion(self):
+        # The robot may still be running streamed moves, which should finish
+        # before the module does anything
+        if self._robot:
+            self._robot.wait_for_motion()
 
     @commands.publish.both(command=commands.tempdeck_set_temp)
     def set_temperature(self, celsius):
@@ -35,12 +41,14 @@ class TempDeck(commands.CommandPublisher):
         temperature display. Any input outside of this range will be clipped
         to the nearest limit
         """
+        self._wait_for_motion()
         if self._driver and self._driver.is_connected():
             self._driver.legacy_set_temperature(celsius)
 
     @commands.publish.both(command=commands.tempdeck_deactivate)
     def deactivate(self):
         """ Stop heating/cooling and turn off the fan """
+        self._wait_for_motion()
         if self._driver and self._driver.is_connected():
             self._driver.deactivate()
 
@@ -113,17 +121,13 @@ class TempDeck(commands.CommandPublisher):
     def status(self):
         """
         Returns a string: 'heating'/'cooling'/'holding at target'/'idle'.
-        NOTE: Depends on _poll_temperature thread to update the temperature to
-        be used to determine the status
+        NOTE: Depends on the driver polling the temperature to update the
+        temperature to be used to determine the status
         """
         return self._driver and self._driver.status
 
     # Internal Methods
 
-    def _poll_temperature(self):
-        while not self._poll_stop_event.wait(TEMP_POLL_INTERVAL_SECS):
-            self._driver and self._driver.update_temperature()
-
     def connect(self):
         """
         Connect to the 'TempDeck' port
@@ -134,9 +138,7 @@ class TempDeck(commands.CommandPublisher):
             self._driver = TempDeckDriver()
             self._driver.connect(self._port)
             self._device_info = self._driver.get_device_info()
-
-            self._poll_stop_event = Event()
-            Thread(target=self._poll_temperature).start()
+            self._driver.start_polling(TEMP_POLL_INTERVAL_SECS)
         else:
             # Sanity check Should never happen, because connect should never
             # be called without a port on Module
@@ -148,9 +150,8 @@ class TempDeck(commands.CommandPublisher):
         '''
         Disconnect from the serial port
         '''
-        if self._poll_stop_event:
-            self._poll_stop_event.set()
         if self._driver:
+            self._driver.stop_polling()
             if self.status != 'idle':
                 self.deactivate()
             self._driver.disconnect()
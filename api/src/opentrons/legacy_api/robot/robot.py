@@ -131,7 +131,9 @@ class Robot(CommandPublisher):
         """
         super().__init__(broker)
         self.config = config or load()
-        self._driver = driver_3_0.SmoothieDriver_3_0_0(config=self.config)
+        self._driver = driver_3_0.SmoothieDriver_3_0_0(
+            config=self.config,
+            streaming=fflags.enable_smoothie_streaming())
         self._attached_modules: Dict[str, Any] = {}  # key is port + model
         self.fw_version = self._driver.get_fw_version()
 
@@ -893,6 +895,11 @@ class Robot(CommandPublisher):
         """
         self.execute_pause()
 
+    def wait_for_motion(self):
+        """ Wait until the robot has finished the moves it has been sent,
+        which with enableSmoothieStreaming may still be running """
+        self._driver.wait_for_motion()
+
     def execute_pause(self):
         """ Pause the driver
 
@@ -1,7 +1,7 @@
 import asyncio
 import contextlib
 import logging
-from typing import (Any, Dict, Iterator, List,
+from typing import (Any, Dict, Iterable, Iterator, List,
                     Optional, Sequence, Set, Tuple, Union)
 from opentrons import types, hardware_control as hc, commands as cmds
 from opentrons.commands import CommandPublisher
@@ -35,7 +35,8 @@ AdvancedLiquidHandling = Union[
     Well,
     types.Location,
     List[Union[Well, types.Location]],
-    List[List[Well]]]
+    List[List[Well]],
+    Iterable[Union[Well, types.Location]]]
 
 
 @requires_version(2, 0)
@@ -1433,7 +1434,7 @@ class InstrumentContext(CommandPublisher):
     @cmds.publish.both(command=cmds.transfer)
     @requires_version(2, 0)
     def transfer(self,
-                 volume: Union[float, Sequence[float]],
+                 volume: Union[float, Sequence[float], Iterable[float]],
                  source: AdvancedLiquidHandling,
                  dest: AdvancedLiquidHandling,
                  trash=True,
@@ -1464,6 +1465,12 @@ class InstrumentContext(CommandPublisher):
                        will be aspirated.
         :param dest: A single well or a list of wells where liquid
                      will be dispensed to.
+
+        ``source``, ``dest`` and ``volume`` may also be iterables without a
+        length, like generators. These are consumed one transfer at a time
+        rather than expanded up front, so very large transfers run in
+        constant memory; in exchange, volume gradients are not available and
+        mismatched lengths are only detected when the shorter one runs out.
         :param \**kwargs: See below
 
         :Keyword Arguments:
@@ -1673,10 +1680,9 @@ class InstrumentContext(CommandPublisher):
         self._log.debug("move_to: {}->{} via:\n\t{}"
                         .format(from_loc, location, moves))
         try:
-            for move in moves:
-                self._hw_manager.hardware.move_to(
-                    self._mount, move[0], critical_point=move[1], speed=speed,
-                    max_speeds=self._ctx.max_speeds.data)
+            self._hw_manager.hardware.move_through(
+                self._mount, moves, speed=speed,
+                max_speeds=self._ctx.max_speeds.data)
         except Exception:
             self._ctx.location_cache = None
             raise
@@ -1966,6 +1972,12 @@ class ModuleContext(CommandPublisher):
         """
         return self._geometry
 
+    def _wait_for_motion(self):
+        # Moves may still be running on the robot (see the
+        # enableSmoothieStreaming setting), and a module shouldn't start
+        # doing something until they have finished
+        self._ctx._hw_manager.hardware.wait_for_motion()
+
     def __repr__(self):
         return "{} at {} lw {}".format(self.__class__.__name__,
                                        self._geometry,
@@ -2018,6 +2030,7 @@ class TemperatureModuleContext(ModuleContext):
 
         :param celsius: The target temperature, in C
         """
+        self._wait_for_motion()
         return self._module.set_temperature(celsius)
 
     @cmds.publish.both(command=cmds.tempdeck_deactivate)
@@ -2025,6 +2038,7 @@ class TemperatureModuleContext(ModuleContext):
     def deactivate(self):
         """ Stop heating (or cooling) and turn off the fan.
         """
+        self._wait_for_motion()
         return self._module.deactivate()
 
     @property  # type: ignore
@@ -2064,6 +2078,7 @@ class MagneticModuleContext(ModuleContext):
         The calibration is used to establish the position of the lawbare on
         top of the magnetic module.
         """
+        self._wait_for_motion()
         self._module.calibrate()
 
     @requires_version(2, 0)
@@ -2115,6 +2130,7 @@ class MagneticModuleContext(ModuleContext):
                 "Currently loaded labware {} does not have a known engage "
                 "height; please specify explicitly with the height param"
                 .format(self.labware))
+        self._wait_for_motion()
         self._module.engage(dist)
 
     @cmds.publish.both(command=cmds.magdeck_disengage)
@@ -2122,6 +2138,7 @@ class MagneticModuleContext(ModuleContext):
     def disengage(self):
         """ Lower the magnets back into the Magnetic Module.
         """
+        self._wait_for_motion()
         self._module.deactivate()
 
     @property  # type: ignore
@@ -2171,6 +2188,7 @@ class ThermocyclerContext(ModuleContext):
     def open_lid(self):
         """ Opens the lid"""
         self._prepare_for_lid_move()
+        self._wait_for_motion()
         self._geometry.lid_status = self._module.open()
         return self._geometry.lid_status
 
@@ -2179,6 +2197,7 @@ class ThermocyclerContext(ModuleContext):
     def close_lid(self):
         """ Closes the lid"""
         self._prepare_for_lid_move()
+        self._wait_for_motion()
         self._geometry.lid_status = self._module.close()
         return self._geometry.lid_status
 
@@ -2214,6 +2233,7 @@ class ThermocyclerContext(ModuleContext):
             specified, the Thermocycler will proceed to the next command
             after ``temperature`` is reached.
         """
+        self._wait_for_motion()
         return self._module.set_temperature(
                 temperature=temperature,
                 hold_time_seconds=hold_time_seconds,
@@ -2234,6 +2254,7 @@ class ThermocyclerContext(ModuleContext):
             ``temperature`` has been reached.
 
         """
+        self._wait_for_motion()
         self._module.set_lid_temperature(temperature)
 
     @cmds.publish.both(command=cmds.thermocycler_execute_profile)
@@ -2270,6 +2291,7 @@ class ThermocyclerContext(ModuleContext):
                 raise ValueError(
                         "either hold_time_minutes or hold_time_seconds must be"
                         "defined for each step in cycle")
+        self._wait_for_motion()
         return self._module.cycle_temperatures(
             steps=steps, repetitions=repetitions)
 
@@ -2277,12 +2299,14 @@ class ThermocyclerContext(ModuleContext):
     @requires_version(2, 0)
     def deactivate_lid(self):
         """ Turn off the heated lid """
+        self._wait_for_motion()
         self._module.stop_lid_heating()
 
     @cmds.publish.both(command=cmds.thermocycler_deactivate_block)
     @requires_version(2, 0)
     def deactivate_block(self):
         """ Turn off the well block """
+        self._wait_for_motion()
         self._module.deactivate()
 
     @cmds.publish.both(command=cmds.thermocycler_deactivate)
@@ -89,7 +89,8 @@ def _find_protocol_error(tb, proto_name):
 def _run_python(
         proto: PythonProtocol, context: ProtocolContext):
     new_locs = locals()
-    new_globs = globals()
+    # A copy, so that nothing the protocol defines outlives it
+    new_globs = dict(globals())
     exec(proto.contents, new_globs, new_locs)
     # If the protocol is written correctly, it will have defined a function
     # like run(context: ProtocolContext). If so, that function is now in the
@@ -117,7 +118,7 @@ def _run_python(
 
 def _run_python_legacy(proto: PythonProtocol, context: ProtocolContext):
     new_locs = locals()
-    new_globs = globals()
+    new_globs = dict(globals())
     namespace_mapping = legacy_wrapper.api.build_globals(context)
     for key, value in namespace_mapping.items():
         setattr(opentrons, key, value)
@@ -18,14 +18,14 @@ from pathlib import Path
 from collections import defaultdict
 from enum import Enum, auto
 from hashlib import sha256
-from itertools import takewhile, dropwhile
+from itertools import dropwhile
 from typing import Any, AnyStr, List, Dict, Optional, Union, Tuple
 
-import jsonschema  # type: ignore
-
 from opentrons.types import Location
 from opentrons.types import Point
 from opentrons.config import CONFIG
+from opentrons.util import schemas
+from opentrons.util.definitions import DefinitionCache
 
 from .util import requires_version
 
@@ -36,10 +36,14 @@ OPENTRONS_NAMESPACE = 'opentrons'
 CUSTOM_NAMESPACE = 'custom_beta'
 STANDARD_DEFS_PATH = Path(sys.modules['opentrons'].__file__).parent /\
     'shared_data' / 'labware' / 'definitions' / '2'
+MODULE_DEFS_PATH = 'shared_data/module/definitions/1.json'
 
 
 LabwareDefinition = Dict[str, Any]
 
+#: Labware and module definitions loaded so far, shared by every context
+definition_cache = DefinitionCache()
+
 
 class OutOfTipsError(Exception):
     pass
@@ -93,6 +97,8 @@ class Well:
             raise ValueError("Wells must have a parent")
         self._parent = parent.labware
         self._has_tip = has_tip
+        # Set if the tip state is kept by the parent labware's TipTracker
+        self._tip_position: Optional[Tuple['TipTracker', int, int]] = None
         self._shape = well_shapes.get(well_props['shape'])
         if self._shape is WellShape.RECTANGULAR:
             self._length = well_props['xDimension']
@@ -117,11 +123,18 @@ class Well:
     @property  # type: ignore
     @requires_version(2, 0)
     def has_tip(self) -> bool:
+        if self._tip_position:
+            tracker, col_idx, row_idx = self._tip_position
+            return tracker.has_tip(col_idx, row_idx)
         return self._has_tip
 
     @has_tip.setter
     def has_tip(self, value: bool):
-        self._has_tip = value
+        if self._tip_position:
+            tracker, col_idx, row_idx = self._tip_position
+            tracker.set_tip(col_idx, row_idx, value)
+        else:
+            self._has_tip = value
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -214,6 +227,129 @@ class Well:
         return hash(self.top().point)
 
 
+class TipTracker:
+    """
+    Tracks which wells of a labware hold tips.
+
+    The state of each column is kept as a bitmask in which bit ``n`` is set if
+    the ``n``th well of the column (counting from the back of the labware)
+    holds a tip, so finding, using or returning a run of tips takes a few
+    integer operations per column. :py:attr:`Well.has_tip` is a view onto
+    this state.
+    """
+    def __init__(self, labware: 'Labware', columns: List[List[Well]]) -> None:
+        self._labware = labware
+        self._columns = columns
+        self._masks: List[int] = []
+        for col_idx, column in enumerate(columns):
+            mask = 0
+            for row_idx, well in enumerate(column):
+                if well._has_tip:
+                    mask |= 1 << row_idx
+                well._tip_position = (self, col_idx, row_idx)
+            self._masks.append(mask)
+        # Every column before this one is known to be empty
+        self._first_occupied = 0
+
+    @staticmethod
+    def _trailing_ones(mask: int) -> int:
+        return (~mask & (mask + 1)).bit_length() - 1
+
+    def _full(self, col_idx: int) -> int:
+        return (1 << len(self._columns[col_idx])) - 1
+
+    def _locate(self, well: Well) -> Tuple[int, int]:
+        position = well._tip_position
+        if position and position[0] is self:
+            return position[1], position[2]
+        # Wells that are equal to but not the same object as one of ours
+        # have to be found the slow way
+        for col_idx, column in enumerate(self._columns):
+            if well in column:
+                return col_idx, column.index(well)
+        raise ValueError(f'{well} is not in {self._labware}')
+
+    def has_tip(self, col_idx: int, row_idx: int) -> bool:
+        return bool(self._masks[col_idx] & (1 << row_idx))
+
+    def set_tip(self, col_idx: int, row_idx: int, value: bool):
+        if value:
+            self._masks[col_idx] |= 1 << row_idx
+            self._first_occupied = min(self._first_occupied, col_idx)
+        else:
+            self._masks[col_idx] &= ~(1 << row_idx)
+
+    def next_tip(self,
+                 num_tips: int = 1,
+                 starting_tip: Well = None) -> Optional[Well]:
+        """ See :py:meth:`Labware.next_tip` """
+        first_col, first_row = self._first_occupied, 0
+        if starting_tip:
+            start_col, start_row = self._locate(starting_tip)
+            if start_col >= first_col:
+                first_col, first_row = start_col, start_row
+        for col_idx in range(first_col, len(self._masks)):
+            mask = self._masks[col_idx]
+            if not mask and col_idx == self._first_occupied:
+                self._first_occupied += 1
+            if col_idx == first_col:
+                mask &= ~((1 << first_row) - 1)
+            if not mask:
+                continue
+            # The first run of tips in the column must be long enough
+            start = (mask & -mask).bit_length() - 1
+            if self._trailing_ones(mask >> start) >= num_tips:
+                return self._columns[col_idx][start]
+        return None
+
+    def previous_tip(self, num_tips: int = 1) -> Optional[Well]:
+        """ See :py:meth:`Labware.previous_tip` """
+        for col_idx, column in enumerate(self._columns):
+            mask = self._masks[col_idx]
+            # Skip the tips at the back of the column; the run of empty wells
+            # after them must be long enough
+            start = self._trailing_ones(mask)
+            if start >= len(column):
+                continue
+            empty = ~mask & self._full(col_idx)
+            if self._trailing_ones(empty >> start) >= num_tips:
+                return column[start]
+        return None
+
+    def use_tips(self, start_well: Well, num_channels: int = 1):
+        """ See :py:meth:`Labware.use_tips` """
+        col_idx, row_idx = self._locate(start_well)
+        # Number of tips to pick up is the lesser of (1) the number of tips
+        # from the starting well to the end of the column, and (2) the number
+        # of channels of the pipette (so a 4-channel pipette would pick up a
+        # max of 4 tips, and picking up from the 2nd-to-bottom well in a
+        # column would get a maximum of 2 tips)
+        num_tips = min(len(self._columns[col_idx]) - row_idx, num_channels)
+        run = ((1 << num_tips) - 1) << row_idx
+        assert self._masks[col_idx] & run == run,\
+            '{} is out of tips'.format(str(self._labware))
+        self._masks[col_idx] &= ~run
+
+    def return_tips(self, start_well: Well, num_channels: int = 1):
+        """ See :py:meth:`Labware.return_tips` """
+        col_idx, row_idx = self._locate(start_well)
+        num_tips = min(len(self._columns[col_idx]) - row_idx, num_channels)
+        run = ((1 << num_tips) - 1) << row_idx
+        occupied = self._masks[col_idx] & run
+        if occupied:
+            well = self._columns[col_idx][
+                (occupied & -occupied).bit_length() - 1]
+            raise AssertionError(f'Well {repr(well)} has a tip')
+        self._masks[col_idx] |= run
+        self._first_occupied = min(self._first_occupied, col_idx)
+
+    def reset(self):
+        """ Put a tip in every well """
+        self._masks = [self._full(col_idx)
+                       for col_idx in range(len(self._columns))]
+        self._first_occupied = 0
+
+
 @requires_version(2, 0)
 class Labware:
     """
@@ -269,7 +405,8 @@ class Labware:
         self._wells: List[Well] = []
         # Directly from definition
         self._well_definition = definition['wells']
-        self._parameters = definition['parameters']
+        # Copied, since the tip length can be changed per labware
+        self._parameters = dict(definition['parameters'])
         offset = definition['cornerOffsetFromSlot']
         self._dimensions = definition['dimensions']
         # Inferred from definition
@@ -279,14 +416,14 @@ class Labware:
         self._offset\
             = Point(offset['x'], offset['y'], offset['z']) + parent.point
         self._parent = parent.labware
+        self._pattern = re.compile(r'^([A-Z]+)([1-9][0-9]*)$', re.X)
         # Applied properties
         self.set_calibration(self._calibrated_offset)
 
-        self._pattern = re.compile(r'^([A-Z]+)([1-9][0-9]*)$', re.X)
         self._definition = definition
 
     def __getitem__(self, key: str) -> Well:
-        return self.wells_by_name()[key]
+        return self._wells_by_name[key]
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -344,6 +481,25 @@ class Labware:
                 self.is_tiprack)
             for well in self._ordering]
 
+    def _index_wells(self):
+        """
+        Build the look-up tables of wells by name, row and column that are
+        shared by all accessor functions. Like :py:meth:`_build_wells`, this
+        is only called again if a new offset needs to be applied.
+        """
+        self._wells_by_name: Dict[str, Well] = dict(
+            zip(self._ordering, self._wells))
+        self._rows_by_name: Dict[str, List[Well]]\
+            = self._create_indexed_dictionary(group=1)
+        self._row_names = sorted(self._rows_by_name)
+        self._columns_by_name: Dict[str, List[Well]]\
+            = self._create_indexed_dictionary(group=2)
+        self._column_names = sorted(self._columns_by_name,
+                                    key=lambda x: int(x))
+        self._columns = [self._columns_by_name[name]
+                         for name in self._column_names]
+        self._tip_tracker = TipTracker(self, self._columns)
+
     def _create_indexed_dictionary(self, group=0):
         """
         Creates a dict of lists of Wells. Which way the labware is segmented
@@ -366,6 +522,7 @@ class Labware:
                                         y=self._offset.y + delta.y,
                                         z=self._offset.z + delta.z)
         self._wells = self._build_wells()
+        self._index_wells()
 
     @property  # type: ignore
     @requires_version(2, 0)
@@ -378,7 +535,7 @@ class Labware:
         if isinstance(idx, int):
             res = self._wells[idx]
         elif isinstance(idx, str):
-            res = self.wells_by_name()[idx]
+            res = self._wells_by_name[idx]
         else:
             res = NotImplemented
         return res
@@ -406,7 +563,7 @@ class Labware:
         elif isinstance(args[0], int):
             res = [self._wells[idx] for idx in args]
         elif isinstance(args[0], str):
-            res = [self.wells_by_name()[idx] for idx in args]
+            res = [self._wells_by_name[idx] for idx in args]
         else:
             raise TypeError
         return res
@@ -422,8 +579,7 @@ class Labware:
 
         :return: Dictionary of well objects keyed by well name
         """
-        return {well: wellObj
-                for well, wellObj in zip(self._ordering, self._wells)}
+        return dict(self._wells_by_name)
 
     @requires_version(2, 0)
     def wells_by_index(self) -> Dict[str, Well]:
@@ -449,15 +605,15 @@ class Labware:
 
         :return: A list of row lists
         """
-        row_dict = self._create_indexed_dictionary(group=1)
-        keys = sorted(row_dict)
+        row_dict = self._rows_by_name
+        keys = self._row_names
 
         if not args:
-            res = [row_dict[key] for key in keys]
+            res = [list(row_dict[key]) for key in keys]
         elif isinstance(args[0], int):
-            res = [row_dict[keys[idx]] for idx in args]
+            res = [list(row_dict[keys[idx]]) for idx in args]
         elif isinstance(args[0], str):
-            res = [row_dict[idx] for idx in args]
+            res = [list(row_dict[idx]) for idx in args]
         else:
             raise TypeError
         return res
@@ -473,8 +629,8 @@ class Labware:
 
         :return: Dictionary of Well lists keyed by row name
         """
-        row_dict = self._create_indexed_dictionary(group=1)
-        return row_dict
+        return defaultdict(list, {name: list(row) for name, row
+                                  in self._rows_by_name.items()})
 
     @requires_version(2, 0)
     def rows_by_index(self) -> Dict[str, List[Well]]:
@@ -501,15 +657,15 @@ class Labware:
 
         :return: A list of column lists
         """
-        col_dict = self._create_indexed_dictionary(group=2)
-        keys = sorted(col_dict, key=lambda x: int(x))
+        col_dict = self._columns_by_name
+        keys = self._column_names
 
         if not args:
-            res = [col_dict[key] for key in keys]
+            res = [list(col_dict[key]) for key in keys]
         elif isinstance(args[0], int):
-            res = [col_dict[keys[idx]] for idx in args]
+            res = [list(col_dict[keys[idx]]) for idx in args]
         elif isinstance(args[0], str):
-            res = [col_dict[idx] for idx in args]
+            res = [list(col_dict[idx]) for idx in args]
         else:
             raise TypeError
         return res
@@ -526,8 +682,8 @@ class Labware:
 
         :return: Dictionary of Well lists keyed by column name
         """
-        col_dict = self._create_indexed_dictionary(group=2)
-        return col_dict
+        return defaultdict(list, {name: list(column) for name, column
+                                  in self._columns_by_name.items()})
 
     @requires_version(2, 0)
     def columns_by_index(self) -> Dict[str, List[Well]]:
@@ -576,35 +732,7 @@ class Labware:
         :return: the :py:class:`.Well` meeting the target criteria, or None
         """
         assert num_tips > 0, 'Bad call to next_tip: num_tips <= 0'
-
-        columns: List[List[Well]] = self.columns()
-
-        if starting_tip:
-            # Remove columns preceding the one with the pipette's starting tip
-            drop_undefined_columns = list(
-                dropwhile(lambda x: starting_tip not in x, columns))
-            # Remove tips preceding the starting tip in the first column
-            drop_undefined_columns[0] = list(
-                dropwhile(lambda w: starting_tip is not w,
-                          drop_undefined_columns[0]))
-            columns = drop_undefined_columns
-
-        drop_leading_empties = [
-            list(dropwhile(lambda x: not x.has_tip, column))
-            for column in columns]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: x.has_tip, column))
-            for column in drop_leading_empties]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips]
-
-        try:
-            first_long_enough = long_enough[0]
-            result: Optional[Well] = first_long_enough[0]
-        except IndexError:
-            result = None
-
-        return result
+        return self._tip_tracker.next_tip(num_tips, starting_tip)
 
     def use_tips(self, start_well: Well, num_channels: int = 1):
         """
@@ -627,24 +755,7 @@ class Labware:
         :type num_channels: int
         """
         assert num_channels > 0, 'Bad call to use_tips: num_channels<=0'
-        # Select the column of the labware that contains the target well
-        target_column: List[Well] = [
-            col for col in self.columns() if start_well in col][0]
-
-        well_idx = target_column.index(start_well)
-        # Number of tips to pick up is the lesser of (1) the number of tips
-        # from the starting well to the end of the column, and (2) the number
-        # of channels of the pipette (so a 4-channel pipette would pick up a
-        # max of 4 tips, and picking up from the 2nd-to-bottom well in a
-        # column would get a maximum of 2 tips)
-        num_tips = min(len(target_column) - well_idx, num_channels)
-        target_wells = target_column[well_idx: well_idx + num_tips]
-
-        assert all([well.has_tip for well in target_wells]),\
-            '{} is out of tips'.format(str(self))
-
-        for well in target_wells:
-            well.has_tip = False
+        self._tip_tracker.use_tips(start_well, num_channels)
 
     def __repr__(self):
         return self._display_name
@@ -663,20 +774,7 @@ class Labware:
         """
         # This logic is the inverse of :py:meth:`next_tip`
         assert num_tips > 0, 'Bad call to previous_tip: num_tips <= 0'
-
-        columns = self.columns()
-        drop_leading_filled = [
-            list(dropwhile(lambda x: x.has_tip, column))
-            for column in columns]
-        drop_at_first_gap = [
-            list(takewhile(lambda x: not x.has_tip, column))
-            for column in drop_leading_filled]
-        long_enough = [
-            column for column in drop_at_first_gap if len(column) >= num_tips]
-        try:
-            return long_enough[0][0]
-        except IndexError:
-            return None
+        return self._tip_tracker.previous_tip(num_tips)
 
     def return_tips(self, start_well: Well, num_channels: int = 1):
         """
@@ -700,24 +798,14 @@ class Labware:
         """
         # This logic is the inverse of :py:meth:`use_tips`
         assert num_channels > 0, 'Bad call to return_tips: num_channels <= 0'
-        # Select the column that contains the target_well
-        target_column = [col for col in self.columns() if start_well in col][0]
-        well_idx = target_column.index(start_well)
-        end_idx = min(well_idx + num_channels, len(target_column))
-        drop_targets = target_column[well_idx:end_idx]
-        for well in drop_targets:
-            if well.has_tip:
-                raise AssertionError(f'Well {repr(well)} has a tip')
-        for well in drop_targets:
-            well.has_tip = True
+        self._tip_tracker.return_tips(start_well, num_channels)
 
     @requires_version(2, 0)
     def reset(self):
         """Reset all tips in a tiprack
         """
         if self.is_tiprack:
-            for well in self.wells():
-                well.has_tip = True
+            self._tip_tracker.reset()
 
 
 class ModuleGeometry:
@@ -862,7 +950,7 @@ class ThermocyclerGeometry(ModuleGeometry):
     # NOTE: this func is unused until "semi" configuration
     def labware_accessor(self, labware: Labware) -> Labware:
         # Block first three columns from being accessed
-        definition = labware._definition
+        definition = dict(labware._definition)
         definition['ordering'] = definition['ordering'][3::]
         return Labware(definition, super().location)
 
@@ -1110,17 +1198,20 @@ def _get_standard_labware_definition(
     namespace = namespace.lower()
     def_path = _get_path_to_labware(load_name, namespace, checked_version)
 
-    try:
+    def load_file() -> LabwareDefinition:
         with open(def_path, 'rb') as f:
-            labware_def = json.loads(f.read().decode('utf-8'))
+            return json.loads(f.read().decode('utf-8'))
+
+    # Definitions in the wheel never change, but custom ones might
+    watch = [] if namespace == OPENTRONS_NAMESPACE else [def_path]
+    try:
+        return definition_cache.get(def_path, load_file, watch)
     except FileNotFoundError:
         raise FileNotFoundError(
             f'Labware "{load_name}" not found with version {checked_version} '
             f'in namespace "{namespace}".'
         )
 
-    return labware_def
-
 
 def verify_definition(contents: Union[AnyStr, LabwareDefinition])\
         -> LabwareDefinition:
@@ -1133,18 +1224,11 @@ def verify_definition(contents: Union[AnyStr, LabwareDefinition])\
     :raises jsonschema.ValidationError: If the definition is not valid.
     :returns: The parsed definition
     """
-    schema_body = pkgutil.get_data(  # type: ignore
-        'opentrons',
-        'shared_data/labware/schemas/2.json').decode('utf-8')
-    labware_schema_v2 = json.loads(schema_body)
-
     if isinstance(contents, dict):
         to_return = contents
-        jsonschema.validate(to_return, labware_schema_v2)
-
     else:
         to_return = json.loads(contents)
-        jsonschema.validate(to_return, labware_schema_v2)
+    schemas.validate(to_return, schemas.LABWARE_SCHEMA_V2)
     return to_return
 
 
@@ -1168,6 +1252,9 @@ def get_labware_definition(
         finding labware definitions, if specified
     :param extra_defs: An extra set of definitions (in addition to the system
         definitions) in which to search
+    :returns: The definition. System definitions are shared and frozen (see
+        :py:mod:`opentrons.util.definitions`), so use :py:func:`copy.deepcopy`
+        to get one that can be changed.
     """
     load_name = load_name.lower()
 
@@ -1296,10 +1383,11 @@ def load_module(name: str, parent: Location) -> ModuleGeometry:
                    the front and left most point of the outside of the module
                    is (often the front-left corner of a slot on the deck).
     """
-    def_path = 'shared_data/module/definitions/1.json'
-    module_def = json.loads(
-        pkgutil.get_data(  # type: ignore
-            'opentrons', def_path).decode('utf-8'))  # type: ignore
+    module_def = definition_cache.get(
+        MODULE_DEFS_PATH,
+        lambda: json.loads(
+            pkgutil.get_data(  # type: ignore
+                'opentrons', MODULE_DEFS_PATH).decode('utf-8')))
     return load_module_from_definition(module_def[name], parent)
 
 
@@ -1336,14 +1424,15 @@ def select_tiprack_from_list(
 
     if starting_point:
         assert starting_point.parent is first
-    else:
-        starting_point = first.wells()[0]
 
     next_tip = first.next_tip(num_channels, starting_point)
     if next_tip:
         return first, next_tip
-    else:
-        return select_tiprack_from_list(rest, num_channels)
+    for tiprack in rest:
+        next_tip = tiprack.next_tip(num_channels)
+        if next_tip:
+            return tiprack, next_tip
+    raise OutOfTipsError
 
 
 def filter_tipracks_to_start(
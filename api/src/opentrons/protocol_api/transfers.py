@@ -1,6 +1,8 @@
+import collections
 import enum
+import itertools
 from typing import (Any, Dict, List, Optional, Union, NamedTuple,
-                    Callable, Generator, Iterator, Tuple,
+                    Callable, Generator, Iterable, Iterator, Sized, Tuple,
                     TYPE_CHECKING)
 from .labware import Well
 from opentrons import types
@@ -9,6 +11,48 @@ if TYPE_CHECKING:
     from .contexts import InstrumentContext  #noqa (F501)
 
 
+def _is_iterable(obj) -> bool:
+    return isinstance(obj, Iterable) and not isinstance(obj, (str, bytes))
+
+
+def _is_lazy(obj) -> bool:
+    """ Whether ``obj`` is an iterable without a known length (like a
+    generator) that should be consumed as the transfer goes rather than
+    expanded up front
+    """
+    return _is_iterable(obj) and not isinstance(obj, Sized)
+
+
+def _first(locations: Iterable):
+    for loc in locations:
+        return loc
+    raise ValueError('Transfer needs at least one source and destination')
+
+
+_MISSING = object()
+
+
+def _zip_equal(*iterables: Iterable, error: Exception) -> Iterator[Tuple]:
+    """ Like :py:func:`zip` but raises ``error`` (once the shortest input
+    runs out) instead of silently dropping the rest of the longer inputs
+    """
+    for items in itertools.zip_longest(*iterables, fillvalue=_MISSING):
+        if any(item is _MISSING for item in items):
+            raise error
+        yield items
+
+
+class _Reiterable:
+    """ An iterable that calls ``factory`` for a new iterator each time it is
+    iterated, so a plan over a re-iterable input can be iterated more than once
+    """
+    def __init__(self, factory: Callable[[], Iterator]) -> None:
+        self._factory = factory
+
+    def __iter__(self) -> Iterator:
+        return self._factory()
+
+
 class MixStrategy(enum.Enum):
     BOTH = enum.auto()
     BEFORE = enum.auto()
@@ -352,9 +396,11 @@ class TransferPlan:
 
     It handles calculations based on pipette channels, tip management, and all
     the various little commands that can be involved in a transfer. It can be
-    iterated to resolve methods to call to execute the plan.
+    iterated to resolve methods to call to execute the plan, or dry run with
+    :py:meth:`count`. Sources, dests and volumes without a length (like
+    generators) are only expanded as the plan is iterated.
     """
-    def __init__(self,
+    def __init__(self,  # noqa(C901)
                  volume,
                  sources,
                  dests,
@@ -370,6 +416,34 @@ class TransferPlan:
         :py:meth:`.InstrumentContext.transfer`.
         """
         self._instr = instr
+        self._options = options or TransferOptions()
+        self._strategy = self._options.transfer
+        self._tip_opts = self._options.pick_up_tip
+        self._blow_opts = self._options.blow_out
+        self._touch_tip_opts = self._options.touch_tip
+        self._mix_before_opts = self._options.mix.mix_before
+        self._mix_after_opts = self._options.mix.mix_after
+        self._max_volume = max_volume
+
+        # Sources and dests given as lists (or single locations) are
+        # normalized and checked here. Anything else that is iterable, like a
+        # generator, is kept as-is and only flattened and filtered while the
+        # plan is iterated, so a transfer over a very long stream of wells
+        # never holds all of them (or all of its steps) in memory.
+        multichannel = self._instr.hw_pipette['channels'] > 1
+        if _is_lazy(sources) or _is_lazy(dests):
+            self._sources = self._lazy_locations(sources, multichannel)
+            self._dests = self._lazy_locations(dests, multichannel)
+            self._volumes = self._create_lazy_volumes(volume)
+            self._check_volumes = not isinstance(volume, (float, int))
+            if mode:
+                self._mode = TransferMode[mode.upper()]
+            else:
+                # Without lengths to compare there is no way to tell a
+                # distribute or consolidate apart from a plain transfer
+                self._mode = TransferMode.TRANSFER
+            return
+
         # Convert sources & dests into proper format
         # CASES:
         # i. if using multi-channel pipette,
@@ -377,7 +451,7 @@ class TransferPlan:
         # then avoid iterating through its Wells.
         # ii. if using single channel pipettes, flatten a multi-dimensional
         # list of Wells into a 1 dimensional list of Wells
-        if self._instr.hw_pipette['channels'] > 1:
+        if multichannel:
             sources, dests = self._multichannel_transfer(sources, dests)
         else:
             if isinstance(sources, List) and isinstance(sources[0], List):
@@ -394,17 +468,14 @@ class TransferPlan:
 
         total_xfers = max(len(sources), len(dests))
 
-        self._volumes = self._create_volume_list(volume, total_xfers)
+        if _is_lazy(volume):
+            self._volumes = volume
+            self._check_volumes = True
+        else:
+            self._volumes = self._create_volume_list(volume, total_xfers)
+            self._check_volumes = False
         self._sources = sources
         self._dests = dests
-        self._options = options or TransferOptions()
-        self._strategy = self._options.transfer
-        self._tip_opts = self._options.pick_up_tip
-        self._blow_opts = self._options.blow_out
-        self._touch_tip_opts = self._options.touch_tip
-        self._mix_before_opts = self._options.mix.mix_before
-        self._mix_after_opts = self._options.mix.mix_after
-        self._max_volume = max_volume
 
         if not mode:
             if len(sources) < len(dests):
@@ -428,6 +499,17 @@ class TransferPlan:
             else:
                 yield self._format_dict('drop_tip')
 
+    def count(self) -> Dict[str, int]:
+        """ Dry run the plan, counting the commands it would run by method
+        name (for instance ``'aspirate'``, ``'dispense'``, ``'pick_up_tip'``
+        or ``'drop_tip'``) without executing or storing them.
+
+        Sources, dests or volumes given as one-shot iterators (like
+        generators) are consumed by the count; pass lists or other
+        re-iterable collections to count a plan and then execute it.
+        """
+        return dict(collections.Counter(cmd['method'] for cmd in self))
+
     def _plan_transfer(self):
         """
         * **Source/ Dest:** Multiple sources to multiple destinations.
@@ -460,10 +542,14 @@ class TransferPlan:
             -> Blow out -> Touch tip -> Drop tip*
         """
         # reform source target lists
-        sources, dests = self._extend_source_target_lists(
-            self._sources, self._dests)
+        if isinstance(self._sources, List) and isinstance(self._dests, List):
+            sources, dests = self._extend_source_target_lists(
+                self._sources, self._dests)
+            pairs: Iterable[Tuple] = zip(sources, dests)
+        else:
+            pairs = self._pair_lazy_source_target(self._sources, self._dests)
         plan_iter = self._expand_for_volume_constraints(
-            self._volumes, zip(sources, dests),
+            self._with_volumes(pairs),
             self._instr.max_volume
             - self._strategy.disposal_volume
             - self._strategy.air_gap)
@@ -502,6 +588,24 @@ class TransferPlan:
                        for i in range(int(len(sources)/len(targets)))]
         return sources, targets
 
+    @staticmethod
+    def _pair_lazy_source_target(
+            sources: Iterable[Union[Well, types.Location]],
+            targets: Iterable[Union[Well, types.Location]])\
+            -> Iterator[Tuple]:
+        """Pair up sources and targets as they are consumed when at least one
+        of them is lazy. A single source or target is paired with everything on
+        the other side; otherwise both sides must be the same length.
+        """
+        if isinstance(sources, List) and len(sources) == 1:
+            return ((sources[0], target) for target in targets)
+        if isinstance(targets, List) and len(targets) == 1:
+            return ((source, targets[0]) for source in sources)
+        return _zip_equal(
+            sources, targets,
+            error=ValueError('Source and destination lists must be the same '
+                             'length when either is an iterator'))
+
     def _plan_distribute(self):
         """
         * **Source/ Dest:** One source to many destinations
@@ -544,8 +648,9 @@ class TransferPlan:
         # recommend users to specify a disposal vol when using distribute.
         # First method keeps distribute consistent with current behavior while
         # the other maintains consistency in default behaviors of all functions
+        source = _first(self._sources)
         plan_iter = self._expand_for_volume_constraints(
-            self._volumes, self._dests,
+            self._with_volumes(self._dests),
             self._instr.max_volume
             - self._strategy.disposal_volume
             - self._strategy.air_gap)
@@ -567,7 +672,7 @@ class TransferPlan:
                 done = True
             yield from self._aspirate_actions(sum(a[0] for a in asp_grouped) +
                                               self._strategy.disposal_volume,
-                                              self._sources[0])
+                                              source)
             for step in asp_grouped:
                 yield from self._dispense_actions(step[0], step[1],
                                                   step is not asp_grouped[-1])
@@ -575,13 +680,12 @@ class TransferPlan:
 
     @staticmethod
     def _expand_for_volume_constraints(
-            volumes: Iterator[float],
-            targets: Iterator[Well],
-            max_volume: float) -> Generator[Tuple[float, Well], None, None]:
-        """ Split a sequence of proposed transfers if necessary to keep each
-        transfer under the given max volume.
+            transfers: Iterable[Tuple[float, Any]],
+            max_volume: float) -> Generator[Tuple[float, Any], None, None]:
+        """ Split a sequence of proposed (volume, target) transfers if
+        necessary to keep each transfer under the given max volume.
         """
-        for volume, target in zip(volumes, targets):
+        for volume, target in transfers:
             while volume > max_volume * 2:
                 yield max_volume, target
                 volume -= max_volume
@@ -628,8 +732,9 @@ class TransferPlan:
                *.. Aspirate -> Air gap -> Touch tip ->..
                .. Aspirate -> .....*
         """
+        dest = _first(self._dests)
         plan_iter = self._expand_for_volume_constraints(
-            self._volumes, self._sources, self._instr.max_volume)
+            self._with_volumes(self._sources), self._instr.max_volume)
         current_xfer = next(plan_iter)
         if self._strategy.new_tip == types.TransferTipPolicy.ALWAYS:
             yield self._format_dict('pick_up_tip', kwargs=self._tip_opts)
@@ -655,7 +760,7 @@ class TransferPlan:
             yield from self._dispense_actions(
                 sum([a[0] + self._strategy.air_gap for a in asp_grouped])
                 - self._strategy.air_gap,
-                self._dests[0])
+                dest)
         yield from self._new_tip_action()
 
     def _aspirate_actions(self, vol, loc):
@@ -762,6 +867,62 @@ class TransferPlan:
                                    "of transfers")
             return volume
 
+    def _create_lazy_volumes(self, volume):
+        if isinstance(volume, (float, int)):
+            return itertools.repeat(volume)
+        elif isinstance(volume, tuple):
+            raise ValueError("A volume gradient needs a known number of "
+                             "transfers, so sources and destinations must "
+                             "be lists to use one")
+        elif not _is_iterable(volume):
+            raise TypeError("Volume expected as a number or an iterable"
+                            " of numbers but got {}".format(volume))
+        return volume
+
+    def _with_volumes(self, targets: Iterable) -> Iterator[Tuple]:
+        """ Pair each target with its volume, checking that there are as many
+        volumes as targets if that could not be checked up front.
+        """
+        if not self._check_volumes:
+            return zip(self._volumes, targets)
+        return _zip_equal(
+            self._volumes, targets,
+            error=RuntimeError("List of volumes should be equal to number "
+                               "of transfers"))
+
+    def _lazy_locations(self, locations, multichannel: bool):
+        """ Lazily flatten ``locations`` into individual wells or locations,
+        keeping only first-row wells for a multichannel pipette.
+        """
+        if isinstance(locations, (Well, types.Location)):
+            return [locations]
+        if not _is_iterable(locations):
+            raise TypeError('Expected a Well, Location or an iterable of them'
+                            ' but got {}'.format(locations))
+        if not _is_lazy(locations):
+            # Already in memory; flatten and filter it now like the eager
+            # path does so it can be indexed and counted
+            return list(self._iter_locations(locations, multichannel))
+        return _Reiterable(
+            lambda: self._iter_locations(locations, multichannel))
+
+    def _iter_locations(self, locations, multichannel: bool):
+        for item in locations:
+            if isinstance(item, (Well, types.Location)):
+                group: Iterable = (item,)
+            else:
+                group = item
+            for loc in group:
+                if not multichannel:
+                    yield loc
+                else:
+                    assert isinstance(loc, Well),\
+                        'Multichannel locations should be Wells but got {}'\
+                        .format(loc)
+                    # For now, just use wells that are in first row
+                    if self._is_first_row(loc):
+                        yield loc
+
     def _create_volume_gradient(self, min_v, max_v, total, gradient=None):
 
         diff_vol = max_v - min_v
@@ -814,4 +975,4 @@ class TransferPlan:
         return new_src, new_dst
 
     def _is_first_row(self, well: Well):
-        return well in well.parent.rows()[0]
+        return well in well.parent.rows(0)[0]
@@ -4,7 +4,7 @@ import logging
 from typing import Any, Callable, Optional, TYPE_CHECKING, TypeVar, Union
 
 from opentrons.protocols.types import APIVersion
-from opentrons.hardware_control import types, adapters, API, HardwareAPILike
+from opentrons.hardware_control import types, adapters, HardwareAPILike
 
 if TYPE_CHECKING:
     from .contexts import InstrumentContext
@@ -180,8 +180,7 @@ class HardwareManager:
     def __init__(self, hardware):
         if None is hardware:
             self._is_orig = True
-            self._current = adapters.SynchronousAdapter.build(
-                API.build_hardware_simulator)
+            self._current = adapters.simulator_pool.acquire()
         elif isinstance(hardware, adapters.SynchronousAdapter):
             self._is_orig = False
             self._current = hardware
@@ -194,9 +193,7 @@ class HardwareManager:
         return self._current
 
     def set_hw(self, hardware):
-        if self._is_orig:
-            self._is_orig = False
-            self._current.join()
+        self.release()
         if isinstance(hardware, adapters.SynchronousAdapter):
             self._current = hardware
         elif isinstance(hardware, HardwareAPILike):
@@ -208,18 +205,23 @@ class HardwareManager:
         return self._current
 
     def reset_hw(self):
-        if self._is_orig:
-            self._current.join()
-        self._current = adapters.SynchronousAdapter.build(
-            API.build_hardware_simulator)
+        self.release()
+        self._current = adapters.simulator_pool.acquire()
         self._is_orig = True
         return self._current
 
+    def release(self):
+        """ Give back the simulator built for this manager, if it is still
+        using it. Its hardware must not be used afterwards. """
+        if self._is_orig:
+            self._is_orig = False
+            adapters.simulator_pool.release(self._current)
+
     def __del__(self):
         orig = getattr(self, '_is_orig', False)
         cur = getattr(self, '_current', None)
         if orig and cur:
-            cur.join()
+            adapters.simulator_pool.release(cur)
 
 
 def clamp_value(
@@ -5,21 +5,27 @@ opentrons.protocols.parse: functions and state for parsing protocols
 import ast
 import itertools
 import json
-import pkgutil
 import re
+from hashlib import sha256
 from io import BytesIO
 from zipfile import ZipFile
-from typing import Any, Dict, Union
-
-import jsonschema  # type: ignore
+from typing import Any, Dict, Tuple, Union
 
 from opentrons.config import feature_flags as ff
+from opentrons.util import schemas
+from opentrons.util.definitions import DefinitionCache
 from .types import Protocol, PythonProtocol, JsonProtocol, Metadata, APIVersion
 from .bundle import extract_bundle
 
 # match e.g. "2.0" but not "hi", "2", "2.0.1"
 API_VERSION_RE = re.compile(r'^(\d+)\.(\d+)$')
 
+#: How many parsed protocols to keep
+PARSED_CACHE_SIZE = 64
+#: The compiled code, metadata and api level of python protocols, and the
+#: schema version of valid json protocols, keyed by a hash of their text
+parsed_cache = DefinitionCache(maxsize=PARSED_CACHE_SIZE)
+
 
 def version_from_string(vstr: str) -> APIVersion:
     """ Parse an API version from a string
@@ -37,11 +43,19 @@ def version_from_string(vstr: str) -> APIVersion:
         major=int(matches.group(1)), minor=int(matches.group(2)))
 
 
+def _digest(protocol_contents: str) -> str:
+    return sha256(protocol_contents.encode('utf-8')).hexdigest()
+
+
 def _parse_json(
         protocol_contents: str, filename: str = None) -> JsonProtocol:
     """ Parse a protocol known or at least suspected to be json """
     protocol_json = json.loads(protocol_contents)
-    version = validate_json(protocol_json)
+    # Only the version is cached; the contents are decoded each time so
+    # every caller gets its own copy
+    version = parsed_cache.get(
+        ('json', _digest(protocol_contents)),
+        lambda: validate_json(protocol_json))
     return JsonProtocol(
         text=protocol_contents, filename=filename, contents=protocol_json,
         schema_version=version)
@@ -62,17 +76,15 @@ def _parse_python(
     else:
         ast_filename = filename_checked
 
-    parsed = ast.parse(protocol_contents,
-                       filename=ast_filename)
-    metadata = extract_metadata(parsed)
-    protocol = compile(parsed, filename=ast_filename, mode='exec')
-    version = get_version(metadata, parsed)
+    protocol, metadata, version = parsed_cache.get(
+        ('python', _digest(protocol_contents), ast_filename),
+        lambda: _compile_python(protocol_contents, ast_filename))
 
     result = PythonProtocol(
         text=protocol_contents,
         filename=getattr(protocol, 'co_filename', '<protocol>'),
         contents=protocol,
-        metadata=metadata,
+        metadata=dict(metadata),
         api_level=version,
         bundled_labware=bundled_labware,
         bundled_data=bundled_data,
@@ -82,6 +94,18 @@ def _parse_python(
     return result
 
 
+def _compile_python(
+        protocol_contents: str,
+        ast_filename: str) -> Tuple[Any, Metadata, APIVersion]:
+    """ Compile a python protocol and find its metadata and api level """
+    parsed = ast.parse(protocol_contents,
+                       filename=ast_filename)
+    metadata = extract_metadata(parsed)
+    protocol = compile(parsed, filename=ast_filename, mode='exec')
+    version = get_version(metadata, parsed)
+    return protocol, metadata, version
+
+
 def _parse_bundle(bundle: ZipFile, filename: str = None) -> PythonProtocol:  # noqa: C901
     """ Parse a bundled Python protocol """
     if not ff.use_protocol_api_v2():
@@ -282,15 +306,10 @@ def _get_schema_for_protocol(version_num: int) -> Dict[Any, Any]:
             f'JSON Protocol version {version_num} is not yet ' +
             'supported in this version of the API')
     try:
-        schema = pkgutil.get_data(
-            'opentrons',
-            f'shared_data/protocol/schemas/{version_num}.json')
+        return schemas.load_schema(schemas.protocol_schema_path(version_num))
     except FileNotFoundError:
-        schema = None
-    if not schema:
         raise RuntimeError('JSON Protocol schema "{}" does not exist'
                            .format(version_num))
-    return json.loads(schema.decode('utf-8'))
 
 
 def validate_json(protocol_json: Dict[Any, Any]) -> int:
@@ -302,19 +321,7 @@ def validate_json(protocol_json: Dict[Any, Any]) -> int:
             'deprecated. Please upload your protocol into Protocol '
             'Designer and save it to migrate the protocol to a later '
             'version.')
-    protocol_schema = _get_schema_for_protocol(version_num)
-    # instruct schema how to resolve all $ref's used in protocol schemas
-    schema_body = pkgutil.get_data(  # type: ignore
-        'opentrons',
-        'shared_data/labware/schemas/2.json').decode('utf-8')
-    labware_schema_v2 = json.loads(schema_body)
-
-    resolver = jsonschema.RefResolver(
-        protocol_schema.get('$id', ''),
-        protocol_schema,
-        store={
-            "opentronsLabwareSchemaV2": labware_schema_v2
-        })
-    # do the validation
-    jsonschema.validate(protocol_json, protocol_schema, resolver=resolver)
+    # check the schema exists and is supported
+    _get_schema_for_protocol(version_num)
+    schemas.validate(protocol_json, schemas.protocol_schema_path(version_num))
     return version_num
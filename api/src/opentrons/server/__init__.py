@@ -85,6 +85,26 @@ class ThreadedAsyncLock:
         self._thread_lock.release()
 
 
+async def start_module_watch(app):
+    # Only the hardware controller (and not an adapter that blocks on its
+    # calls) can watch for modules from the server's loop
+    watch_modules = getattr(
+        app['com.opentrons.hardware'], 'watch_modules', None)
+    if asyncio.iscoroutinefunction(watch_modules):
+        app['com.opentrons.module_watch'] = asyncio.ensure_future(
+            watch_modules())
+
+
+async def stop_module_watch(app):
+    watch = app.get('com.opentrons.module_watch')
+    if watch:
+        watch.cancel()
+        try:
+            await watch
+        except asyncio.CancelledError:
+            pass
+
+
 # Support for running using aiohttp CLI.
 # See: https://docs.aiohttp.org/en/stable/web.html#command-line-interface-cli
 def init(hardware: 'HardwareAPILike' = None,
@@ -117,7 +137,9 @@ def init(hardware: 'HardwareAPILike' = None,
             except Exception:
                 log.exception(f"failed to remove app temp path {temppath}")
 
+    app.on_startup.append(start_module_watch)
     app.on_shutdown.append(dispose_response_file_tempdir)
+    app.on_shutdown.append(stop_module_watch)
     app.on_shutdown.freeze()
     return app
 
@@ -1,4 +1,5 @@
 import asyncio
+import contextlib
 import functools
 import os
 import json
@@ -186,6 +187,150 @@ async def get_module_data(request):
         return web.json_response({"message": "Module not found"}, status=404)
 
 
+async def _find_module(request):
+    hw = hw_from_req(request)
+    requested_serial = request.match_info['serial']
+    for module in await hw.discover_modules():
+        if module.device_info.get('serial') == requested_serial:
+            return module
+    return None
+
+
+def _parse_since(request):
+    since = request.query.get('since')
+    if since is None:
+        return None
+    return float(since)
+
+
+async def _find_module_history(request):
+    """ Work out whose history a request is for, and since when.
+
+    :returns: An error response (or ``None``), the module and the ``since``
+              time (or ``None`` if it wasn't given)
+    """
+    if not ff.use_protocol_api_v2():
+        return web.json_response(
+            {"message": "Module history is not available via APIv1 server"},
+            status=501), None, None
+    try:
+        since = _parse_since(request)
+    except ValueError:
+        return web.json_response(
+            {"message": "since must be a number of seconds since the epoch"},
+            status=400), None, None
+    module = await _find_module(request)
+    if not module:
+        return web.json_response(
+            {"message": "Module not found"}, status=404), None, None
+    return None, module, since
+
+
+async def get_module_data_history(request):
+    """
+    Query a module (by its serial number) for the samples of its live data
+    recorded since a time, oldest first
+
+    GET /modules/{serial}/data/history?since=<seconds since the epoch>
+
+    If `since` is not given, all the samples the module still holds are
+    returned.
+
+    On success:
+    # status: 200
+    {
+        "fields": ["currentTemp", "targetTemp"],
+        "samples": [
+            {"timestamp": 1571234567.89, "currentTemp": 25.1,
+             "targetTemp": null},
+            // ...
+        ]
+    }
+    """
+    error, module, since = await _find_module_history(request)
+    if error is not None:
+        return error
+    history = module.history
+    _, samples = history.since(since or 0)
+    return web.json_response(
+        {'fields': list(history.fields), 'samples': samples}, status=200)
+
+
+async def stream_module_data(request):
+    """
+    Stream the samples of a module's (by its serial number) live data as
+    they are recorded, as one JSON object per line in the shape of the
+    samples from /modules/{serial}/data/history
+
+    GET /modules/{serial}/data/stream?since=<seconds since the epoch>
+
+    If `since` is given, the stream starts with the samples recorded since
+    then. Otherwise, only new samples are sent. The response continues until
+    the client disconnects, and while it does the module is polled as often
+    as it can be.
+    """
+    error, module, since = await _find_module_history(request)
+    if error is not None:
+        return error
+    history = module.history
+
+    response = web.StreamResponse(
+        status=200, headers={'Content-Type': 'application/x-ndjson'})
+    response.enable_chunked_encoding()
+    await response.prepare(request)
+    if since is None:
+        count, samples = history.count, []
+    else:
+        count, samples = history.since(since)
+    with contextlib.ExitStack() as stack:
+        if module.poll_rate:
+            stack.enter_context(module.poll_rate.watch())
+        try:
+            await _write_samples(response, history, count, samples)
+        except ConnectionResetError:
+            log.debug('Module data stream closed by client')
+    return response
+
+
+async def _write_samples(response, history, count, samples):
+    """ Write ``samples`` and then every sample recorded after the first
+    ``count``, as they are recorded, until the client goes away """
+    while True:
+        if samples:
+            await response.write(''.join(
+                json.dumps(sample) + '\n' for sample in samples).encode())
+        await history.wait(count)
+        count, samples = history.after(count)
+
+
+async def get_module_metrics(request):
+    """
+    Query a module (by its serial number) for how busy its serial connection
+    has been since it was opened and how often its status is being polled
+
+    GET /modules/{serial}/metrics
+
+    On success:
+    # status: 200
+    {
+        "commandsSent": 12,
+        "pollsSent": 340,
+        "utilization": 0.02,
+        "pollIntervals": [16.0]
+    }
+
+    Simulated modules have no serial connection, and return an empty object.
+    """
+    if not ff.use_protocol_api_v2():
+        return web.json_response(
+            {"message": "Module metrics are not available via APIv1 server"},
+            status=501)
+    module = await _find_module(request)
+    if not module:
+        return web.json_response({"message": "Module not found"}, status=404)
+    return web.json_response(module.serial_metrics, status=200)
+
+
 async def execute_module_command(request):
     """
     Execute a command on a given module by its serial number
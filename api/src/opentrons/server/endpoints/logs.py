@@ -19,7 +19,11 @@ def _get_options(params: Mapping[str, str],
     """
     response = {
         'format': 'text',
-        'records': default_length
+        'records': default_length,
+        'since': params.get('since'),
+        'until': params.get('until'),
+        'grep': params.get('grep'),
+        'follow': params.get('follow', '').lower() in ('true', '1')
     }
 
     print({k: v for k, v in params.items()})
@@ -42,19 +46,43 @@ def _get_options(params: Mapping[str, str],
     return response
 
 
-async def _get_log_response(syslog_selector: str, record_count: int,
-                            record_format: str) -> web.Response:
+async def _get_log_response(request: web.Request, syslog_selector: str,
+                            opts: Dict[str, Any]) -> web.StreamResponse:
     modes = {
         'json': 'json',
         'text': 'short'
     }
-    output = await log_control.get_records_dumb(syslog_selector,
-                                                record_count,
-                                                modes[record_format])
-    return web.Response(text=output.decode('utf-8'))
+    records = log_control.stream_records(
+        syslog_selector, opts['records'], modes[opts['format']],
+        since=opts['since'], until=opts['until'], grep=opts['grep'],
+        follow=opts['follow'])
+    try:
+        # Wait for the first output before answering, so a bad filter can
+        # still be reported with an error status
+        try:
+            first = await records.__anext__()
+        except StopAsyncIteration:
+            first = b''
+        except log_control.JournalctlError as e:
+            return web.json_response({'message': str(e)}, status=400)
+        response = web.StreamResponse(
+            headers={'Content-Type': 'text/plain; charset=utf-8'})
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        if first:
+            await response.write(first)
+        async for chunk in records:
+            await response.write(chunk)
+    except log_control.JournalctlError as e:
+        LOG.error(f'Log dump of {syslog_selector} failed: {e}')
+    except ConnectionResetError:
+        LOG.debug(f'Log dump of {syslog_selector} closed by client')
+    finally:
+        await records.aclose()
+    return response
 
 
-async def get_logs_by_id(request: web.Request) -> web.Response:
+async def get_logs_by_id(request: web.Request) -> web.StreamResponse:
     """ Get logs from the robot.
 
     GET /logs/:syslog_identifier -> 200 OK, log contents in body
@@ -63,6 +91,15 @@ async def get_logs_by_id(request: web.Request) -> web.Response:
     - ``format``: ``json`` or ``text`` (default: text). Controls log format.
     - ``records``: int. Count of records to limit the dump to. Default: 500000.
       Limit: 1000000
+    - ``since``, ``until``: Only include records logged from or up to these
+      times, in any format ``journalctl`` understands (for instance
+      ``2019-10-01 12:00:00`` or ``-1h``)
+    - ``grep``: Only include records whose messages match this pattern
+    - ``follow``: ``true`` to keep sending records as they are logged, until
+      the client disconnects
+
+    The logs are streamed as ``journalctl`` prints them. If ``journalctl``
+    rejects the parameters, the response is a 400 with its error message.
 
     The syslog identifier is an a string that something has logged to as the
     syslog id. It may not be blank (i.e. GET /logs/ is not allowed). The
@@ -83,8 +120,7 @@ async def get_logs_by_id(request: web.Request) -> web.Response:
     elif ident == 'serial.log':
         ident = 'opentrons-api-serial'
     opts = _get_options(request.query, 500000)
-    return await _get_log_response(
-        ident, opts['records'], opts['format'])
+    return await _get_log_response(request, ident, opts)
 
 
 async def set_syslog_level(request: web.Request) -> web.Response:
@@ -1,16 +1,25 @@
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import shutil
 import subprocess
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Awaitable, Callable, Optional
 from aiohttp import web
 from opentrons.system import nmcli
 from opentrons.config import CONFIG
 
 log = logging.getLogger(__name__)
 
+#: How long, in seconds, a network status is reused before nmcli is asked
+#: again
+STATUS_CACHE_TTL_S = 2.0
+#: How long, in seconds, a list of visible networks is reused before another
+#: scan
+WIFI_LIST_CACHE_TTL_S = 10.0
+
 EAP_CONFIG_SHAPE = {
     'options': [
         {'name': method.qualified_name(),
@@ -31,6 +40,79 @@ class ConfigureArgsError(Exception):
         super().__init__()
 
 
+class CachedQuery:
+    """ An nmcli query whose result is reused for a while.
+
+    A successful result is returned again for ``ttl`` seconds. Callers that
+    ask while the query is running wait for that run rather than starting
+    another one. Failures are not kept.
+    """
+
+    def __init__(self, query: Callable[[], Awaitable[Any]],
+                 ttl: float) -> None:
+        self._query = query
+        self._ttl = ttl
+        self._result: Any = None
+        self._expires = 0.0
+        self._running: Optional[asyncio.Future] = None
+        self._generation = 0
+
+    async def get(self) -> Any:
+        if time.monotonic() < self._expires:
+            return self._result
+        if not self._running:
+            self._running = asyncio.ensure_future(
+                self._run(self._generation))
+        # Shielded so that a caller going away doesn't cancel the query for
+        # everyone else waiting on it
+        return await asyncio.shield(self._running)
+
+    async def _run(self, generation: int) -> Any:
+        try:
+            result = await self._query()
+        finally:
+            if generation == self._generation:
+                self._running = None
+        if generation == self._generation:
+            self._result = result
+            self._expires = time.monotonic() + self._ttl
+        return result
+
+    def invalidate(self):
+        """ Forget the last result. A query that is already running may have
+        started before whatever made it stale, so its result is not kept
+        either """
+        self._generation += 1
+        self._expires = 0.0
+        self._running = None
+
+
+async def _query_status() -> Dict[str, Any]:
+    ifaces = list(nmcli.NETWORK_IFACES)
+    connected, *infos = await asyncio.gather(
+        nmcli.is_connected(), *(nmcli.iface_info(i) for i in ifaces))
+    return {'status': connected,
+            'interfaces': {i.value: info for i, info in zip(ifaces, infos)}}
+
+
+class NetworkQueries:
+    """ The queries the app polls, each shared between the requests for it
+    """
+
+    def __init__(self) -> None:
+        self.status = CachedQuery(_query_status, STATUS_CACHE_TTL_S)
+        self.wifi_list = CachedQuery(
+            lambda: nmcli.available_ssids(), WIFI_LIST_CACHE_TTL_S)
+
+    def invalidate(self):
+        self.status.invalidate()
+        self.wifi_list.invalidate()
+
+
+def _queries(request: web.Request) -> NetworkQueries:
+    return request.app['com.opentrons.network_queries']
+
+
 async def list_networks(request: web.Request) -> web.Response:
     """
     Get request will return a list of discovered ssids:
@@ -54,9 +136,12 @@ async def list_networks(request: web.Request) -> web.Response:
     field is mostly useful for debugging if you are unable to connect to
     the network even though you think you are using the correct security
     type.
+
+    The networks found by a scan are listed again by requests in the
+    following few seconds rather than scanning each time.
     """
     try:
-        networks = await nmcli.available_ssids()
+        networks = await _queries(request).wifi_list.get()
     except RuntimeError as e:
         return web.json_response({'message': ' '.join(e.args)}, status=500)
     else:
@@ -265,6 +350,8 @@ async def configure(request: web.Request) -> web.Response:
         # Indicates an unexpected kwarg; check is done here to avoid keeping
         # the _check_configure_args signature up to date with nmcli.configure
         return web.json_response({'message': str(te)}, status=400)
+    finally:
+        _queries(request).invalidate()
 
     if ok:
         return web.json_response({'message': message,
@@ -326,13 +413,13 @@ async def status(request: web.Request) -> web.Response:
         }
     }
     ```
+
+    The connectivity check and the interface queries run at the same time,
+    and their results are reused by requests in the following few seconds.
     """
-    connectivity = {'status': 'none', 'interfaces': {}}
+    connectivity: Dict[str, Any] = {'status': 'none', 'interfaces': {}}
     try:
-        connectivity['status'] = await nmcli.is_connected()
-        connectivity['interfaces'] = {
-            i.value: await nmcli.iface_info(i) for i in nmcli.NETWORK_IFACES
-        }
+        connectivity = await _queries(request).status.get()
         log.debug("Connectivity: {}".format(connectivity['status']))
         log.debug("Interfaces: {}".format(connectivity['interfaces']))
         status = 200
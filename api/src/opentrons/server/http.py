@@ -12,6 +12,7 @@ class HTTPServer(object):
     def __init__(self, app, log_file_path):
         self.app = app
         self.log_file_path = log_file_path
+        self.app['com.opentrons.network_queries'] = networking.NetworkQueries()
 
         self.app.router.add_get(
             '/health', endp.health)
@@ -34,6 +35,13 @@ class HTTPServer(object):
             '/modules', control.get_attached_modules)
         self.app.router.add_get(
             '/modules/{serial}/data', control.get_module_data)
+        self.app.router.add_get(
+            '/modules/{serial}/data/history',
+            control.get_module_data_history)
+        self.app.router.add_get(
+            '/modules/{serial}/data/stream', control.stream_module_data)
+        self.app.router.add_get(
+            '/modules/{serial}/metrics', control.get_module_metrics)
         self.app.router.add_post(
             '/modules/{serial}', control.execute_module_command)
         if config.feature_flags.use_protocol_api_v2():
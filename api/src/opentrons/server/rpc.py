@@ -3,6 +3,7 @@ import aiohttp
 import functools
 import json
 import logging
+import threading
 import traceback
 
 from aiohttp import web
@@ -26,14 +27,67 @@ CONTROL_MESSAGE = 3
 CALL_NACK_MESSAGE = 4
 PONG_MESSAGE = 5
 
+# The object registry is swept once it holds at least this many entries, and
+# after that once it has grown to this many times its size after the last
+# sweep
+MIN_COLLECT_SIZE = 1000
+COLLECT_GROWTH = 2
+
+
+class ObjectRegistry(dict):
+    """ The objects clients can refer to by id: everything the server has
+    serialized for them.
+
+    Without cleanup, objects from long gone sessions would be kept here (and
+    alive) forever. :py:meth:`collect` drops entries that are neither
+    reachable from the server's root nor registered since the previous
+    collection. The latter keeps objects returned by recent calls usable
+    even if nothing else holds on to them.
+    """
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._recent = set()
+        self._collect_at = MIN_COLLECT_SIZE
+
+    def register(self, refs):
+        with self._lock:
+            self.update(refs)
+            self._recent.update(refs.keys())
+
+    def should_collect(self):
+        return len(self) >= self._collect_at
+
+    def collect(self, root, pinned=(), cache=None):
+        """ Drop entries that are not reachable from ``root``, in ``pinned``
+        or registered since the last collection.
+
+        :returns: The number of entries dropped
+        """
+        _, live = serialize.get_object_tree(root, cache=cache)
+        live.update({id(obj): obj for obj in pinned})
+        with self._lock:
+            # Change only the entries that have to, so that lookups made
+            # meanwhile without the lock still find everything that is live
+            dead = self.keys() - live.keys() - self._recent
+            for key in dead:
+                del self[key]
+            for key in live.keys() - self.keys():
+                self[key] = live[key]
+            self._recent = set()
+            self._collect_at = max(MIN_COLLECT_SIZE,
+                                   COLLECT_GROWTH * len(self))
+            return len(dead)
+
 
 class RPCServer(object):
     def __init__(self, app, root=None):
         self.monitor_events_task = None
         self.app = app
         self.loop = app.loop or asyncio.get_event_loop()
-        self.objects = {}
+        self.objects = ObjectRegistry()
         self.system = SystemCalls(self.objects)
+        self.serialize_cache = serialize.SubtreeCache()
 
         self.root = root
 
@@ -111,13 +165,17 @@ class RPCServer(object):
             try:
                 # Apply notification_max_depth to control object tree depth
                 # during serialization to avoid flooding comms
-                data = self.call_and_serialize(
-                    lambda: event)
+                data = self.serialize(event)
                 self.send(
                     {
                         '$': {'type': NOTIFICATION_MESSAGE},
                         'data': data
                     })
+                # Walking the whole tree from the root takes too long to do
+                # on the loop
+                if self.objects.should_collect():
+                    await self.loop.run_in_executor(
+                        self.executor, self.collect)
             except Exception:
                 log.exception('While processing event {0}:'.format(event))
 
@@ -257,12 +315,28 @@ class RPCServer(object):
     def call_and_serialize(self, func, max_depth=0):
         # XXXX: This should really only be called in a new thread (as in
         #       the normal case where it is called in a threadpool)
-        call_result = func()
+        serialized = self.serialize(func(), max_depth=max_depth)
+        if self.objects.should_collect():
+            self.collect()
+        return serialized
+
+    def serialize(self, obj, max_depth=0):
+        """ Serialize ``obj`` for clients and register what is in it,
+        without sweeping the object registry """
         serialized, refs = serialize.get_object_tree(
-            call_result, max_depth=max_depth)
-        self.objects.update(refs)
+            obj, max_depth=max_depth, cache=self.serialize_cache)
+        self.objects.register(refs)
         return serialized
 
+    def collect(self):
+        """ Evict objects clients can no longer get to (like those of cleared
+        sessions) from the object registry """
+        dropped = self.objects.collect(
+            self.root, pinned=[self.system, self.root],
+            cache=self.serialize_cache)
+        log.debug('Evicted {} objects, {} remain'.format(
+            dropped, len(self.objects)))
+
     async def make_call(self, func, token):
         response = {'$': {'type': CALL_RESULT_MESSAGE, 'token': token}}
         try:
@@ -1,7 +1,43 @@
-import functools
+import weakref
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 
-def _get_object_tree(max_depth, path, refs, depth, obj):  # noqa C901
+class SubtreeCache:
+    """ Serialized forms of static values, to reuse instead of walking them
+    again.
+
+    Only values whose type sets ``_serialize_static = True`` are cached. That
+    is a promise from the owner that neither the value nor anything in it is
+    changed once built (it is replaced wholesale instead), and that it only
+    holds plain data (dicts, lists and primitives). Entries are dropped when
+    their values are garbage collected.
+    """
+    def __init__(self) -> None:
+        self._trees: Dict[int, Tuple[Any, Dict[int, Any]]] = {}
+
+    @staticmethod
+    def is_static(obj) -> bool:
+        return getattr(type(obj), '_serialize_static', False)
+
+    def get(self, obj) -> Optional[Tuple[Any, Dict[int, Any]]]:
+        return self._trees.get(id(obj))
+
+    def put(self, obj, tree, refs: Dict[int, Any]):
+        key = id(obj)
+        try:
+            weakref.finalize(obj, self._trees.pop, key, None)
+        except TypeError:
+            # Without a weak reference we can't tell when the id is reused
+            return
+        self._trees[key] = (tree, refs)
+
+    def __len__(self) -> int:
+        return len(self._trees)
+
+
+def _get_object_tree(  # noqa C901
+        max_depth, seen: Set[int], refs, cache: Optional[SubtreeCache],
+        depth, obj):
 
     def object_container(value):
         # Save id of instance of object's type as a reference too
@@ -15,16 +51,34 @@ def _get_object_tree(max_depth, path, refs, depth, obj):  # noqa C901
     if isinstance(obj, (str, int, bool, float, complex)) or obj is None:
         return obj
 
-    # If we have ourself in path, it's a circular reference
-    # we are terminating it with a valid id but a value of None
-    if hasattr(obj, '__dict__') and id(obj) in path:
+    # If we have seen ourself before, it's a circular (or repeated)
+    # reference. We are terminating it with a valid id but a value of None
+    if hasattr(obj, '__dict__') and id(obj) in seen:
         return object_container(None)
 
+    # Static subtrees are the same every time, so reuse them when we can.
+    # Depth-limited trees are cut off differently depending on where the
+    # value is found, so they are never cached
+    if cache is not None and not max_depth and cache.is_static(obj):
+        cached = cache.get(obj)
+        if cached is None:
+            sub_refs: Dict[int, Any] = {}
+            tree = _get_object_tree(
+                max_depth, seen, sub_refs, None, depth, obj)
+            # Plain data only registers types; anything else may depend on
+            # what else was in the tree around it
+            if all(isinstance(ref, type) for ref in sub_refs.values()):
+                cache.put(obj, tree, sub_refs)
+            cached = (tree, sub_refs)
+        tree, sub_refs = cached
+        refs.update(sub_refs)
+        return tree
+
     # Shorthand for calling ourselves recursively
-    object_tree = functools.partial(
-        _get_object_tree, max_depth, path, refs, depth + 1)
+    def object_tree(o):
+        return _get_object_tree(max_depth, seen, refs, cache, depth + 1, o)
 
-    path += [id(obj)]
+    seen.add(id(obj))
 
     # Cut-off at max_depth
     # If max_depth == 0 (evaluates to False) — keep going
@@ -40,7 +94,7 @@ def _get_object_tree(max_depth, path, refs, depth, obj):  # noqa C901
         return object_container(iterate(obj))
     elif hasattr(obj, '__dict__'):
         refs[id(obj)] = obj
-        items = []
+        items: List[Any] = []
         # If Type is iterable we will iterate generating numeric keys and
         # and merge with the output
         try:
@@ -57,7 +111,17 @@ def _get_object_tree(max_depth, path, refs, depth, obj):  # noqa C901
         return object_container({})
 
 
-def get_object_tree(obj, max_depth=0):
-    refs = {}
-    tree = _get_object_tree(max_depth, [], refs, 0, obj)
+def get_object_tree(obj, max_depth=0, cache: SubtreeCache = None):
+    """ Serialize ``obj`` into a tree of primitives for sending to clients.
+
+    Returns the tree and a dict of every object (and type) in it by id.
+    Objects that appear more than once are only fully serialized the first
+    time; later appearances are references with a value of ``None``.
+
+    :param max_depth: How deep to serialize (``0`` for no limit)
+    :param cache: If specified, a :py:class:`SubtreeCache` to reuse the
+                  serialized forms of static values across calls
+    """
+    refs: Dict[int, Any] = {}
+    tree = _get_object_tree(max_depth, set(), refs, cache, 0, obj)
     return (tree, refs)
@@ -7,12 +7,16 @@ a protocol from the command line.
 import argparse
 
 import sys
+import functools
+import json
 import logging
 import os
 import pathlib
 import queue
-from typing import (Any, Dict, List, Mapping, TextIO, Tuple, BinaryIO,
-                    Optional, Union)
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import (Any, Callable, Dict, Iterator, List, Mapping, TextIO,
+                    Tuple, BinaryIO, Optional, Sequence, Union)
 
 
 import opentrons
@@ -57,25 +61,29 @@ class CommandScraper:
     def __init__(self,
                  logger: logging.Logger,
                  level: str,
-                 broker: opentrons.broker.Broker) -> None:
+                 broker: opentrons.broker.Broker,
+                 clock: Callable[[], Optional[float]] = None) -> None:
         """ Build the scraper.
 
         :param logger: The :py:class:`logging.logger` to scrape
         :param level: The log level to scrape
         :param broker: Which broker to subscribe to
+        :param clock: A function returning the simulated time in seconds,
+                      used to record the duration of each command. If not
+                      specified, durations are ``None``.
         """
         self._logger = logger
         self._broker = broker
+        self._clock = clock
         self._queue = queue.Queue()  # type: ignore
         if level != 'none':
             level = getattr(logging, level.upper(), logging.WARNING)
             self._logger.setLevel(level)
-            logger.addHandler(
-                AccumulatingHandler(
-                    level,
-                    self._queue))
+            self._handler = AccumulatingHandler(level, self._queue)
+            logger.addHandler(self._handler)
         self._depth = 0
         self._commands: List[Mapping[str, Mapping[str, Any]]] = []
+        self._started: List[Tuple[Dict[str, Any], Optional[float]]] = []
         self._unsub = self._broker.subscribe(
             opentrons.commands.command_types.COMMAND,
             self._command_callback)
@@ -85,24 +93,38 @@ class CommandScraper:
         """ The list of commands. See :py:meth:`simulate` """
         return self._commands
 
-    def __del__(self):
+    def close(self):
+        """ Stop scraping commands and logs """
         if hasattr(self, '_handler'):
             self._logger.removeHandler(self._handler)
+            del self._handler
         if hasattr(self, '_unsub'):
             self._unsub()
+            del self._unsub
+
+    def __del__(self):
+        self.close()
 
     def _command_callback(self, message):
         """ The callback subscribed to the broker """
         payload = message['payload']
+        now = self._clock() if self._clock else None
         if message['$'] == 'before':
-            self._commands.append({'level': self._depth,
-                                   'payload': payload,
-                                   'logs': []})
+            command = {'level': self._depth,
+                       'payload': payload,
+                       'logs': [],
+                       'duration': None}
+            self._commands.append(command)
+            self._started.append((command, now))
             self._depth += 1
         else:
             while not self._queue.empty():
                 self._commands[-1]['logs'].append(self._queue.get())
             self._depth = max(self._depth - 1, 0)
+            if self._started:
+                command, started_at = self._started.pop()
+                if now is not None and started_at is not None:
+                    command['duration'] = now - started_at
 
 
 def get_protocol_api(
@@ -223,6 +245,10 @@ def simulate(protocol_file: TextIO,
                        a payload do ``payload['text'].format(**payload)``.
         - ``logs``: Any log messages that occurred during execution of this
                     command, as a logging.LogRecord
+        - ``duration``: The estimated time in seconds this command (including
+                        any commands nested in it) would take on a robot, or
+                        ``None`` if it cannot be estimated (for instance in
+                        API v1 protocols)
 
     :param file-like protocol_file: The protocol file to simulate.
     :param str file_name: The name of the file
@@ -278,14 +304,22 @@ def simulate(protocol_file: TextIO,
             getattr(protocol, 'api_level', MAX_SUPPORTED_VERSION),
             bundled_labware=getattr(protocol, 'bundled_labware', None),
             bundled_data=getattr(protocol, 'bundled_data', None))
-        scraper = CommandScraper(stack_logger, log_level, context.broker)
-        execute.run_protocol(protocol, context)
-        if isinstance(protocol, PythonProtocol)\
-           and protocol.bundled_labware is None:
-            bundle_contents: Optional[BundleContents] = bundle_from_sim(
-                protocol, context)
-        else:
-            bundle_contents = None
+        hardware = context._hw_manager.hardware
+        scraper = CommandScraper(stack_logger, log_level, context.broker,
+                                 clock=lambda: hardware.simulated_time)
+        try:
+            execute.run_protocol(protocol, context)
+            if isinstance(protocol, PythonProtocol)\
+               and protocol.bundled_labware is None:
+                bundle_contents: Optional[BundleContents] = bundle_from_sim(
+                    protocol, context)
+            else:
+                bundle_contents = None
+        finally:
+            scraper.close()
+            # Otherwise the simulator is only given back when the context is
+            # collected
+            context._hw_manager.release()
     else:
 
         def _simulate_v1():
@@ -293,10 +327,13 @@ def simulate(protocol_file: TextIO,
             opentrons.robot.disconnect()
             scraper = CommandScraper(stack_logger, log_level,
                                      opentrons.robot.broker)
-            if isinstance(protocol, JsonProtocol):
-                opentrons.legacy_api.protocols.execute_protocol(protocol)
-            else:
-                exec(protocol.contents, {})
+            try:
+                if isinstance(protocol, JsonProtocol):
+                    opentrons.legacy_api.protocols.execute_protocol(protocol)
+                else:
+                    exec(protocol.contents, {})
+            finally:
+                scraper.close()
             return scraper
 
         scraper = _simulate_v1()
@@ -305,27 +342,164 @@ def simulate(protocol_file: TextIO,
     return scraper.commands, bundle_contents
 
 
-def format_runlog(runlog: List[Mapping[str, Any]]) -> str:
+def runlog_duration(runlog: List[Mapping[str, Any]]) -> Optional[float]:
+    """
+    Total the estimated duration of a run log (return value of
+    :py:meth:`simulate`)
+
+    :param runlog: The output of a call to :py:func:`simulate`
+    :returns: The estimated duration in seconds, or ``None`` if any top-level
+              command has no duration estimate
+    """
+    durations = [command.get('duration') for command in runlog
+                 if command['level'] == 0]
+    if any(duration is None for duration in durations):
+        return None
+    return sum(durations)
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, secs = divmod(round(seconds, 1), 60)
+    hours, minutes = divmod(int(minutes), 60)
+    return f'{hours}:{minutes:02d}:{secs:04.1f}'
+
+
+def _format_command(command: Mapping[str, Any]) -> str:
+    return command['payload'].get('text', '').format(**command['payload'])
+
+
+def _format_log(record: logging.LogRecord) -> str:
+    return f'{record.levelname} ({record.module}): {record.msg}' % record.args
+
+
+def format_runlog(runlog: List[Mapping[str, Any]],
+                  durations: bool = False) -> str:
     """
     Format a run log (return value of :py:meth:`simulate``) into a
     human-readable string
 
     :param runlog: The output of a call to :py:func:`simulate`
+    :param durations: Whether to include the estimated duration of each
+                      command, and of the whole run, in the output
     """
     to_ret = []
     for command in runlog:
-        to_ret.append(
-            '\t' * command['level']
-            + command['payload'].get('text', '').format(**command['payload']))
+        text = _format_command(command)
+        if durations and command.get('duration') is not None:
+            text += f' ({_format_duration(command["duration"])})'
+        to_ret.append('\t' * command['level'] + text)
         if command['logs']:
             to_ret.append('\t' * command['level'] + 'Logs from this command:')
             to_ret.extend(
-                ['\t' * command['level']
-                 + f'{l.levelname} ({l.module}): {l.msg}' % l.args
+                ['\t' * command['level'] + _format_log(l)
                  for l in command['logs']])
+    if durations:
+        to_ret.append(_format_total_duration(runlog))
     return '\n'.join(to_ret)
 
 
+def _format_total_duration(runlog: List[Mapping[str, Any]]) -> str:
+    total = runlog_duration(runlog)
+    if total is None:
+        return 'Estimated run time: unknown'
+    return f'Estimated run time: {_format_duration(total)}'
+
+
+def _batch_runlog(
+        runlog: List[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """ Reduce a run log to what can be sent between processes and written
+    as json: the formatted text of each command and its logs """
+    return [{'level': command['level'],
+             'text': _format_command(command),
+             'logs': [_format_log(record) for record in command['logs']],
+             'duration': command.get('duration')}
+            for command in runlog]
+
+
+def _simulate_batch_protocol(
+        protocol_path: str,
+        custom_labware_paths: Optional[List[str]],
+        custom_data_paths: Optional[List[str]],
+        log_level: str) -> Dict[str, Any]:
+    """ Simulate one protocol of a batch, in a worker process """
+    # API v1 protocols share the robot singleton, so start each from scratch
+    legacy_api = sys.modules.get('opentrons.legacy_api.api')
+    if legacy_api:
+        legacy_api.robot.reset()  # type: ignore
+
+    result: Dict[str, Any] = {
+        'protocol': protocol_path, 'error': None, 'runlog': [],
+        'duration': None}
+    start = time.perf_counter()
+    try:
+        with open(protocol_path, 'rb') as protocol_file:
+            runlog, _ = simulate(
+                protocol_file,  # type: ignore
+                protocol_path,
+                custom_labware_paths,
+                custom_data_paths,
+                log_level=log_level)
+    except Exception as e:
+        result['error'] = f'{type(e).__name__}: {e}'
+    else:
+        result['runlog'] = _batch_runlog(runlog)
+        result['duration'] = runlog_duration(runlog)
+    result['elapsed'] = time.perf_counter() - start
+    return result
+
+
+def batch_protocols(directory: str) -> List[str]:
+    """ List the protocols (.py, .json and .zip files) in a directory, not
+    including its subdirectories """
+    return sorted(str(path) for path in pathlib.Path(directory).iterdir()
+                  if path.is_file()
+                  and path.suffix in ('.py', '.json', '.zip'))
+
+
+def simulate_batch(protocol_paths: Sequence[str],
+                   jobs: int = None,
+                   custom_labware_paths: List[str] = None,
+                   custom_data_paths: List[str] = None,
+                   log_level: str = 'warning') -> Iterator[Dict[str, Any]]:
+    """
+    Simulate many protocols, several at a time.
+
+    The protocols are shared out between a pool of worker processes. Each
+    worker simulates one protocol after another, so the cost of starting up
+    and of loading labware and pipette definitions is only paid once per
+    worker. Every protocol gets a new protocol context, and API v1 protocols
+    get a reset robot.
+
+    The results are produced in the same order as ``protocol_paths``, each a
+    dict with keys:
+
+        - ``protocol``: The path of the protocol
+        - ``error``: If the simulation failed, the exception that caused it
+                     formatted as a string; otherwise ``None``
+        - ``runlog``: The run log (see :py:meth:`simulate`), with each
+                      command's ``payload`` and ``logs`` formatted as text
+                      (under ``text`` and ``logs`` respectively) so it can
+                      be written out as json
+        - ``duration``: The estimated run time of the protocol in seconds, or
+                        ``None`` (see :py:meth:`runlog_duration`)
+        - ``elapsed``: How long the simulation took, in seconds
+
+    :param protocol_paths: The paths of the protocol files to simulate
+    :param jobs: How many protocols to simulate at once. If not specified,
+                 the number of CPUs.
+    :param custom_labware_paths: As in :py:meth:`simulate`
+    :param custom_data_paths: As in :py:meth:`simulate`
+    :param log_level: As in :py:meth:`simulate`
+    """
+    simulate_one = functools.partial(
+        _simulate_batch_protocol,
+        custom_labware_paths=custom_labware_paths,
+        custom_data_paths=custom_data_paths,
+        log_level=log_level)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        yield from executor.map(simulate_one, protocol_paths)
+
+
 def _get_bundle_args(
         parser: argparse.ArgumentParser) -> argparse.ArgumentParser:
     parser.add_argument(
@@ -399,11 +573,20 @@ def get_arguments(
         parser = _get_bundle_args(parser)
 
     parser.add_argument(
-        'protocol', metavar='PROTOCOL',
+        'protocol', metavar='PROTOCOL', nargs='?',
         type=argparse.FileType('rb'),
         help='The protocol file to simulate. If you pass \'-\', you can pipe '
         'the protocol via stdin; this could be useful if you want to use this '
         'utility as part of an automated workflow.')
+    parser.add_argument(
+        '--batch', metavar='DIR', action='store',
+        help='Simulate every protocol (.py, .json or .zip file) in DIR '
+        'instead of a single protocol. The result of each is printed as a '
+        'line of json with its run log, any error, and how long it took.')
+    parser.add_argument(
+        '-j', '--jobs', action='store', type=int, default=None,
+        help='With --batch, how many protocols to simulate at once. By '
+        'default, the number of CPUs.')
     parser.add_argument(
         '-v', '--version', action='version',
         version=f'%(prog)s {opentrons.__version__}',
@@ -413,6 +596,11 @@ def get_arguments(
         help='What to output during simulations',
         choices=['runlog', 'nothing'],
         default='runlog')
+    parser.add_argument(
+        '-e', '--estimate-duration', action='store_true',
+        help='Estimate how long the protocol would take to run on a robot, '
+        'and print the estimated duration of each command in the run log '
+        'and of the whole protocol. Only available for API v2 protocols.')
     return parser
 
 
@@ -437,6 +625,21 @@ def _get_bundle_dest(
         return None
 
 
+def _run_batch(args: argparse.Namespace) -> int:
+    failed = 0
+    for result in simulate_batch(
+            batch_protocols(args.batch),
+            args.jobs,
+            getattr(args, 'custom_labware_path', []),
+            getattr(args, 'custom_data_path', [])
+            + getattr(args, 'custom_data_file', []),
+            log_level=args.log_level):
+        if result['error']:
+            failed += 1
+        print(json.dumps(result), flush=True)
+    return 1 if failed else 0
+
+
 # Note - this script is also set up as a setuptools entrypoint and thus does
 # an absolute minimum of work since setuptools does something odd generating
 # the scripts
@@ -447,9 +650,14 @@ def main() -> int:
     parser = get_arguments(parser)
 
     args = parser.parse_args()
+    if (args.protocol is None) == (args.batch is None):
+        parser.error('Specify either a protocol or --batch')
     # Try to migrate api v1 containers if needed
     api.maybe_migrate_containers()
 
+    if args.batch:
+        return _run_batch(args)
+
     runlog, maybe_bundle = simulate(
         args.protocol,
         args.protocol.name,
@@ -469,7 +677,9 @@ def main() -> int:
             bundle.create_bundle(maybe_bundle, bundle_dest)
 
     if args.output == 'runlog':
-        print(format_runlog(runlog))
+        print(format_runlog(runlog, durations=args.estimate_duration))
+    elif args.estimate_duration:
+        print(_format_total_duration(runlog))
 
     return 0
 
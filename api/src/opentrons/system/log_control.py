@@ -8,12 +8,14 @@ import asyncio
 import logging
 import subprocess
 import syslog
-from typing import Tuple
+from typing import AsyncGenerator, List, Tuple
 
 
 LOG = logging.getLogger(__name__)
 
 MAX_RECORDS = 100000
+#: The most journalctl output read into memory at a time
+CHUNK_SIZE = 65536
 
 _SYSLOG_PRIORITY_TO_NAME = {
     syslog.LOG_EMERG: 'emergency',
@@ -27,23 +29,74 @@ _SYSLOG_PRIORITY_TO_NAME = {
 }
 
 
-async def get_records_dumb(selector: str, records: int,
-                           mode: str) -> bytes:
-    """ Dump the log files.
+class JournalctlError(Exception):
+    """ Raised when journalctl exits with an error, with its stderr """
+    pass
+
+
+def _journalctl_args(selector: str, records: int, mode: str,
+                     since: str = None, until: str = None,
+                     grep: str = None, follow: bool = False) -> List[str]:
+    args = ['--no-pager',
+            '-t', selector,
+            '-n', str(records),
+            '-o', mode,
+            '-a']
+    # Passed with = so that values starting with - (like a relative
+    # time) are not taken for options
+    if since:
+        args.append(f'--since={since}')
+    if until:
+        args.append(f'--until={until}')
+    if grep:
+        args.append(f'--grep={grep}')
+    if follow:
+        args.append('--follow')
+    return args
+
+
+async def stream_records(selector: str, records: int, mode: str,
+                         since: str = None, until: str = None,
+                         grep: str = None,
+                         follow: bool = False) -> AsyncGenerator[bytes, None]:
+    """ Dump the log files a chunk at a time, rather than holding all of
+    journalctl's output in memory.
+
+    Closing the iterator stops journalctl, which (when following) it would
+    not do on its own.
 
     :param selector: The syslog selector to limit responses to
     :param records: The maximum number of records to print
     :param mode: A journalctl dump mode. Should be either "short" or "json".
+    :param since: Only print records from this time on, in any format
+                  journalctl understands (for instance "2019-10-01 12:00" or
+                  "-1h")
+    :param until: Only print records up to this time
+    :param grep: Only print records whose messages match this pattern
+    :param follow: Keep printing records as they are logged
+    :raises JournalctlError: If journalctl exits with an error
     """
     proc = await asyncio.create_subprocess_exec(
-        'journalctl', '--no-pager',
-        '-t', selector,
-        '-n', str(records),
-        '-o', mode,
-        '-a',
-        stdout=subprocess.PIPE)
-    stdout, _ = await proc.communicate()
-    return stdout
+        'journalctl',
+        *_journalctl_args(selector, records, mode, since, until, grep, follow),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert proc.stdout and proc.stderr
+    # Read stderr as it comes, so journalctl can't fill the pipe and stop
+    # while stdout is still being read
+    stderr = asyncio.ensure_future(proc.stderr.read())
+    try:
+        while True:
+            chunk = await proc.stdout.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            yield chunk
+        if await proc.wait():
+            raise JournalctlError((await stderr).decode().strip())
+    finally:
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        stderr.cancel()
 
 
 async def set_syslog_level(level: str) -> Tuple[int, str, str]:
@@ -1,7 +1,5 @@
-import functools
-import itertools
-from collections import namedtuple, UserDict
-from typing import Dict, List
+from collections import namedtuple
+from typing import Dict, List, NamedTuple, Optional
 
 import numpy as np  # type: ignore
 from numpy.linalg import inv  # type: ignore
@@ -58,6 +56,101 @@ class Node(namedtuple('Node', 'parent children transform')):
             (transform1 == transform2).all()
 
 
+class _Frames(NamedTuple):
+    """ Transforms between a node's coordinates and the root's """
+    #: Folded transforms from the node up to (excluding) the root
+    up: np.ndarray
+    #: The inverse of ``up``: from the node's coordinates to the root's
+    up_inv: np.ndarray
+    #: Folded transforms from (excluding) the root down to the node
+    down: np.ndarray
+    #: The inverse of ``down``
+    down_inv: np.ndarray
+
+
+class PoseTree(dict):
+    """ The state of a pose tree: a dict of tracked objects to their
+    :py:class:`Node`.
+
+    The functions in this module update the tree they are given in place (and
+    return it, so calls can still be chained). Along with the nodes, the tree
+    keeps the transforms between each node and the root, and the highest
+    point in each subtree, computing them when they are first needed and
+    forgetting them for just the nodes a change affects.
+    """
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._frames: Dict[object, _Frames] = {}
+        self._max_z: Dict[object, Optional[float]] = {}
+
+    def add(self, obj, parent=ROOT, point=Point(0, 0, 0),
+            transform=np.identity(4)) -> 'PoseTree':
+        """ Syntax sugar for chaining :py:func:`add` calls """
+        return add(self, obj, parent, point, transform)
+
+    def copy(self) -> 'PoseTree':
+        return PoseTree(self)
+
+    def frames(self, obj) -> _Frames:
+        try:
+            return self._frames[obj]
+        except KeyError:
+            pass
+        # Fill in any uncached ancestors on the way back down
+        path = []
+        while obj not in self._frames:
+            path.append(obj)
+            obj = self[obj].parent
+            if obj is None:
+                # The root's own transform is never part of a change of base
+                identity = np.identity(4)
+                frames = _Frames(identity, identity, identity, identity)
+                break
+        else:
+            frames = self._frames[obj]
+        for obj in reversed(path):
+            if self[obj].parent is not None:
+                transform = self[obj].transform
+                transform_inv = inv(transform)
+                frames = _Frames(
+                    up=transform.dot(frames.up),
+                    up_inv=frames.up_inv.dot(transform_inv),
+                    down=frames.down.dot(transform),
+                    down_inv=transform_inv.dot(frames.down_inv))
+            self._frames[obj] = frames
+        return frames
+
+    def max_world_z(self, obj) -> Optional[float]:
+        """ The highest point of ``obj``'s descendants in the root's
+        coordinates, or ``None`` if there are none """
+        try:
+            return self._max_z[obj]
+        except KeyError:
+            pass
+        heights = []
+        for child in self[obj].children:
+            heights.append(self.frames(child).up_inv[2, 3])
+            below = self.max_world_z(child)
+            if below is not None:
+                heights.append(below)
+        self._max_z[obj] = max(heights) if heights else None
+        return self._max_z[obj]
+
+    def forget(self, obj, moved: bool):
+        """ Forget what is cached about ``obj`` after it changed.
+
+        :param moved: Whether ``obj`` itself moved (rather than, say, gaining
+                      or losing children)
+        """
+        if moved:
+            for node, _ in [(obj, 0)] + descendants(self, obj):
+                self._frames.pop(node, None)
+                self._max_z.pop(node, None)
+        while obj is not None and obj in self:
+            self._max_z.pop(obj, None)
+            obj = self[obj].parent
+
+
 def init():
     return add({}, ROOT, parent=None)
 
@@ -67,30 +160,32 @@ def add(
         obj,
         parent=ROOT,
         point=Point(0, 0, 0),
-        transform=np.identity(4)) -> Dict[object, Node]:
+        transform=np.identity(4)) -> PoseTree:
 
     if isinstance(transform, list):
         transform = np.array(transform)
 
     state = bind(state)
 
+    assert obj not in state, 'object is already being tracked'
+
     if parent is not None:
         state[parent] = state[parent].add(obj)
 
-    assert obj not in state, 'object is already being tracked'
-
     state[obj] = Node(
         parent=parent,
         children=[],
         transform=transform.dot(inv(translate(point)))
     )
+    state.forget(parent, moved=False)
 
     return state
 
 
 def remove(state, obj):
-    state = state.copy()
+    state = bind(state)
     nodes = descendants(state, obj) + [(obj, 0)]
+    state.forget(obj, moved=True)
 
     # remove object references from their parent's children
     for child, *_ in nodes:
@@ -102,30 +197,37 @@ def remove(state, obj):
 
 
 def update(state, obj, point: Point, transform=np.identity(4)):
-    state = state.copy()
+    state = bind(state)
     state[obj] = state[obj].update(
         transform.dot(inv(translate(point)))
     )
+    state.forget(obj, moved=True)
     return state
 
 
 def descendants(state, obj, level=0):
     """ Returns a flattened list tuples of DFS traversal of subtree
     from object that contains descendant object and it's depth """
-    return sum([
-        [(child, level)] + descendants(state, child, level + 1)
-        for child in state[obj].children
-    ], [])
+    result = []
+    stack = [(child, level) for child in reversed(state[obj].children)]
+    while stack:
+        child, child_level = stack.pop()
+        result.append((child, child_level))
+        stack.extend((grandchild, child_level + 1)
+                     for grandchild in reversed(state[child].children))
+    return result
 
 
 def has_children(state, obj):
-    return True if len(descendants(state, obj)) > 0 else False
+    return len(state[obj].children) > 0
 
 
 def ascend(state, start, finish=ROOT) -> List[Node]:
-    if start is finish:
-        return [finish]
-    return [start] + ascend(state, start=state[start].parent, finish=finish)
+    path = [start]
+    while start is not finish:
+        start = state[start].parent
+        path.append(start)
+    return path
 
 
 def change_base(state, point=Point(0, 0, 0), src=ROOT, dst=ROOT):
@@ -133,29 +235,27 @@ def change_base(state, point=Point(0, 0, 0), src=ROOT, dst=ROOT):
     Transforms point from source coordinate system to destination.
     Point(0, 0, 0) means the origin of the source.
     """
-    def fold(objects):
-        return functools.reduce(
-            lambda a, b: a.dot(b),
-            [state[key].transform for key in objects],
-            np.identity(4)
-        )
-
-    up, down = ascend(state, src), list(reversed(ascend(state, dst)))
-
-    # Find common prefix. Last item is common root
-    root = [n1 for n1, n2 in zip(reversed(up), down) if n1 is n2].pop()
-
-    # Nodes up to root, EXCLUDING root
-    up = list(itertools.takewhile(lambda node: node is not root, up))
-
-    # Nodes down from root, EXCLUDING root
-    down = list(itertools.dropwhile(lambda node: node is not root, down))[1:]
-
-    # Point in root's coordinate system
-    point_in_root = inv(fold(up)).dot((*point, 1))
-
-    # Return point in destination's coordinate system
-    return fold(down).dot(point_in_root)[:-1]
+    state = bind(state)
+    if src is ROOT or dst is ROOT:
+        root = ROOT
+    else:
+        # Find the closest common ancestor
+        up = ascend(state, src)
+        down = list(reversed(ascend(state, dst)))
+        root = [n1 for n1, n2 in zip(reversed(up), down) if n1 is n2].pop()
+
+    # Point in the root's coordinate system
+    point_in_root = state.frames(src).up_inv.dot((*point, 1))
+    dst_down = state.frames(dst).down
+    if root is ROOT:
+        # Return point in destination's coordinate system
+        return dst_down.dot(point_in_root)[:-1]
+
+    # The transforms from the source and destination are folded up to their
+    # closest common ancestor rather than all the way to the root
+    root_frames = state.frames(root)
+    return root_frames.down_inv.dot(
+        dst_down.dot(root_frames.up.dot(point_in_root)))[:-1]
 
 
 def absolute(state, obj):
@@ -166,15 +266,18 @@ def absolute(state, obj):
 
 
 def max_z(state, root):
-    test = [
-        (obj, Point(*change_base(state, src=obj, dst=root)).z)
-        for obj, _ in descendants(state, root)
-    ]
-
-    # from pprint import pprint
-    # pprint(test, indent=2)
-    m = max([i[1] for i in test])
-    return m
+    state = bind(state)
+    highest = state.max_world_z(root)
+    if highest is None:
+        raise ValueError(f'{root} has no descendants')
+    z_row = state.frames(root).up[2]
+    if z_row[0] == 0 and z_row[1] == 0 and z_row[2] >= 0:
+        # The highest point in the root's coordinates is the highest point
+        # in the tree's
+        return z_row[2] * highest + z_row[3]
+    return max(
+        Point(*change_base(state, src=obj, dst=root)).z
+        for obj, _ in descendants(state, root))
 
 
 def stringify(state, root=None):
@@ -191,9 +294,9 @@ def stringify(state, root=None):
     ])
 
 
-def bind(state):
-    state = UserDict(state.copy())
-    # add syntax sugar for chaining add operations
-    state.add = functools.partial(add, state)
-
-    return state
+def bind(state) -> PoseTree:
+    """ Get ``state`` as a :py:class:`PoseTree` (which adds syntax sugar for
+    chaining add operations) """
+    if isinstance(state, PoseTree):
+        return state
+    return PoseTree(state)
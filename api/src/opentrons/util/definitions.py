@@ -0,0 +1,144 @@
+""" opentrons.util.definitions: a process-wide cache of loaded definitions
+
+Pipette configs and labware and module definitions are loaded from json
+files that almost never change, but used to be read and decoded again every
+time something was loaded. The cache here keeps what was loaded, keyed by
+whatever identifies it, along with stamps of any files it came from that
+might change (custom labware, pipette overrides) so it can be loaded again
+when they do.
+
+Cached values are shared by everything that loads them, so they are frozen:
+dicts and lists become :py:class:`FrozenDict` and :py:class:`FrozenList`,
+which behave like (and are instances of) dicts and lists but raise a
+``TypeError`` if anything tries to change them. Use :py:func:`copy.deepcopy`
+to get a plain, mutable copy.
+"""
+import copy
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Hashable, Optional, Sequence, Tuple, TypeVar
+
+#: How many definitions of each kind to keep by default
+DEFAULT_SIZE = 256
+
+FileStamp = Optional[Tuple[int, int, int]]
+T = TypeVar('T')
+# The stamps of the files an entry was loaded from, and its value
+_Entry = Tuple[Tuple[FileStamp, ...], Any]
+
+
+def _frozen(self, *args, **kwargs):
+    raise TypeError(f'{type(self).__name__} is immutable; '
+                    'use copy.deepcopy() for a mutable copy')
+
+
+class FrozenDict(dict):
+    """ A dict that can't be changed """
+    # Nothing in it changes either, so the rpc serializer can reuse
+    # its serialized form
+    _serialize_static = True
+
+    __setitem__ = __delitem__ = _frozen
+    clear = pop = popitem = setdefault = update = _frozen
+
+    def __deepcopy__(self, memo):
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __copy__(self):
+        return dict(self)
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """ A list that can't be changed """
+    _serialize_static = True
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+    append = clear = extend = insert = pop = remove = reverse = sort = _frozen
+
+    def __deepcopy__(self, memo):
+        return [copy.deepcopy(v, memo) for v in self]
+
+    def __copy__(self):
+        return list(self)
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(obj: Any) -> Any:
+    """ Return a frozen version of ``obj``, which should be plain data as
+    loaded from json (dicts, lists and primitives). Tuples (like namedtuples)
+    are rebuilt with their members frozen.
+    """
+    if isinstance(obj, (FrozenDict, FrozenList)):
+        return obj
+    if isinstance(obj, dict):
+        return FrozenDict((k, freeze(v)) for k, v in obj.items())
+    if isinstance(obj, list):
+        return FrozenList(freeze(v) for v in obj)
+    if isinstance(obj, tuple):
+        members = (freeze(v) for v in obj)
+        if hasattr(obj, '_make'):
+            return obj._make(members)  # type: ignore
+        return tuple(members)
+    return obj
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """ Something that changes when the file at ``path`` does, or ``None``
+    if there's no file there """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+class DefinitionCache:
+    """ A least-recently-used cache of frozen definitions.
+
+    Each entry remembers the stamps of the files it was loaded from (see
+    :py:meth:`get`) and is loaded again if any of them change.
+    """
+    def __init__(self, maxsize: int = DEFAULT_SIZE) -> None:
+        self._maxsize = maxsize
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+        #: How many times a definition was actually loaded
+        self.loads = 0
+
+    def get(self, key: Hashable, loader: Callable[[], T],
+            watch: Sequence[Path] = ()) -> T:
+        """ Get the definition for ``key``, calling ``loader`` to load it if
+        it isn't cached (or any of the files in ``watch`` changed since it
+        was). Whatever ``loader`` returns is frozen before being cached, and
+        anything it raises is passed on without caching anything.
+        """
+        # Stamp the files before loading so a change while loading means
+        # loading again next time rather than missing the change
+        stamps = tuple(file_stamp(path) for path in watch)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == stamps:
+                self._entries.move_to_end(key)
+                return entry[1]
+        value = freeze(loader())
+        with self._lock:
+            self.loads += 1
+            self._entries[key] = (stamps, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
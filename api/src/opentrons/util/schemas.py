@@ -0,0 +1,119 @@
+""" opentrons.util.schemas: cached validators for the shared-data schemas
+
+Validating a protocol or a labware definition used to mean reading and
+decoding its schema, building a resolver for it and checking the schema
+itself before checking the instance, every time. Here each schema is loaded
+and checked once, and each thread keeps a validator for it.
+
+Instances that pass are also remembered by a hash of their contents, so
+validating the same protocol or definition again (uploading it again,
+loading the same custom labware in another protocol) is just the hash.
+"""
+import functools
+import hashlib
+import json
+import pkgutil
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import jsonschema  # type: ignore
+from jsonschema.exceptions import best_match  # type: ignore
+
+LABWARE_SCHEMA_V2 = 'shared_data/labware/schemas/2.json'
+#: How many validated instances to remember
+VALIDATED_SIZE = 1024
+
+_validated: 'OrderedDict[Tuple[str, bytes], None]' = OrderedDict()
+_lock = threading.Lock()
+# Validators keep track of where they are while resolving references, so
+# each thread has its own
+_local = threading.local()
+
+
+def protocol_schema_path(version_num: int) -> str:
+    return f'shared_data/protocol/schemas/{version_num}.json'
+
+
+@functools.lru_cache(maxsize=None)
+def load_schema(path: str) -> Dict[str, Any]:
+    """ Load the schema at ``path`` (relative to the opentrons package).
+
+    :raises FileNotFoundError: If there is no schema there
+    """
+    body = pkgutil.get_data('opentrons', path)
+    if not body:
+        raise FileNotFoundError(path)
+    return json.loads(body.decode('utf-8'))
+
+
+@functools.lru_cache(maxsize=None)
+def _checked_schema(path: str) -> Tuple[Any, Dict[str, Any]]:
+    """ Load the schema at ``path`` and check it, returning it and the
+    validator class for it """
+    schema = load_schema(path)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls, schema
+
+
+def get_validator(path: str) -> Any:
+    """ Get this thread's validator for the schema at ``path``. The schema is
+    checked when the first validator for it is built rather than on every
+    validation.
+
+    Protocol schemas refer to the labware schema by name, so every validator
+    can resolve ``opentronsLabwareSchemaV2``.
+    """
+    validators = _local.__dict__.setdefault('validators', {})
+    try:
+        return validators[path]
+    except KeyError:
+        pass
+    validator_cls, schema = _checked_schema(path)
+    resolver = jsonschema.RefResolver(
+        schema.get('$id', ''),
+        schema,
+        store={
+            'opentronsLabwareSchemaV2': load_schema(LABWARE_SCHEMA_V2)
+        })
+    validators[path] = validator_cls(schema, resolver=resolver)
+    return validators[path]
+
+
+def _digest(instance: Any) -> Optional[bytes]:
+    try:
+        body = json.dumps(instance, sort_keys=True, separators=(',', ':'))
+    except (TypeError, ValueError):
+        # Not json, so it won't validate anyway
+        return None
+    return hashlib.sha256(body.encode('utf-8')).digest()
+
+
+def validate(instance: Any, path: str) -> None:
+    """ Validate ``instance`` against the schema at ``path``.
+
+    :raises jsonschema.ValidationError: If it is not valid. As with
+        :py:func:`jsonschema.validate`, this is the most relevant error.
+    """
+    digest = _digest(instance)
+    if digest is not None:
+        key = (path, digest)
+        with _lock:
+            if key in _validated:
+                _validated.move_to_end(key)
+                return
+    error = best_match(get_validator(path).iter_errors(instance))
+    if error is not None:
+        raise error
+    if digest is not None:
+        with _lock:
+            _validated[key] = None
+            while len(_validated) > VALIDATED_SIZE:
+                _validated.popitem(last=False)
+
+
+def clear_validated():
+    """ Forget which instances have been validated """
+    with _lock:
+        _validated.clear()
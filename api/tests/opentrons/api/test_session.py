@@ -4,6 +4,7 @@ import pytest
 
 from opentrons.api.session import (
     _accumulate, _get_labware, _dedupe)
+from opentrons.hardware_control import adapters
 from tests.opentrons.conftest import state
 from opentrons.legacy_api.robot.robot import Robot
 from functools import partial
@@ -112,6 +113,25 @@ def test_load_protocol_with_error_v1(session_manager, hardware):
     assert args == "name 'blah' is not defined"
 
 
+@pytest.mark.api2_only
+@pytest.mark.parametrize('protocol_file', ['testosaur_v2.py'])
+def test_sessions_share_simulator(
+        session_manager, protocol, protocol_file, monkeypatch):
+    pool = adapters.SimulatorPool()
+    monkeypatch.setattr(adapters, 'simulator_pool', pool)
+    first = session_manager.create(name='<blank>', contents=protocol.text)
+    simulator = first._simulator
+    second = session_manager.create(name='<blank>', contents=protocol.text)
+    assert first._simulator is None
+    assert second._simulator is simulator
+    assert pool.builds == 1
+
+    session_manager.clear()
+    assert second._simulator is None
+    assert pool.acquire() is simulator
+    assert pool.builds == 1
+
+
 @pytest.mark.api2_only
 @pytest.mark.parametrize('protocol_file', ['testosaur_v2.py'])
 async def test_load_and_run_v2(
@@ -156,6 +176,38 @@ async def test_load_and_run_v2(
     assert session.protocol_text == protocol.text
 
 
+@pytest.mark.api2_only
+@pytest.mark.parametrize('protocol_file', ['testosaur_v2.py'])
+async def test_state_updates_skip_unchanged_errors(
+    main_router,
+    protocol,
+    protocol_file,
+    loop
+):
+    session = main_router.session_manager.create(
+        name='<blank>',
+        contents=protocol.text)
+
+    await loop.run_in_executor(executor=None, func=session.run)
+    session.error_append(Exception('Foo'))
+    session.set_state('error')
+
+    updates = []
+    async for notification in main_router.notifications:
+        payload = notification['payload']
+        if type(payload) is dict:
+            updates.append(payload)
+            if payload['state'] == 'error':
+                break
+
+    # Errors are sent with the first update of the run (they were cleared)
+    # and again only once they change
+    assert len(updates) > 3
+    assert [('errors' in update) for update in updates] == \
+        [True] + [False] * (len(updates) - 2) + [True]
+    assert updates[-1]['errors'][0]['error'].args == ('Foo',)
+
+
 @pytest.mark.api1_only
 @pytest.mark.parametrize('protocol_file', ['testosaur.py'])
 async def test_load_and_run(
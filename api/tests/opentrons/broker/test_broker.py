@@ -66,3 +66,33 @@ def test_add_listener():
     fake_obj.A(0, 2)
 
     assert calls == expected, 'No calls expected after unsubscribe()'
+
+
+def test_no_subscribers_skips_command():
+    built = []
+
+    def counting_command(arg1, meta=None):
+        built.append(arg1)
+        return my_command(arg1, meta=meta)
+
+    class Counted(CommandPublisher):
+        def __init__(self):
+            super().__init__(None)
+
+        @commands.publish.both(command=counting_command, meta='{arg1}')
+        def A(self, arg1):
+            return arg1
+
+    obj = Counted()
+    assert obj.A(1) == 1
+    assert built == []
+
+    messages = []
+    unsubscribe = obj.broker.subscribe('command', messages.append)
+    obj.A(2)
+    assert built == [2, 2]
+    assert [m['$'] for m in messages] == ['before', 'after']
+
+    unsubscribe()
+    obj.A(3)
+    assert built == [2, 2]
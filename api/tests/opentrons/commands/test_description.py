@@ -23,3 +23,8 @@ def test_all(containers):
         'wells A1...H1 in "11"'
     assert stringify_location(containers['11'].rows('A', 'B')) == \
         'wells A1...B12 in "11"'
+
+
+def test_lazy_location():
+    lazy = (loc for loc in [])
+    assert stringify_location(lazy) == 'each location in the lazy plan'
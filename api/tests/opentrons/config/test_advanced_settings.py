@@ -0,0 +1,38 @@
+import json
+
+from opentrons.config import CONFIG, advanced_settings
+
+
+def test_settings_read_once():
+    advanced_settings.set_adv_setting('shortFixedTrash', True)
+    reads = advanced_settings.disk_reads()
+    for _ in range(10):
+        assert advanced_settings.get_adv_setting('shortFixedTrash') is True
+        assert advanced_settings.get_adv_setting('calibrateToBottom') is None
+    advanced_settings.set_adv_setting('calibrateToBottom', True)
+    assert advanced_settings.get_adv_setting('calibrateToBottom') is True
+    assert advanced_settings.get_all_adv_settings()[
+        'shortFixedTrash']['value'] is True
+    assert advanced_settings.disk_reads() == reads
+
+
+def test_settings_reread_after_change():
+    settings_file = CONFIG['feature_flags_file']
+    advanced_settings.set_adv_setting('shortFixedTrash', True)
+    reads = advanced_settings.disk_reads()
+
+    # Someone else changing the file
+    data = json.loads(settings_file.read_text())
+    data['shortFixedTrash'] = None
+    data['deckCalibrationDots'] = True
+    settings_file.write_text(json.dumps(data) + ' ' * 10)
+    assert advanced_settings.get_adv_setting('shortFixedTrash') is None
+    assert advanced_settings.get_adv_setting('deckCalibrationDots') is True
+    assert advanced_settings.disk_reads() == reads + 1
+
+    # ...or removing it
+    settings_file.unlink()
+    assert advanced_settings.get_adv_setting('deckCalibrationDots') is None
+    assert advanced_settings.disk_reads() == reads + 2
+    # which recreates it
+    assert settings_file.exists()
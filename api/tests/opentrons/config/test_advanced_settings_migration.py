@@ -1,7 +1,7 @@
 from opentrons.config.advanced_settings import _migrate
 
 
-good_file_version = 3
+good_file_version = 4
 good_file_settings = {
     'shortFixedTrash': None,
     'calibrateToBottom': None,
@@ -10,7 +10,8 @@ good_file_settings = {
     'useProtocolApi2': None,
     'useOldAspirationFunctions': None,
     'disableLogAggregation': None,
-    'enableApi1BackCompat': None
+    'enableApi1BackCompat': None,
+    'enableSmoothieStreaming': None
 }
 
 
@@ -40,7 +41,8 @@ def test_migrates_versionless_new_config():
       'useProtocolApi2': None,
       'useOldAspirationFunctions': True,
       'disableLogAggregation': None,
-      'enableApi1BackCompat': None
+      'enableApi1BackCompat': None,
+      'enableSmoothieStreaming': None
     }
 
 
@@ -61,7 +63,8 @@ def test_migrates_versionless_old_config():
       'useProtocolApi2': None,
       'useOldAspirationFunctions': None,
       'disableLogAggregation': None,
-      'enableApi1BackCompat': None
+      'enableApi1BackCompat': None,
+      'enableSmoothieStreaming': None
     }
 
 
@@ -80,7 +83,8 @@ def test_ignores_invalid_keys():
       'useProtocolApi2': None,
       'useOldAspirationFunctions': None,
       'disableLogAggregation': None,
-      'enableApi1BackCompat': None
+      'enableApi1BackCompat': None,
+      'enableSmoothieStreaming': None
     }
 
 
@@ -94,7 +98,7 @@ def test_migrates_v1_config():
       'useProtocolApi2': False,
       'useOldAspirationFunctions': True,
     })
-    assert version == 3
+    assert version == 4
     assert settings == {
         'shortFixedTrash': True,
         'calibrateToBottom': True,
@@ -103,7 +107,8 @@ def test_migrates_v1_config():
         'useProtocolApi2': False,
         'useOldAspirationFunctions': True,
         'disableLogAggregation': None,
-        'enableApi1BackCompat': None
+        'enableApi1BackCompat': None,
+        'enableSmoothieStreaming': None
     }
 
 
@@ -119,7 +124,7 @@ def test_migrates_v2_config():
         'disableLogAggregation': False,
     })
 
-    assert version == 3
+    assert version == 4
     assert settings == {
         'shortFixedTrash': True,
         'calibrateToBottom': True,
@@ -128,5 +133,33 @@ def test_migrates_v2_config():
         'useProtocolApi2': False,
         'useOldAspirationFunctions': True,
         'disableLogAggregation': False,
-        'enableApi1BackCompat': None
+        'enableApi1BackCompat': None,
+        'enableSmoothieStreaming': None
+    }
+
+
+def test_migrates_v3_config():
+    settings, version = _migrate({
+        '_version': 3,
+        'shortFixedTrash': True,
+        'calibrateToBottom': True,
+        'deckCalibrationDots': False,
+        'disableHomeOnBoot': True,
+        'useProtocolApi2': False,
+        'useOldAspirationFunctions': True,
+        'disableLogAggregation': False,
+        'enableApi1BackCompat': True,
+    })
+
+    assert version == 4
+    assert settings == {
+        'shortFixedTrash': True,
+        'calibrateToBottom': True,
+        'deckCalibrationDots': False,
+        'disableHomeOnBoot': True,
+        'useProtocolApi2': False,
+        'useOldAspirationFunctions': True,
+        'disableLogAggregation': False,
+        'enableApi1BackCompat': True,
+        'enableSmoothieStreaming': None
     }
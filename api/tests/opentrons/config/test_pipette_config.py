@@ -133,6 +133,26 @@ def test_override_load():
     assert unspecced == new_pconf
 
 
+def test_override_changes_reloaded():
+    cdir = CONFIG['pipette_config_overrides_dir']
+    pipette_id = 'a0s9d8f7g6h5j4k3'
+    model = 'p300_single_v1.5'
+
+    # The first load saves default overrides, and isn't cached
+    assert pipette_config.load(model, pipette_id)\
+        is not pipette_config.load(model, pipette_id)
+    first = pipette_config.load(model, pipette_id)
+    assert pipette_config.load(model, pipette_id) is first
+    with pytest.raises(TypeError):
+        first.quirks.append('dropTipShake')
+
+    with (cdir/f'{pipette_id}.json').open('w') as ovf:
+        json.dump({'pickUpCurrent': {'value': 0.2}, 'model': model}, ovf)
+    changed = pipette_config.load(model, pipette_id)
+    assert changed.pick_up_current == 0.2
+    assert pipette_config.load(model, pipette_id) is changed
+
+
 def test_override_save():
     cdir = CONFIG['pipette_config_overrides_dir']
 
@@ -0,0 +1,260 @@
+import asyncio
+import os
+import pty
+import select
+import threading
+import time
+
+import pytest
+
+from opentrons.drivers import serial_reactor
+from opentrons.drivers.serial_communication import SerialNoResponse
+from opentrons.drivers.temp_deck import TempDeck
+from opentrons.drivers.thermocycler import Thermocycler
+
+ACK = 'ok\r\nok\r\n'
+
+
+class FakeModule:
+    """ Stands in for a module at the other end of a pty, answering each
+    command it reads with ``respond(command)`` followed by the ack """
+
+    def __init__(self, respond, terminator=b'\r\n\r\n', delay=0):
+        self.commands = []
+        self._respond = respond
+        self._terminator = terminator
+        self._delay = delay
+        self._master, self._slave = pty.openpty()
+        self.port = os.ttyname(self._slave)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._serve)
+        self._thread.start()
+
+    def _serve(self):
+        received = b''
+        while not self._stop.is_set():
+            ready, _, _ = select.select([self._master], [], [], 0.01)
+            if not ready:
+                continue
+            received += os.read(self._master, 1024)
+            while self._terminator in received:
+                line, received = received.split(self._terminator, 1)
+                command = line.decode().strip()
+                self.commands.append(command)
+                time.sleep(self._delay)
+                response = self._respond(command)
+                if response is not None:
+                    self.write(response + ACK)
+
+    def write(self, data):
+        os.write(self._master, data.encode())
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        os.close(self._master)
+        os.close(self._slave)
+
+
+@pytest.fixture
+def fake_module():
+    modules = []
+
+    def _build(*args, **kwargs):
+        module = FakeModule(*args, **kwargs)
+        modules.append(module)
+        return module
+
+    yield _build
+    for module in modules:
+        module.stop()
+
+
+def test_send_and_priorities(fake_module):
+    device = fake_module(lambda command: f'echo:{command}', delay=0.05)
+    channel = serial_reactor.connect(port=device.port)
+    assert channel.is_open
+    assert channel.send('M105 \r\n\r\n', ACK, 1) == 'echo:M105'
+
+    # While the first command is in flight, a command queued after a poll
+    # is still sent before it
+    first = channel.submit('first \r\n\r\n', ACK, 1)
+    poll = channel.submit('poll \r\n\r\n', ACK, 1,
+                          priority=serial_reactor.POLL_PRIORITY)
+    command = channel.submit('command \r\n\r\n', ACK, 1)
+    for future in (first, poll, command):
+        future.result()
+    assert device.commands[1:] == ['first', 'command', 'poll']
+
+    channel.close()
+    assert not channel.is_open
+    with pytest.raises(Exception):
+        channel.send('M105 \r\n\r\n', ACK, 1)
+
+
+def test_no_response(fake_module):
+    device = fake_module(lambda command: None)
+    channel = serial_reactor.connect(port=device.port)
+    with pytest.raises(SerialNoResponse):
+        channel.send('M105 \r\n\r\n', ACK, 0.1, retries=2)
+    # Each attempt writes the command again
+    assert device.commands == ['M105', 'M105']
+    channel.close()
+
+
+async def test_send_async_and_unsolicited(fake_module):
+    device = fake_module(lambda command: command.lower())
+    channel = serial_reactor.connect(port=device.port)
+    assert await channel.send_async('M119 \r\n\r\n', ACK, 1) == 'm119'
+
+    lines = []
+    channel.on_unsolicited('\r\n', lines.append)
+    device.write('Lid:open\r\n')
+    for _ in range(100):
+        if lines:
+            break
+        await asyncio.sleep(0.01)
+    assert lines == [b'Lid:open\r\n']
+    channel.close()
+
+
+def test_poll_rate():
+    woken = []
+    rate = serial_reactor.PollRate(1, 8)
+    rate.add_waker(lambda: woken.append(True))
+    assert rate.interval == 1
+    intervals = []
+    for _ in range(5):
+        rate.steady()
+        intervals.append(rate.interval)
+    assert intervals == [2, 4, 8, 8, 8]
+    with rate.watch():
+        assert rate.interval == 1
+    assert rate.interval == 8
+    assert len(woken) == 1
+    rate.changing()
+    assert rate.interval == 1
+    assert len(woken) == 2
+    # Already polling as fast as possible, so there is nothing to wake
+    rate.changing()
+    assert len(woken) == 2
+
+
+def test_adaptive_poll(fake_module):
+    device = fake_module(lambda command: command)
+    channel = serial_reactor.connect(port=device.port)
+    rate = serial_reactor.PollRate(0.01, 5)
+    polled = []
+
+    def steady(response):
+        polled.append(response)
+        rate.steady()
+
+    channel.poll('poll \r\n\r\n', ACK, 1, rate, steady)
+    for _ in range(100):
+        if polled:
+            break
+        time.sleep(0.01)
+    # Back off the rest of the way without waiting for it
+    for _ in range(10):
+        rate.steady()
+    assert rate.interval == 5
+    time.sleep(0.1)
+    backed_off = len(polled)
+    time.sleep(0.2)
+    assert len(polled) == backed_off
+
+    # A command is followed by a poll straight away
+    assert channel.send('command \r\n\r\n', ACK, 1) == 'command'
+    for _ in range(100):
+        if len(polled) > backed_off:
+            break
+        time.sleep(0.01)
+    assert device.commands[-2:] == ['command', 'poll']
+
+    # Watching wakes the poll and keeps it fast
+    with rate.watch():
+        for _ in range(100):
+            if len(polled) > backed_off + 3:
+                break
+            time.sleep(0.01)
+        assert len(polled) > backed_off + 3
+
+    metrics = channel.metrics
+    assert metrics['commandsSent'] == 1
+    assert metrics['pollsSent'] == len(polled)
+    assert 0 < metrics['utilization'] < 1
+    assert metrics['pollIntervals'] == [5]
+    channel.close()
+
+
+def test_one_thread_for_all_modules(fake_module):
+    temps = iter(range(1000))
+    decks = []
+    polled = []
+    serial_reactor.reactor.loop
+    threads = threading.active_count()
+    for _ in range(5):
+        device = fake_module(
+            lambda command: f'T:none C:{next(temps)}'
+            if command == 'M105' else '')
+        deck = TempDeck()
+        assert deck.connect(device.port) == ''
+        deck.start_polling(0.01, lambda: polled.append(True))
+        decks.append(deck)
+    # Only the fake modules have threads of their own
+    assert threading.active_count() == threads + len(decks)
+
+    for deck in decks:
+        start = deck.temperature
+        for _ in range(100):
+            if deck.temperature != start:
+                break
+            time.sleep(0.01)
+        assert deck.temperature != start
+        deck.disconnect()
+    assert polled
+
+
+async def test_thermocycler(fake_module):
+    responses = {
+        'M119': 'Lid:closed',
+        'M105': 'T:95.0 C:77.4 H:600',
+        'M141': 'T:105.0 C:30.0',
+        'M104 S40': '',
+        'M18': 'ERROR: it broke'}
+    device = fake_module(lambda command: responses[command],
+                         terminator=b'\r\n')
+    interrupts = []
+    updates = []
+    tc = Thermocycler(interrupts.append, lambda: updates.append(True))
+    await tc.connect(device.port)
+    assert tc.is_connected()
+    assert tc.port == device.port
+    assert tc.lid_status == 'closed'
+
+    await tc._write_and_wait('M104 S40')
+    with pytest.raises(Exception):
+        await tc.deactivate()
+
+    # Each command is followed by a poll of everything. Let those finish so
+    # the interrupt arrives between responses
+    for _ in range(100):
+        if device.commands[-3:] == ['M105', 'M119', 'M141']:
+            break
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)
+    device.write('Lid:open\r\n')
+    for _ in range(300):
+        if interrupts and tc.temperature is not None\
+                and tc.lid_temp is not None:
+            break
+        await asyncio.sleep(0.01)
+    assert interrupts == [b'Lid:open\r\n']
+    assert tc.temperature == 77.4
+    assert tc.target == 95.0
+    assert tc.lid_temp == 30.0
+    assert updates
+
+    tc.disconnect()
+    assert not tc.is_connected()
@@ -119,22 +119,19 @@ async def test_set_temp_deck_temperature(monkeypatch):
 
 
 async def test_fail_set_temp_deck_temperature(monkeypatch):
-    import types
-    from opentrons.drivers import serial_communication
-
     error_msg = 'ERROR: some error here'
 
-    def _raise_error(
-            self, command, ack, serial_connection, timeout=None, tag=None):
-        nonlocal error_msg
-        return error_msg
+    class MockConnection:
+        is_open = True
 
-    serial_communication.write_and_return = types.MethodType(
-        _raise_error, serial_communication)
+        def send(self, command, ack, timeout, retries=1):
+            nonlocal error_msg
+            return error_msg
 
     from opentrons.drivers.temp_deck import TempDeck
     temp_deck = TempDeck()
     temp_deck.simulating = False
+    temp_deck._connection = MockConnection()
 
     try:
         res = await asyncio.wait_for(temp_deck.set_temperature(-9),
@@ -145,14 +142,6 @@ async def test_fail_set_temp_deck_temperature(monkeypatch):
 
     error_msg = 'Alarm: something alarming happened here'
 
-    def _raise_error(
-            self, command, ack, serial_connection, timeout=None, tag=None):
-        nonlocal error_msg
-        return error_msg
-
-    serial_communication.write_and_return = types.MethodType(
-        _raise_error, serial_communication)
-
     try:
         res = await asyncio.wait_for(temp_deck.set_temperature(-9),
                                      timeout=0.2)
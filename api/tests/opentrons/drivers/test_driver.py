@@ -1027,3 +1027,140 @@ def test_alarm_unhandled(smoothie, robot, monkeypatch):
         robot._driver.move({'X': 25})
 
     assert not robot._driver._is_hard_halting.is_set()
+
+
+def test_streaming_moves(smoothie, monkeypatch):
+    from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+        serial_communication, SMOOTHIE_ACK)
+
+    driver = smoothie
+    driver.home('xyza')
+    driver._streaming = True
+    driver._streaming_window = 2
+    driver.simulating = False
+    cmd_list = []
+    acks_read = []
+
+    def write_and_return_mock(command, ack, serial_connection, timeout,
+                              tag=None):
+        cmd_list.append(command.strip())
+        if 'M114.2' in command:
+            return 'ok M114.2 X:10 Y:20 Z:30 A:40 B:50 C:60'
+        return SMOOTHIE_ACK
+
+    def write_mock(command, serial_connection, tag=None):
+        cmd_list.append(command.strip())
+
+    def read_response_mock(ack, serial_connection, timeout, tag=None):
+        acks_read.append(len(cmd_list))
+        return ''
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_and_return_mock)
+    monkeypatch.setattr(serial_communication, 'write', write_mock)
+    monkeypatch.setattr(
+        serial_communication, 'read_response', read_response_mock)
+
+    driver.move({'X': 10})
+    driver.move({'X': 20})
+    driver.move({'X': 30})
+    driver.update_position()
+
+    assert cmd_list == [
+        'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X10',
+        'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X20',
+        # the window is full, so the first move's ack is read before this
+        'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X30',
+        # reading the position is a synchronization point
+        'M114.2',
+        'M400',
+    ]
+    assert acks_read == [2, 3, 3]
+    assert not driver._in_flight
+    assert driver.position['X'] == 10
+
+
+def test_streaming_alarm_reports_streamed_command(smoothie, monkeypatch):
+    from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+        serial_communication, SMOOTHIE_ACK, SmoothieError)
+
+    driver = smoothie
+    driver.home('xyza')
+    driver._streaming = True
+    driver.simulating = False
+    cmd_list = []
+
+    def write_and_return_mock(command, ack, serial_connection, timeout,
+                              tag=None):
+        cmd_list.append(command.strip())
+        if 'M114.2' in command:
+            return 'ok M114.2 X:10 Y:20 Z:30 A:40 B:50 C:60'
+        return SMOOTHIE_ACK
+
+    def write_mock(command, serial_connection, tag=None):
+        cmd_list.append(command.strip())
+
+    alarms = ['ALARM: Hard limit +X']
+
+    def read_response_mock(ack, serial_connection, timeout, tag=None):
+        return alarms.pop() if alarms else ''
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_and_return_mock)
+    monkeypatch.setattr(serial_communication, 'write', write_mock)
+    monkeypatch.setattr(
+        serial_communication, 'read_response', read_response_mock)
+    monkeypatch.setattr(serial_communication, 'clear_buffer', lambda c: None)
+
+    driver.move({'X': 10})
+    with pytest.raises(SmoothieError) as e:
+        driver.move({'Y': 10})
+
+    assert e.value.command ==\
+        'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X10'
+    assert not driver._in_flight
+    # the alarm is cleared and the axis that hit its limit switch is homed
+    assert cmd_list[:3] == [
+        'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X10',
+        'M999',
+        'M400',
+    ]
+    assert 'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G28.2X'\
+        in cmd_list
+
+
+def test_streaming_pause_waits_for_motion(smoothie, monkeypatch):
+    from opentrons.drivers.smoothie_drivers.driver_3_0 import (
+        serial_communication, SMOOTHIE_ACK)
+
+    driver = smoothie
+    driver.home('xyza')
+    driver._streaming = True
+    driver.simulating = False
+    cmd_list = []
+
+    def write_and_return_mock(command, ack, serial_connection, timeout,
+                              tag=None):
+        cmd_list.append(command.strip())
+        return SMOOTHIE_ACK
+
+    def write_mock(command, serial_connection, tag=None):
+        cmd_list.append(command.strip())
+
+    monkeypatch.setattr(
+        serial_communication, 'write_and_return', write_and_return_mock)
+    monkeypatch.setattr(serial_communication, 'write', write_mock)
+    monkeypatch.setattr(
+        serial_communication, 'read_response', lambda *args, **kwargs: '')
+
+    driver.move({'X': 10})
+    assert driver._in_flight
+    driver.pause()
+    # the robot comes to rest before the pause takes effect
+    assert cmd_list == [
+        'M907 A0.1 B0.05 C0.05 X1.25 Y0.3 Z0.1 G4P0.005 G0X10',
+        'M400',
+    ]
+    assert not driver._in_flight
+    assert not driver.run_flag.is_set()
+    driver.resume()
@@ -36,14 +36,11 @@ async def test_sim_update():
 
 async def test_poller(monkeypatch):
     temp = modules.tempdeck.TempDeck('', True)
-    hit = False
+    polls = []
 
-    def update_called():
-        nonlocal hit
-        hit = True
+    def start_polling(interval, callback):
+        polls.append((interval, callback))
 
-    monkeypatch.setattr(temp._driver, 'update_temperature', update_called)
+    monkeypatch.setattr(temp._driver, 'start_polling', start_polling)
     await temp._connect()
-    assert temp._poller.is_alive()
-    await asyncio.sleep(tempdeck.TEMP_POLL_INTERVAL_SECS * 1.1)
-    assert hit
+    assert polls == [(tempdeck.TEMP_POLL_INTERVAL_SECS, temp._record_sample)]
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+
+from opentrons.hardware_control import modules
+from opentrons.hardware_control.modules.telemetry import SampleHistory
+
+
+def test_ring_buffer():
+    history = SampleHistory(('temp', 'engaged'), size=4)
+    assert history.since(0) == (0, [])
+    for second in range(6):
+        history.record({'temp': second * 10,
+                        'engaged': second % 2 == 1,
+                        'other': 'ignored'},
+                       timestamp=100 + second)
+    # Only the last four samples are kept
+    count, samples = history.since(0)
+    assert count == 6
+    assert [sample['timestamp'] for sample in samples] == [102, 103, 104, 105]
+    assert samples[0] == {'timestamp': 102, 'temp': 20, 'engaged': 0}
+    assert samples[1]['engaged'] == 1
+
+    assert history.since(103.5)[1] == samples[2:]
+    assert history.since(200) == (6, [])
+    assert history.after(4) == (6, samples[2:])
+    assert history.after(0) == (6, samples)
+
+    history.record({'temp': None}, timestamp=106)
+    assert history.after(6)[1] == [
+        {'timestamp': 106, 'temp': None, 'engaged': None}]
+
+
+async def test_wait_for_samples(loop):
+    history = SampleHistory(('temp',))
+    waiting = loop.create_task(history.wait(0))
+    await asyncio.sleep(0.01)
+    assert not waiting.done()
+    # Samples may be recorded from another thread, like the serial reactor
+    recorder = threading.Thread(target=history.record, args=({'temp': 4},))
+    recorder.start()
+    recorder.join()
+    await asyncio.wait_for(waiting, 1)
+    await asyncio.wait_for(history.wait(0), 1)
+
+
+async def test_modules_record_samples():
+    temp = await modules.build('', 'tempdeck', True, lambda x: None)
+    await temp.set_temperature(10)
+    temp.deactivate()
+    assert [sample['targetTemp'] for sample in temp.history.since(0)[1]]\
+        == [None, 10, None]
+
+    mag = await modules.build('', 'magdeck', True, lambda x: None)
+    mag.engage(10)
+    mag.deactivate()
+    assert [sample['engaged'] for sample in mag.history.since(0)[1]]\
+        == [0, 1, 0]
+
+    therm = await modules.build('', 'thermocycler', True, lambda x: None)
+    await therm.set_temperature(40)
+    await therm.set_lid_temperature(105)
+    samples = therm.history.since(0)[1]
+    assert samples[-1]['targetTemp'] == 40
+    assert samples[-1]['lidTarget'] == 105
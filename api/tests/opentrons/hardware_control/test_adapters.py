@@ -1,5 +1,7 @@
+import pytest
+
 from opentrons.types import Mount
-from opentrons.hardware_control import adapters, API
+from opentrons.hardware_control import adapters, API, MustHomeError
 
 
 def test_synch_adapter(loop):
@@ -9,3 +11,33 @@ def test_synch_adapter(loop):
     assert synch.attached_instruments[Mount.LEFT]['name']\
                 .startswith('p10_single')
     synch.join()
+
+
+def test_simulator_pool():
+    pool = adapters.SimulatorPool(maxsize=1)
+    synch = pool.acquire({Mount.LEFT: {'model': 'p10_single_v1', 'id': 'a'}})
+    synch.cache_instruments()
+    synch.home()
+    assert synch.attached_instruments[Mount.LEFT]['name'] == 'p10_single'
+    old_api = synch._api
+    pool.release(synch)
+    assert synch.is_alive()
+
+    # The same adapter comes back, around a new simulator
+    reused = pool.acquire()
+    assert reused is synch
+    assert reused._api is not old_api
+    reused.cache_instruments()
+    assert reused.attached_instruments[Mount.LEFT] == {}
+    with pytest.raises(MustHomeError):
+        reused.current_position(Mount.LEFT)
+    assert pool.builds == 1
+
+    # Only maxsize adapters are kept, and the rest are stopped
+    other = pool.acquire()
+    assert pool.builds == 2
+    pool.release(reused)
+    pool.release(other)
+    assert not other.is_alive()
+    pool.clear()
+    assert not reused.is_alive()
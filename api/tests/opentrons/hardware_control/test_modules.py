@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import opentrons.hardware_control as hardware_control
 
@@ -92,3 +94,95 @@ async def test_module_update_integration(monkeypatch, loop,
     assert ok
     new_modules = await api.discover_modules()
     assert new_modules[0] is not modules[0]
+
+
+async def test_simulated_modules_advance_clock():
+    api = hardware_control.API.build_hardware_simulator(
+        attached_modules=['thermocycler', 'tempdeck'])
+    mods = {mod.name(): mod for mod in await api.discover_modules()}
+
+    await mods['thermocycler'].set_temperature(95, hold_time_seconds=30)
+    # Heating from room temperature at the maximum rate, then holding
+    assert api.simulated_time == pytest.approx((95 - 25) / 4 + 30)
+    await mods['thermocycler'].set_temperature(55, ramp_rate=1)
+    assert api.simulated_time == pytest.approx((95 - 25) / 4 + 30 + 40)
+
+    before = api.simulated_time
+    await mods['tempdeck'].set_temperature(4)
+    assert api.simulated_time > before
+
+
+@pytest.mark.parametrize('inotify', [True, False])
+async def test_directory_watcher(loop, tmpdir, monkeypatch, inotify):
+    if not inotify:
+        monkeypatch.setattr(hardware_control.modules.watcher,
+                            '_inotify_fd', lambda path: None)
+    watched = tmpdir.join('modules')
+    watcher = hardware_control.modules.DirectoryWatcher(
+        str(watched), loop, poll_interval=0.01)
+    assert not watcher.uses_inotify
+
+    # Polled until the directory shows up, and then watched with inotify
+    # if it can be
+    watched.mkdir()
+    await asyncio.wait_for(watcher.changed(), 1)
+    if inotify and not watcher.uses_inotify:
+        pytest.skip('inotify not available')
+    assert watcher.uses_inotify == inotify
+
+    changed = asyncio.ensure_future(watcher.changed())
+    await asyncio.sleep(0.05)
+    assert not changed.done()
+    watched.join('tempdeck0').ensure()
+    await asyncio.wait_for(changed, 1)
+    watched.join('tempdeck0').remove()
+    await asyncio.wait_for(watcher.changed(), 1)
+    watcher.close()
+
+
+async def test_watch_modules(loop, tmpdir, monkeypatch):
+    api = hardware_control.API.build_hardware_simulator(loop=loop)
+    monkeypatch.setattr(api._backend, 'get_attached_modules',
+                        lambda: hardware_control.modules.discover(str(tmpdir)))
+    monkeypatch.setattr(
+        api._backend, 'module_watcher',
+        lambda loop: hardware_control.modules.DirectoryWatcher(
+            str(tmpdir), loop, poll_interval=0.01))
+    scans = 0
+    discover = hardware_control.modules.discover
+
+    def counting_discover(directory=None):
+        nonlocal scans
+        scans += 1
+        return discover(directory)
+
+    monkeypatch.setattr(hardware_control.modules, 'discover',
+                        counting_discover)
+
+    async def attached(names):
+        while sorted(mod.name() for mod in await api.discover_modules())\
+                != names:
+            await asyncio.sleep(0.01)
+
+    watch = loop.create_task(api.watch_modules())
+    tmpdir.join('tempdeck0').ensure()
+    tmpdir.join('magdeck1').ensure()
+    await asyncio.wait_for(attached(['magdeck', 'tempdeck']), 2)
+    ports = sorted(mod.port for mod in await api.discover_modules())
+    assert ports == [str(tmpdir.join('magdeck1')),
+                     str(tmpdir.join('tempdeck0'))]
+
+    # Asking for the modules doesn't look for them while they are watched
+    before = scans
+    for _ in range(10):
+        await api.discover_modules()
+    assert scans == before
+
+    tmpdir.join('magdeck1').remove()
+    await asyncio.wait_for(attached(['tempdeck']), 2)
+
+    watch.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await watch
+    await api.discover_modules()
+    assert scans > before
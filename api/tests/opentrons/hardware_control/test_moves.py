@@ -1,8 +1,12 @@
+import asyncio
+import threading
+import time
 from unittest import mock
 import pytest
 from opentrons import types
 from opentrons import hardware_control as hc
 from opentrons.config import robot_configs
+from opentrons.hardware_control import time_estimate
 from opentrons.hardware_control.types import Axis, CriticalPoint
 
 
@@ -135,6 +139,31 @@ async def test_move_extras_passed_through(hardware_api, monkeypatch):
     assert mock_be_move.call_args_list[0][1]['axis_max_speeds'] == {'Y': 20}
 
 
+async def test_move_through(hardware_api, monkeypatch, loop):
+    by_segment = hc.API.build_hardware_simulator(loop=loop)
+    moves = [(types.Point(30, 20, 100), None),
+             (types.Point(60, 40, 100), CriticalPoint.MOUNT),
+             (types.Point(60, 40, 10), None)]
+    await by_segment.home()
+    for point, critical_point in moves:
+        await by_segment.move_to(types.Mount.LEFT, point, speed=30,
+                                 critical_point=critical_point,
+                                 max_speeds={Axis.X: 10})
+
+    be_move_through = mock.Mock(wraps=hardware_api._backend.move_through)
+    monkeypatch.setattr(
+        hardware_api._backend, 'move_through', be_move_through)
+    await hardware_api.home()
+    await hardware_api.move_through(types.Mount.LEFT, moves, speed=30,
+                                    max_speeds={Axis.X: 10})
+    be_move_through.assert_called_once()
+    assert len(be_move_through.call_args[0][0]) == 3
+    assert be_move_through.call_args[1] == {'speed': 30,
+                                            'axis_max_speeds': {'X': 10}}
+    assert hardware_api._current_position == by_segment._current_position
+    assert hardware_api.simulated_time == by_segment.simulated_time
+
+
 async def test_mount_offset_applied(hardware_api):
     await hardware_api.home()
     abs_position = types.Point(30, 20, 10)
@@ -399,3 +428,70 @@ async def test_shake_during_drop(hardware_api, monkeypatch):
         mock.call(types.Mount.RIGHT, types.Point(-1, 0, 0), speed=50),
         mock.call(types.Mount.RIGHT, types.Point(0, 0, 20))]
     move_rel.assert_has_calls(move_rel_calls)
+
+
+async def test_backend_calls_do_not_block_loop(loop):
+    sim = hc.API.build_hardware_simulator(loop=loop)._backend
+    move_threads = []
+
+    class SlowBackend:
+        """ A backend that blocks like a real smoothie would """
+        def __getattr__(self, name):
+            return getattr(sim, name)
+
+        def home(self, axes=None):
+            move_threads.append(threading.current_thread())
+            time.sleep(0.2)
+            return sim.home(axes)
+
+    api = hc.API(SlowBackend(), loop=loop)
+    homing = loop.create_task(api.home())
+    ticks = 0
+    while not homing.done():
+        ticks += 1
+        await asyncio.sleep(0.01)
+    await homing
+
+    # one gantry home and one home per plunger, all on the worker thread
+    assert len(move_threads) == 3
+    assert len(set(move_threads)) == 1
+    assert move_threads[0] is not threading.main_thread()
+    assert ticks > 20
+
+
+async def test_simulator_estimates_time(loop):
+    config = robot_configs.build_config({}, {})
+    hardware = hc.API.build_hardware_simulator(loop=loop, config=config)
+    await hardware.home()
+    homed = hardware.simulated_time
+
+    await hardware.move_rel(types.Mount.RIGHT, types.Point(-100, 0, 0))
+    fast = hardware.simulated_time - homed
+    # A 100mm move along X: the default speed of 400mm/s is reached after
+    # 400 / 3000 s (26.7 mm), so the move takes 100 / 400 + 400 / 3000 s
+    assert fast == pytest.approx(100 / 400 + 400 / 3000)
+
+    await hardware.move_rel(types.Mount.RIGHT, types.Point(100, 0, 0),
+                            speed=50)
+    slow = hardware.simulated_time - homed - fast
+    assert slow == pytest.approx(100 / 50 + 50 / 3000)
+
+    await hardware.delay(30)
+    assert hardware.simulated_time\
+        == pytest.approx(homed + fast + slow + 30)
+
+
+def test_move_duration_respects_axis_limits():
+    start = {'X': 0, 'Y': 0}
+    # Y is limited to 10mm/s, which limits the combined speed along the
+    # diagonal to 10 * sqrt(2)
+    assert time_estimate.move_duration(
+        start, {'X': 100, 'Y': 100}, 400,
+        {'X': 600, 'Y': 10}, {'X': 10000, 'Y': 10000})\
+        == pytest.approx(100 / 10 + (10 * 2 ** 0.5) / (10000 * 2 ** 0.5))
+    # A move too short to reach full speed is a triangular profile
+    assert time_estimate.move_duration(
+        start, {'X': 1}, 400, {'X': 600}, {'X': 100})\
+        == pytest.approx(2 * (1 / 100) ** 0.5)
+    assert time_estimate.move_duration(
+        start, {'X': 0}, 400, {'X': 600}, {'X': 100}) == 0
@@ -242,3 +242,115 @@ def test_serializers(paramtype, native, serializable):
     serdes = sockserv._SERDES[paramtype]
     assert serdes.serializer(native) == serializable
     assert serdes.deserializer(serializable) == native
+
+
+@pytest.mark.parametrize('framing', list(sockserv.Framing))
+def test_framers(framing):
+    messages = [
+        {'simple': 1},
+        {'nested': {'braces': [{}, {'a': None}]}},
+        {'in strings': '{"}}} \\" \\\\', 'unicode': 'µl ✓'},
+    ]
+    encoded = [json.dumps(msg, ensure_ascii=False).encode()
+               for msg in messages]
+    stream = b''.join(sockserv.frame_message(enc, framing)
+                      for enc in encoded)
+    # However the stream is split up, the same messages come out
+    for chunk_size in (1, 2, 7, len(stream)):
+        framer = sockserv._FRAMERS[framing]()
+        decoded = []
+        for start in range(0, len(stream), chunk_size):
+            framer.feed(stream[start:start + chunk_size])
+            while True:
+                message = framer.next_message()
+                if message is None:
+                    break
+                decoded.append(message)
+        assert decoded == encoded
+        assert not framer.take_buffer()
+
+
+def test_framers_must_be_complete():
+    class NoFrame(sockserv._Framer):
+        def next_message(self):
+            return None
+
+    with pytest.raises(TypeError):
+        NoFrame()
+
+
+def test_json_framer_skips_garbage():
+    framer = sockserv._JsonFramer()
+    framer.feed(b'aaaa{"a": 1}  bbbb\n{"b": "{"}')
+    assert framer.next_message() == b'{"a": 1}'
+    assert framer.next_message() == b'{"b": "{"}'
+    assert framer.next_message() is None
+
+
+async def test_pipelined_requests(hc_stream_server, loop, monkeypatch):
+    """ Every request in a chunk is run, and responses come back in the
+    order of the requests even if they finish in a different order """
+    sock, server = hc_stream_server
+    running = []
+
+    async def slow_first_dispatch(call_str):
+        call = json.loads(call_str)
+        running.append(call['id'])
+        await asyncio.sleep(0.01 * (5 - call['id']))
+        return json.dumps({'id': call['id']})
+
+    monkeypatch.setattr(server, '_dispatch', slow_first_dispatch)
+    reader, writer = await asyncio.open_unix_connection(sock)
+    writer.write(b''.join(json.dumps({'id': i}).encode() for i in range(5)))
+    decoder = sockserv.JsonStreamDecoder(reader)
+    responses = [await decoder.read_object() for _ in range(5)]
+    assert sorted(running) == list(range(5))
+    assert responses == [{'id': i} for i in range(5)]
+
+
+@pytest.mark.parametrize('framing', [sockserv.Framing.NEWLINE,
+                                     sockserv.Framing.LENGTH])
+async def test_negotiate_framing(hc_stream_server, loop, framing):
+    sock, server = hc_stream_server
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = await sockserv.negotiate_framing(reader, writer, framing)
+    for i in range(3):
+        request = json.dumps({'jsonrpc': '2.0', 'method': 'delay',
+                              'params': {'duration_s': 0}, 'id': i})
+        writer.write(sockserv.frame_message(request.encode(), framing))
+    for i in range(3):
+        assert await decoder.read_object()\
+            == {'jsonrpc': '2.0', 'result': None, 'id': i}
+    # Framing can only be chosen by the first call
+    request = json.dumps({'jsonrpc': '2.0', 'method': sockserv.FRAMING_METHOD,
+                          'params': {'framing': 'json'}, 'id': 3})
+    writer.write(sockserv.frame_message(request.encode(), framing))
+    resp = await decoder.read_object()
+    assert resp['error']['code'] == -32601
+
+
+async def test_notifications_get_no_response(hc_stream_server, loop):
+    sock, server = hc_stream_server
+    reader, writer = await asyncio.open_unix_connection(sock)
+    framing = sockserv.Framing.LENGTH
+    decoder = await sockserv.negotiate_framing(reader, writer, framing)
+    notification = json.dumps({'jsonrpc': '2.0', 'method': 'delay',
+                               'params': {'duration_s': 0}})
+    request = json.dumps({'jsonrpc': '2.0', 'method': 'delay',
+                          'params': {'duration_s': 0}, 'id': 1})
+    writer.write(sockserv.frame_message(notification.encode(), framing))
+    writer.write(sockserv.frame_message(request.encode(), framing))
+    assert await decoder.read_object()\
+        == {'jsonrpc': '2.0', 'result': None, 'id': 1}
+
+
+async def test_negotiate_bad_framing(hc_stream_server, loop):
+    sock, server = hc_stream_server
+    reader, writer = await asyncio.open_unix_connection(sock)
+    writer.write(json.dumps({
+        'jsonrpc': '2.0', 'method': sockserv.FRAMING_METHOD,
+        'params': {'framing': 'smoke signals'}, 'id': 1}).encode())
+    decoder = sockserv.JsonStreamDecoder(reader)
+    resp = await decoder.read_object()
+    assert resp['id'] == 1
+    assert resp['error']['code'] == -32602
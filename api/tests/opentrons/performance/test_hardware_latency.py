@@ -0,0 +1,61 @@
+""" Benchmark of HTTP response times while the robot is moving.
+
+Run with ``pytest -s`` to see the measured latencies.
+"""
+import asyncio
+import time
+
+from opentrons import hardware_control as hc
+from opentrons.server import init
+from opentrons.types import Mount, Point
+
+MOVE_DURATION_S = 1.0
+
+
+class SlowBackend:
+    """ A simulator that blocks in move() for as long as a real move """
+    def __init__(self, simulator):
+        self._simulator = simulator
+
+    def __getattr__(self, name):
+        return getattr(self._simulator, name)
+
+    def move(self, *args, **kwargs):
+        time.sleep(MOVE_DURATION_S)
+        return self._simulator.move(*args, **kwargs)
+
+
+async def _latencies_during_move(hardware, client, path, loop):
+    latencies = []
+    moving = loop.create_task(
+        hardware.move_to(Mount.RIGHT, Point(100, 100, 100)))
+    while not moving.done():
+        then = time.perf_counter()
+        resp = await client.get(path)
+        assert resp.status == 200
+        latencies.append(time.perf_counter() - then)
+        await asyncio.sleep(0.05)
+    await moving
+    return latencies
+
+
+async def test_latency_during_long_move(loop, aiohttp_client, monkeypatch):
+    # The server only treats the hardware as an API instance (rather than
+    # the legacy robot) when protocol api v2 is enabled
+    monkeypatch.setenv('OT_API_FF_useProtocolApi2', 'true')
+    sim = hc.API.build_hardware_simulator(loop=loop)._backend
+    hardware = hc.API(SlowBackend(sim), loop=loop)
+    await hardware.home()
+    client = await aiohttp_client(init(hardware, loop=loop))
+
+    for path in ['/health', '/modules']:
+        latencies = await _latencies_during_move(
+            hardware, client, path, loop)
+        print(f'{path} during a {MOVE_DURATION_S}s move: '
+              f'{len(latencies)} requests, '
+              f'max {max(latencies)*1000:.1f}ms, '
+              f'mean {sum(latencies)/len(latencies)*1000:.1f}ms')
+        # Before backend calls were moved off the loop, a request made
+        # during a move could not be answered until the move was done
+        assert len(latencies) > 1
+        assert max(latencies) < MOVE_DURATION_S / 2
@@ -0,0 +1,59 @@
+""" Import time of the opentrons package, measured with
+``python -X importtime`` in a fresh interpreter.
+
+Importing opentrons should not build the legacy robot or migrate the
+labware database; that happens the first time a legacy name like
+``opentrons.robot`` is used. The reference is importing the legacy api
+eagerly, as importing opentrons used to when API v2 was not enabled. The
+saving comes entirely from the work skipped, so the test checks that the
+legacy modules are not imported and the database is not touched until a
+legacy name is used. The import times are printed for ``pytest -s``.
+"""
+import os
+import subprocess
+import sys
+
+
+def _import_times(tmpdir, code):
+    env = dict(os.environ)
+    env['OT_API_CONFIG_DIR'] = str(tmpdir)
+    env.pop('OT_API_FF_useProtocolApi2', None)
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+        check=True)
+    times = {}
+    for line in proc.stderr.decode().splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times, proc.stdout.decode()
+
+
+def test_import_time(tmpdir):
+    lazy, _ = _import_times(tmpdir, 'import opentrons')
+    assert 'opentrons.legacy_api.api' not in lazy
+    assert not tmpdir.join('opentrons.db').exists()
+
+    eager, _ = _import_times(
+        tmpdir, 'import opentrons; import opentrons.legacy_api.api')
+    lazy_ms = lazy['opentrons'] / 1000
+    eager_ms = (eager['opentrons'] + eager['opentrons.legacy_api.api'])\
+        / 1000
+    print(f'import opentrons: {lazy_ms:.0f}ms, {len(lazy)} modules '
+          f'(with legacy api {eager_ms:.0f}ms, {len(eager)})')
+    assert len(lazy) < len(eager)
+    assert tmpdir.join('opentrons.db').exists()
+
+
+def test_legacy_names_load_on_use(tmpdir):
+    times, out = _import_times(
+        tmpdir,
+        'import opentrons\n'
+        'from opentrons import robot, instruments\n'
+        'print(robot is opentrons.robot, opentrons.labware is not None)')
+    assert 'opentrons.legacy_api.api' in times
+    assert out.splitlines()[-1] == 'True True'
+    assert tmpdir.join('opentrons.db').exists()
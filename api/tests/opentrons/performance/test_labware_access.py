@@ -0,0 +1,136 @@
+""" Benchmark of well accessors and tip tracking on large labware and tip
+pools.
+
+The references are the approaches the labware used before: indexes rebuilt
+on every access, and tip state found by walking every column. What made the
+old accessors slow on a 384-well plate was rebuilding the name and column
+indexes on each call, so the test counts index builds: none should happen
+once the labware is loaded. Likewise the tip tracker should find tips from
+its column masks without checking wells one by one, so that test counts
+well checks. The times are printed for ``pytest -s``.
+"""
+import time
+from itertools import dropwhile, takewhile
+
+from opentrons.protocol_api import labware
+from opentrons.types import Location, Point
+
+PLATE = 'corning_384_wellplate_112ul_flat'
+TIPRACK = 'opentrons_96_tiprack_300ul'
+TIPRACK_COUNT = 10
+
+
+_builds = 0
+
+
+def _uncached_wells_by_name(self):
+    global _builds
+    _builds += 1
+    return {name: well for name, well in zip(self._ordering, self._wells)}
+
+
+def _uncached_columns(self):
+    global _builds
+    _builds += 1
+    col_dict = self._create_indexed_dictionary(group=2)
+    return [col_dict[key] for key in sorted(col_dict, key=lambda x: int(x))]
+
+
+def _walking_next_tip(rack, num_tips):
+    drop_leading_empties = [
+        list(dropwhile(lambda x: not x.has_tip, column))
+        for column in _uncached_columns(rack)]
+    drop_at_first_gap = [
+        list(takewhile(lambda x: x.has_tip, column))
+        for column in drop_leading_empties]
+    long_enough = [
+        column for column in drop_at_first_gap if len(column) >= num_tips]
+    return long_enough[0][0] if long_enough else None
+
+
+def _walking_use_tips(rack, start_well, num_channels):
+    target_column = [
+        col for col in _uncached_columns(rack) if start_well in col][0]
+    well_idx = target_column.index(start_well)
+    for well in target_column[well_idx:well_idx + num_channels]:
+        assert well.has_tip
+        well.has_tip = False
+
+
+def _load(name, slot):
+    return labware.Labware(labware.get_labware_definition(name),
+                           Location(Point(slot * 150, 0, 0), str(slot)))
+
+
+def _access_plate(plate):
+    start = time.perf_counter()
+    for _ in range(5):
+        for column in plate.columns():
+            for well in column:
+                assert plate[repr(well).split()[0]] is well
+    return time.perf_counter() - start
+
+
+def _use_tip_pool(racks, num_channels, next_tip, use_tips):
+    start = time.perf_counter()
+    picked = 0
+    while True:
+        for rack in racks:
+            tip = next_tip(rack, num_channels)
+            if tip:
+                break
+        else:
+            break
+        use_tips(rack, tip, num_channels)
+        picked += num_channels
+    assert picked == 96 * len(racks)
+    return time.perf_counter() - start
+
+
+def test_cached_well_indexes(monkeypatch):
+    global _builds
+    plate = _load(PLATE, 0)
+    _builds = 0
+    plate_time = _access_plate(plate)
+    assert _builds == 0
+    with monkeypatch.context() as m:
+        m.setattr(labware.Labware, '_wells_by_name',
+                  property(_uncached_wells_by_name), raising=False)
+        m.setattr(labware.Labware, 'columns', _uncached_columns)
+        ref_plate_time = _access_plate(plate)
+    print(f'384-well plate access: {plate_time*1000:.1f}ms '
+          f'(uncached {ref_plate_time*1000:.1f}ms, {_builds} index builds)')
+    # One build per call to columns() and one per lookup by name
+    assert _builds == 5 * (1 + 384)
+
+
+def test_tip_tracking(monkeypatch):
+    checks = 0
+    has_tip = labware.TipTracker.has_tip
+
+    def counting_has_tip(self, col_idx, row_idx):
+        nonlocal checks
+        checks += 1
+        return has_tip(self, col_idx, row_idx)
+
+    monkeypatch.setattr(labware.TipTracker, 'has_tip', counting_has_tip)
+    for num_channels in (1, 8):
+        racks = [_load(TIPRACK, slot) for slot in range(TIPRACK_COUNT)]
+        checks = 0
+        tracked_time = _use_tip_pool(
+            racks, num_channels,
+            lambda rack, num: rack.next_tip(num),
+            lambda rack, tip, num: rack.use_tips(tip, num))
+        tracked_checks = checks
+        for rack in racks:
+            rack.reset()
+        checks = 0
+        walking_time = _use_tip_pool(
+            racks, num_channels, _walking_next_tip, _walking_use_tips)
+        print(f'{TIPRACK_COUNT}-rack tip pool, {num_channels} channels: '
+              f'{tracked_time*1000:.1f}ms, {tracked_checks} well checks '
+              f'(walking columns {walking_time*1000:.1f}ms, {checks})')
+        # The tracker finds tips from its column masks, without looking at
+        # wells one by one
+        assert tracked_checks == 0
+        assert checks > 96 * TIPRACK_COUNT
@@ -0,0 +1,55 @@
+""" Benchmark of the calls from a protocol context into the hardware thread
+during a transfer to every well of a plate, with each planned move submitted
+in one call and with one call per segment of the move as before.
+
+Run with ``pytest -s`` to see the measured times.
+"""
+import asyncio
+import time
+
+import pytest
+
+from opentrons import simulate
+
+
+def _transfer(monkeypatch, by_segment):
+    ctx = simulate.get_protocol_api('2.0')
+    hardware = ctx._hw_manager.hardware
+    if by_segment:
+        def move_through(mount, moves, speed=None, max_speeds=None):
+            for point, critical_point in moves:
+                hardware.move_to(mount, point, critical_point=critical_point,
+                                 speed=speed, max_speeds=max_speeds)
+        monkeypatch.setattr(hardware._api, 'move_through', move_through)
+
+    tiprack = ctx.load_labware('opentrons_96_tiprack_300ul', 1)
+    source = ctx.load_labware('usascientific_12_reservoir_22ml', 2)
+    plate = ctx.load_labware('corning_96_wellplate_360ul_flat', 3)
+    pipette = ctx.load_instrument('p300_single', 'right', tip_racks=[tiprack])
+
+    hops = 0
+    run_coroutine_threadsafe = asyncio.run_coroutine_threadsafe
+
+    def counting_run(*args, **kwargs):
+        nonlocal hops
+        hops += 1
+        return run_coroutine_threadsafe(*args, **kwargs)
+
+    with monkeypatch.context() as m:
+        m.setattr(asyncio, 'run_coroutine_threadsafe', counting_run)
+        start = time.perf_counter()
+        pipette.transfer(100, source['A1'], plate.wells())
+        elapsed = time.perf_counter() - start
+    ctx._hw_manager.release()
+    return hops, elapsed
+
+
+@pytest.mark.api2_only
+def test_transfer_hops(ensure_api2, monkeypatch):
+    hops, elapsed = _transfer(monkeypatch, by_segment=False)
+    with monkeypatch.context() as m:
+        ref_hops, ref_elapsed = _transfer(m, by_segment=True)
+    print(f'96-well transfer: {hops} calls into the hardware thread, '
+          f'{elapsed*1000:.0f}ms (by segment {ref_hops}, '
+          f'{ref_elapsed*1000:.0f}ms)')
+    assert hops * 1.25 < ref_hops
@@ -0,0 +1,128 @@
+""" Benchmark of the pose tree queries made around each move of a legacy
+protocol with a deck full of 384-well plates.
+
+The reference is the pose tracker as it was before: every change of base
+folds and inverts the transforms from the nodes involved up to the root,
+every ``max_z`` changes the base of every descendant, and every update
+copies the whole tree. Inverting a 4x4 matrix is the expensive step the
+cache exists to avoid, so the test counts inversions: after the first
+query, each node's inverse should be computed once until it moves. The
+times are printed for ``pytest -s``.
+"""
+import functools
+import itertools
+import time
+
+import numpy as np
+from numpy.linalg import inv
+
+from opentrons.legacy_api.containers import load as containers_load
+from opentrons.legacy_api.robot import Robot
+from opentrons.trackers import pose_tracker
+from opentrons.trackers.pose_tracker import Point, ROOT, translate
+
+PLATE_SLOTS = ['1', '2', '3', '4', '5', '6', '7', '8', '9']
+MOVES = 100
+
+
+def _reference_descendants(state, obj, level=0):
+    return sum([
+        [(child, level)] + _reference_descendants(state, child, level + 1)
+        for child in state[obj].children
+    ], [])
+
+
+def _reference_ascend(state, start, finish=ROOT):
+    if start is finish:
+        return [finish]
+    return [start] + _reference_ascend(
+        state, start=state[start].parent, finish=finish)
+
+
+def _reference_change_base(state, point=Point(0, 0, 0), src=ROOT, dst=ROOT):
+    def fold(objects):
+        return functools.reduce(
+            lambda a, b: a.dot(b),
+            [state[key].transform for key in objects],
+            np.identity(4)
+        )
+
+    up = _reference_ascend(state, src)
+    down = list(reversed(_reference_ascend(state, dst)))
+    root = [n1 for n1, n2 in zip(reversed(up), down) if n1 is n2].pop()
+    up = list(itertools.takewhile(lambda node: node is not root, up))
+    down = list(itertools.dropwhile(lambda node: node is not root, down))[1:]
+    point_in_root = inv(fold(up)).dot((*point, 1))
+    return fold(down).dot(point_in_root)[:-1]
+
+
+def _reference_max_z(state, root):
+    return max(
+        Point(*_reference_change_base(state, src=obj, dst=root)).z
+        for obj, _ in _reference_descendants(state, root))
+
+
+def _reference_update(state, obj, point):
+    state = state.copy()
+    state[obj] = state[obj].update(
+        np.identity(4).dot(inv(translate(point))))
+    return state
+
+
+_inversions = 0
+
+
+def _counting_inv(matrix):
+    global _inversions
+    _inversions += 1
+    return np.linalg.inv(matrix)
+
+
+def _moves(state, robot, pipette, update, change_base, max_z):
+    """ The pose tree work of moving a pipette around the deck: a gantry
+    update, a safe height for the arc and where the pipette ended up """
+    global _inversions
+    _inversions = 0
+    start = time.perf_counter()
+    for idx in range(MOVES):
+        state = update(state, robot.gantry, Point(idx, idx, 0))
+        height = max_z(state, robot._deck)
+        position = change_base(state, src=pipette)
+    return ((time.perf_counter() - start) / MOVES, _inversions / MOVES,
+            height, position)
+
+
+def test_pose_tree_moves(config_tempdir, monkeypatch):
+    global _inversions
+    monkeypatch.setattr(pose_tracker, 'inv', _counting_inv)
+    monkeypatch.setitem(globals(), 'inv', _counting_inv)
+    robot = Robot()
+    robot.home()
+    for slot in PLATE_SLOTS:
+        containers_load(robot, '384-plate', slot)
+    pipette = robot._actuators['left']['carriage']
+    state = robot.poses
+
+    reference_state = dict(state)
+    # The first query works out (and caches) where everything is
+    _inversions = 0
+    start = time.perf_counter()
+    pose_tracker.max_z(state, robot._deck)
+    first_time = time.perf_counter() - start
+    first_inversions = _inversions
+    per_move, inversions, height, position = _moves(
+        state, robot, pipette, pose_tracker.update,
+        pose_tracker.change_base, pose_tracker.max_z)
+    ref_per_move, ref_inversions, ref_height, ref_position = _moves(
+        reference_state, robot, pipette, _reference_update,
+        _reference_change_base, _reference_max_z)
+    assert np.isclose(height, ref_height)
+    assert np.isclose(position, ref_position).all()
+    print(f'{len(state)} tracked objects: {per_move*1000:.2f}ms and '
+          f'{inversions:.0f} inversions per move after '
+          f'{first_time*1000:.1f}ms and {first_inversions} for the first '
+          f'(reference {ref_per_move*1000:.1f}ms and {ref_inversions:.0f} '
+          f'per move)')
+    # Only the transforms of what moved are worked out again
+    assert first_inversions <= len(state)
+    assert inversions * 100 < ref_inversions
@@ -0,0 +1,163 @@
+""" Micro-benchmark of the per-command overhead of the publish decorators.
+
+The reference implementation is the one the decorators used before: the
+argument specs of both the command and the decorated function looked up on
+every call, and a message built even when nobody was listening. Those two
+are the whole overhead, so the test counts them: specs should only be
+looked up when the decorator is applied, and no message should be built
+while the broker has no subscribers. The times are printed for
+``pytest -s``.
+"""
+import functools
+import inspect
+import logging
+import time
+
+from opentrons import commands
+from opentrons.commands import CommandPublisher, types as command_types
+
+CALLS = 2000
+
+_builds = 0
+_lookups = 0
+
+
+def _reference_do_publish(broker, cmd, f, when, res, meta, *args, **kwargs):
+    publish_command = functools.partial(
+        broker.publish,
+        topic=command_types.COMMAND)
+    call_args = {}
+    if inspect.getfullargspec(f).defaults:
+        call_args = dict(
+            zip(
+                reversed(inspect.getfullargspec(f).args),
+                reversed(inspect.getfullargspec(f).defaults)))
+    call_args.update(dict(zip(inspect.getfullargspec(f).args, args)))
+    call_args.update(kwargs)
+    if when == 'before':
+        broker.logger.info("{}: {}".format(
+            f.__qualname__,
+            {k: v for k, v in call_args.items() if str(k) != 'self'}))
+    command_args = dict(
+        zip(
+            reversed(inspect.getfullargspec(cmd).args),
+            reversed(inspect.getfullargspec(cmd).defaults
+                     or [])))
+    if 'instrument' in inspect.getfullargspec(cmd).args:
+        if 'self' in call_args and 'instrument' not in call_args:
+            call_args['instrument'] = call_args['self']
+    command_args.update({
+        key: call_args[key]
+        for key in
+        (set(inspect.getfullargspec(cmd).args)
+         & call_args.keys())
+    })
+    if meta:
+        command_args['meta'] = meta
+    payload = cmd(**command_args)
+    publish_command(message={**payload, '$': when})
+
+
+def _reference_publish_both(command):
+    def decorator(f):
+        @functools.wraps(f)
+        def decorated(*args, **kwargs):
+            broker = args[0].broker
+            _reference_do_publish(
+                broker, command, f, 'before', None, None, *args, **kwargs)
+            res = f(*args, **kwargs)
+            _reference_do_publish(
+                broker, command, f, 'after', res, None, *args, **kwargs)
+            return res
+        return decorated
+    return decorator
+
+
+def _aspirate_command(instrument, volume, location, rate):
+    global _builds
+    _builds += 1
+    return commands.make_command(
+        name=command_types.ASPIRATE,
+        payload={
+            'instrument': instrument,
+            'volume': volume,
+            'location': location,
+            'rate': rate,
+            'text': 'Aspirating {} uL from {} at {} speed'.format(
+                volume, location, rate)
+        })
+
+
+def _undecorated(self, volume, location=None, rate=1.0):
+    return self
+
+
+class FakeInstrument(CommandPublisher):
+    def __init__(self):
+        super().__init__(None)
+
+    aspirate = commands.publish.both(
+        command=_aspirate_command)(_undecorated)
+    reference_aspirate = _reference_publish_both(
+        command=_aspirate_command)(_undecorated)
+
+    def __repr__(self):
+        return 'FakeInstrument'
+
+
+def _time_calls(method):
+    """ Time calls to ``method``, returning the time per call, the number of
+    argument spec lookups and the number of messages built """
+    global _builds
+    _builds = 0
+    lookups_before = _lookups
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        method(10, 'A1', 1.0)
+    elapsed = (time.perf_counter() - start) / CALLS
+    return elapsed, _lookups - lookups_before, _builds
+
+
+def test_publish_overhead(monkeypatch):
+    getfullargspec = inspect.getfullargspec
+
+    def counting_getfullargspec(func):
+        global _lookups
+        _lookups += 1
+        return getfullargspec(func)
+
+    monkeypatch.setattr(inspect, 'getfullargspec', counting_getfullargspec)
+    instr = FakeInstrument()
+    # Commands aren't logged, whatever logging other tests have configured,
+    # so that only the publishing itself is measured
+    logger = logging.getLogger(__name__)
+    logger.setLevel(logging.WARNING)
+    instr.broker.set_logger(logger)
+    bare, _, _ = _time_calls(functools.partial(_undecorated, instr))
+    quiet, quiet_lookups, quiet_builds = _time_calls(instr.aspirate)
+    reference_quiet, reference_quiet_lookups, reference_quiet_builds\
+        = _time_calls(instr.reference_aspirate)
+
+    messages = []
+    instr.broker.subscribe(command_types.COMMAND, messages.append)
+    listened, listened_lookups, listened_builds\
+        = _time_calls(instr.aspirate)
+    reference_listened, reference_listened_lookups, _\
+        = _time_calls(instr.reference_aspirate)
+    assert len(messages) == 4 * CALLS
+
+    print(f'publish overhead per command with no subscribers: '
+          f'{(quiet - bare)*1e6:.2f}us '
+          f'(reference {(reference_quiet - bare)*1e6:.2f}us)')
+    print(f'publish overhead per command with a subscriber: '
+          f'{(listened - bare)*1e6:.2f}us '
+          f'(reference {(reference_listened - bare)*1e6:.2f}us)')
+    # Argument specs are looked up when the decorator is applied, and
+    # nothing is built for a command that nobody is listening to
+    assert quiet_lookups == 0
+    assert quiet_builds == 0
+    assert reference_quiet_lookups > 0
+    assert reference_quiet_builds == 2 * CALLS
+    assert listened_lookups == 0
+    assert listened_builds == 2 * CALLS
+    assert reference_listened_lookups > 0
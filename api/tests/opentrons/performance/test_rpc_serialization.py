@@ -0,0 +1,164 @@
+""" Benchmark of serializing a 1000-command protocol session for RPC
+clients.
+
+The reference serializer is the one the RPC server used before: a list of
+every object seen so far for cycle detection and no reuse of static
+subtrees. The reference registry keeps everything ever serialized. Most of
+a session's tree is labware and instruments that don't change between
+calls, so the test counts the values each serializer visits: a first call
+visits as many as the reference, and once the static subtrees are cached
+a call should visit fewer than half. The registries are compared by the
+sessions they keep alive. Run with ``pytest -s`` to see the measurements.
+"""
+import gc
+import time
+import weakref
+
+import pytest
+from aiohttp import web
+
+from opentrons.server import rpc, serialize
+
+TRANSFERS = 500
+SESSIONS = 4
+
+PROTOCOL = '''
+metadata = {{'apiLevel': '2.0'}}
+
+def run(ctx):
+    plate = ctx.load_labware('corning_96_wellplate_360ul_flat', 1)
+    tiprack = ctx.load_labware('opentrons_96_tiprack_300ul', 2)
+    pipette = ctx.load_instrument('p300_single', 'right',
+                                  tip_racks=[tiprack])
+    pipette.pick_up_tip()
+    for i in range({transfers}):
+        pipette.aspirate(10, plate.wells()[i % 96])
+        pipette.dispense(10, plate.wells()[(i + 1) % 96])
+    pipette.drop_tip()
+'''.format(transfers=TRANSFERS)
+
+
+_visits = 0
+
+
+def _reference_object_tree(max_depth, path, refs, depth, obj):  # noqa C901
+    global _visits
+    _visits += 1
+
+    def object_container(value):
+        t = type(obj)
+        refs[id(t)] = t
+        return {'i': id(obj), 't': id(t), 'v': value}
+
+    if isinstance(obj, (str, int, bool, float, complex)) or obj is None:
+        return obj
+    if hasattr(obj, '__dict__') and id(obj) in path:
+        return object_container(None)
+
+    def object_tree(o):
+        return _reference_object_tree(max_depth, path, refs, depth + 1, o)
+
+    path += [id(obj)]
+    if isinstance(obj, (list, tuple)):
+        return [object_tree(o) for o in obj]
+
+    def iterate(kv): return {str(k): object_tree(v) for k, v in kv.items()}
+
+    if isinstance(obj, dict):
+        return object_container(iterate(obj))
+    elif hasattr(obj, '__dict__'):
+        refs[id(obj)] = obj
+        items = []
+        try:
+            items = [object_tree(o) for o in obj]
+        except TypeError:
+            pass
+        tail = {i: v for i, v in enumerate(items)}
+        attributes = {
+            k: v for k, v in obj.__dict__.items() if not k.startswith('_')}
+        return object_container({**iterate(attributes), **tail})
+    else:
+        return object_container({})
+
+
+def _reference_get_object_tree(obj):
+    refs = {}
+    return _reference_object_tree(0, [], refs, 0, obj), refs
+
+
+def _time(func, repeats=5):
+    """ Time ``func``, returning the time and number of values visited per
+    call, and its result """
+    global _visits
+    _visits = 0
+    start = time.perf_counter()
+    for _ in range(repeats):
+        res = func()
+    return ((time.perf_counter() - start) / repeats, _visits // repeats,
+            res)
+
+
+@pytest.mark.api2_only
+def test_session_serialization(main_router, loop, monkeypatch):
+    get_object_tree = serialize._get_object_tree
+
+    def counting_get_object_tree(*args, **kwargs):
+        global _visits
+        _visits += 1
+        return get_object_tree(*args, **kwargs)
+
+    monkeypatch.setattr(
+        serialize, '_get_object_tree', counting_get_object_tree)
+    server = rpc.RPCServer(web.Application(), main_router)
+    manager = main_router.session_manager
+
+    then = time.perf_counter()
+    session = manager.create(name='<blank>', contents=PROTOCOL)
+    print(f'simulated {len(session.commands)} commands in '
+          f'{time.perf_counter() - then:.1f}s')
+    assert len(session.commands) > 2 * TRANSFERS
+
+    ref_time, ref_visits, (ref_tree, _) = _time(
+        lambda: _reference_get_object_tree(session))
+    cold_time, cold_visits, (cold_tree, _) = _time(
+        lambda: serialize.get_object_tree(session), repeats=1)
+    # The first call fills the cache
+    server.call_and_serialize(lambda: session)
+    warm_time, warm_visits, _ = _time(
+        lambda: server.call_and_serialize(lambda: session))
+    assert cold_tree == ref_tree
+    print(f'session serialization: {cold_time*1000:.1f}ms, '
+          f'{warm_time*1000:.1f}ms cached, {warm_visits} values visited '
+          f'(reference {ref_time*1000:.1f}ms, {ref_visits})')
+    assert cold_visits == ref_visits
+    assert warm_visits * 2 < ref_visits
+
+    # Serialize a few sessions the way a client would see them, clearing
+    # each before the next, and see what the registries keep around
+    reference_registry = dict(server.objects)
+    sessions = [weakref.ref(session)]
+    session = cold_tree = ref_tree = None
+    for _ in range(SESSIONS - 1):
+        manager.clear()
+        session = manager.create(name='<blank>', contents=PROTOCOL)
+        sessions.append(weakref.ref(session))
+        server.call_and_serialize(lambda: session)
+        reference_registry.update(_reference_get_object_tree(session)[1])
+        session = None
+
+    def alive_sessions():
+        gc.collect()
+        return sum(1 for ref in sessions if ref() is not None)
+
+    reference_alive = alive_sessions()
+    reference_size = len(reference_registry)
+    del reference_registry
+    # Sessions registered since the previous sweep survive one more
+    server.collect()
+    server.collect()
+    alive = alive_sessions()
+    print(f'registry after {SESSIONS} sessions: {len(server.objects)} '
+          f'entries keeping {alive} sessions alive (reference '
+          f'{reference_size} entries keeping {reference_alive} alive)')
+    assert alive < reference_alive
+    assert len(server.objects) < reference_size
@@ -0,0 +1,94 @@
+""" Benchmark of validating the shared-data protocol and labware fixtures.
+
+The reference validation is what the API did before: read and decode the
+schemas, build a resolver and call :py:func:`jsonschema.validate`, which
+checks the schema itself as well, every time. Checking the schema walks it
+as an instance of the metaschema, so the test counts the schema nodes
+visited per validation; a cached validator visits only the nodes the
+fixture needs, and a fixture already seen valid visits none. The
+per-validation latencies are printed for ``pytest -s``.
+"""
+import json
+import pathlib
+import pkgutil
+import time
+
+import jsonschema  # type: ignore
+
+from opentrons.util import schemas
+
+SHARED_DATA = pathlib.Path(__file__).parent/'..'/'..'/'..'/'..'/'shared-data'
+REPEATS = 20
+
+
+def _fixtures(*path):
+    return [json.loads(fixture.read_text())
+            for fixture in sorted(SHARED_DATA.joinpath(*path).glob('*.json'))]
+
+
+def _reference_validate(instance, path):
+    schema = json.loads(pkgutil.get_data(  # type: ignore
+        'opentrons', path).decode('utf-8'))
+    labware_schema_v2 = json.loads(pkgutil.get_data(  # type: ignore
+        'opentrons', schemas.LABWARE_SCHEMA_V2).decode('utf-8'))
+    resolver = jsonschema.RefResolver(
+        schema.get('$id', ''),
+        schema,
+        store={'opentronsLabwareSchemaV2': labware_schema_v2})
+    jsonschema.validate(instance, schema, resolver=resolver)
+
+
+_visits = 0
+
+
+def _per_validation(validate, instances, path):
+    """ Validate each of ``instances`` a few times, returning the time taken
+    and the number of schema nodes visited per validation """
+    global _visits
+    _visits = 0
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        for instance in instances:
+            validate(instance, path)
+    validations = REPEATS * len(instances)
+    return ((time.perf_counter() - start) / validations,
+            _visits / validations)
+
+
+def _cold(instance, path):
+    schemas.clear_validated()
+    schemas.validate(instance, path)
+
+
+def test_validation_latency(monkeypatch):
+    iter_errors = jsonschema.Draft7Validator.iter_errors
+
+    def counting_iter_errors(self, *args, **kwargs):
+        global _visits
+        _visits += 1
+        return iter_errors(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        jsonschema.Draft7Validator, 'iter_errors', counting_iter_errors)
+    kinds = [
+        ('protocol', _fixtures('protocol', 'fixtures', '3'),
+         schemas.protocol_schema_path(3)),
+        ('labware', _fixtures('labware', 'fixtures', '2'),
+         schemas.LABWARE_SCHEMA_V2)]
+    for kind, instances, path in kinds:
+        reference, reference_visits = _per_validation(
+            _reference_validate, instances, path)
+        cold, cold_visits = _per_validation(_cold, instances, path)
+        for instance in instances:
+            schemas.validate(instance, path)
+        warm, warm_visits = _per_validation(
+            schemas.validate, instances, path)
+        print(f'{len(instances)} {kind} fixtures: '
+              f'{cold*1000:.2f}ms per validation, {warm*1000:.3f}ms '
+              f'already validated (reference {reference*1000:.2f}ms); '
+              f'{cold_visits:.0f} schema nodes visited per validation '
+              f'(reference {reference_visits:.0f})')
+        # The schema isn't checked again, and an instance that has already
+        # passed isn't looked at again
+        assert cold_visits < reference_visits
+        assert warm_visits == 0
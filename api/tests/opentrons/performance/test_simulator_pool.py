@@ -0,0 +1,65 @@
+""" Benchmark of back-to-back simulations with simulators from the pool,
+against building a new simulator for every simulation and leaving its thread
+to be stopped when it is collected, as was done before the pool.
+
+Building a simulator is a small part of even a short simulation, so only the
+thread counts are checked. Run with ``pytest -s`` to see the measured times.
+"""
+import io
+import threading
+import time
+
+import pytest
+
+from opentrons import simulate
+from opentrons.hardware_control import adapters
+
+SIMULATIONS = 100
+
+PROTOCOL = b'''
+metadata = {'apiLevel': '2.0'}
+
+def run(ctx):
+    tiprack = ctx.load_labware('opentrons_96_tiprack_300ul', 1)
+    plate = ctx.load_labware('corning_96_wellplate_360ul_flat', 2)
+    pipette = ctx.load_instrument('p300_single', 'right', tip_racks=[tiprack])
+    pipette.pick_up_tip()
+    pipette.aspirate(100, plate['A1'])
+    pipette.dispense(100, plate['B1'])
+    pipette.drop_tip()
+'''
+
+
+def _simulate_many():
+    start_threads = threading.active_count()
+    most_threads = start_threads
+    start = time.perf_counter()
+    for _ in range(SIMULATIONS):
+        runlog, _ = simulate.simulate(io.BytesIO(PROTOCOL), 'pooled.py')
+        assert runlog
+        most_threads = max(most_threads, threading.active_count())
+    return time.perf_counter() - start, most_threads - start_threads
+
+
+@pytest.mark.api2_only
+def test_simulator_pool(ensure_api2, monkeypatch):
+    pool = adapters.SimulatorPool()
+    monkeypatch.setattr(adapters, 'simulator_pool', pool)
+    pooled_time, pooled_threads = _simulate_many()
+    assert pool.builds == 1
+
+    unpooled = adapters.SimulatorPool(maxsize=0)
+    uncollected = []
+    monkeypatch.setattr(unpooled, 'release', uncollected.append)
+    monkeypatch.setattr(adapters, 'simulator_pool', unpooled)
+    unpooled_time, unpooled_threads = _simulate_many()
+    assert unpooled.builds == SIMULATIONS
+    pool.clear()
+    for adapter in uncollected:
+        adapter.join()
+
+    print(f'{SIMULATIONS} simulations: {pooled_time*1000:.0f}ms, '
+          f'{pooled_threads} more threads at most '
+          f'(unpooled {unpooled_time*1000:.0f}ms, {unpooled_threads})')
+    assert pooled_threads <= 1
+    assert unpooled_threads == SIMULATIONS
@@ -0,0 +1,163 @@
+""" Benchmark of jsonrpc throughput over the hardware socket server's unix
+socket.
+
+The reference uses the transport the server had before: the whole buffer
+decoded again for each chunk received with at most one request dispatched
+per chunk, and a client decoder that reads one byte at a time. Since that
+can't pipeline requests, the reference makes them one at a time.
+
+Decoding the whole buffer again whenever more arrives is quadratic in the
+size of a message, so the test counts the json characters decoded per
+request; with incremental framing each request and its response are
+decoded once apiece. The request rates are printed for ``pytest -s``.
+"""
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+import pytest
+
+import opentrons.hardware_control as hc
+import opentrons.hardware_control.socket_server as sockserv
+
+pytestmark = pytest.mark.skipif(sys.platform.startswith('win'),
+                                reason='No unix domain sockets on windows')
+
+PAYLOAD_SIZE = 4000
+REQUESTS = 1000
+REFERENCE_REQUESTS = 20
+
+
+class _ReferenceDecoder:
+    def __init__(self, reader):
+        self._reader = reader
+        self._buf = b''
+        self._decoder = json.JSONDecoder()
+
+    async def read_object(self):
+        while True:
+            self._buf += await self._reader.read(1)
+            try:
+                decoded, offset = self._decoder.raw_decode(self._buf.decode())
+            except json.JSONDecodeError:
+                pass
+            else:
+                self._buf = self._buf[offset:]
+                return decoded
+
+
+class _ReferenceProtocol(sockserv.JsonRpcProtocol):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._buffer = ''
+        self._decoder = json.JSONDecoder()
+
+    def data_received(self, data):
+        self._buffer += data.decode()
+        try:
+            _, pos = self._decoder.raw_decode(self._buffer)
+        except json.JSONDecodeError:
+            if self._buffer[0] != '{':
+                obj_start = self._buffer.find('{')
+                if obj_start == -1:
+                    return
+                self._buffer = self._buffer[obj_start:]
+                return self.data_received(b'')
+            return
+        to_dispatch = self._buffer[:pos]
+        self._buffer = self._buffer[pos:]
+        task = self._loop.create_task(self._dispatch(to_dispatch))
+
+        def done_callback(fut):
+            self._transport.write(fut.result().encode())
+
+        task.add_done_callback(done_callback)
+
+
+async def _echo_dispatch(call_str):
+    call = json.loads(call_str)
+    return json.dumps({'jsonrpc': '2.0', 'id': call['id'],
+                       'result': call['params']})
+
+
+def _request(idx):
+    return json.dumps({'jsonrpc': '2.0', 'method': 'echo', 'id': idx,
+                       'params': {'data': 'x' * PAYLOAD_SIZE}}).encode()
+
+
+@pytest.fixture
+async def echo_server(loop):
+    with tempfile.TemporaryDirectory() as td:
+        sock = os.path.join(td, 'tst')
+        api = hc.API.build_hardware_simulator(loop=loop)
+        server = await sockserv.run(sock, api)
+        server._dispatch = _echo_dispatch
+        yield sock, server
+    await server.stop()
+
+
+async def _one_at_a_time(sock, count, decoder_cls):
+    reader, writer = await asyncio.open_unix_connection(sock)
+    decoder = decoder_cls(reader)
+    start = time.perf_counter()
+    for idx in range(count):
+        writer.write(_request(idx))
+        assert (await decoder.read_object())['id'] == idx
+    elapsed = time.perf_counter() - start
+    writer.close()
+    return elapsed / count
+
+
+async def _pipelined(sock, count, framing):
+    reader, writer = await asyncio.open_unix_connection(sock)
+    if framing == sockserv.Framing.JSON:
+        decoder = sockserv.JsonStreamDecoder(reader)
+    else:
+        decoder = await sockserv.negotiate_framing(reader, writer, framing)
+    start = time.perf_counter()
+    for idx in range(count):
+        writer.write(sockserv.frame_message(_request(idx), framing))
+    for idx in range(count):
+        assert (await decoder.read_object())['id'] == idx
+    elapsed = time.perf_counter() - start
+    writer.close()
+    return elapsed / count
+
+
+async def test_socket_throughput(echo_server, loop, monkeypatch):
+    sock, server = echo_server
+    decoded = 0
+    raw_decode = json.JSONDecoder.raw_decode
+
+    def counting_raw_decode(self, s, idx=0):
+        nonlocal decoded
+        decoded += len(s) - idx
+        return raw_decode(self, s, idx)
+
+    monkeypatch.setattr(json.JSONDecoder, 'raw_decode', counting_raw_decode)
+    times = {'one at a time': await _one_at_a_time(
+        sock, REQUESTS, sockserv.JsonStreamDecoder)}
+    for framing in sockserv.Framing:
+        times[f'pipelined, {framing.value} framing'] = await _pipelined(
+            sock, REQUESTS, framing)
+    per_request = decoded / (len(times) * REQUESTS)
+    decoded = 0
+    monkeypatch.setattr(sockserv, 'JsonRpcProtocol', _ReferenceProtocol)
+    ref_time = await _one_at_a_time(
+        sock, REFERENCE_REQUESTS, _ReferenceDecoder)
+    ref_per_request = decoded / REFERENCE_REQUESTS
+    for name, request_time in times.items():
+        print(f'{PAYLOAD_SIZE}-byte requests {name}: '
+              f'{1 / request_time:.0f}/s')
+    print(f'reference: {1 / ref_time:.0f}/s')
+    print(f'json decoded per request: {per_request:.0f} characters '
+          f'(reference {ref_per_request:.0f})')
+    # Each request and response is decoded once, by the echo dispatch and
+    # by the client; the reference client decodes its whole buffer for
+    # every byte it reads
+    message_size = len(_request(0))
+    assert per_request < 3 * message_size
+    assert ref_per_request > 100 * message_size
@@ -243,3 +243,25 @@ def test_col_name_accessor():
     a2 = Point(x=offset[0] + x, y=offset[1] + y, z=offset[2] + depth2)
     assert fake_labware.columns_by_name()['1'][0]._position == a1
     assert fake_labware.columns_by_name()['2'][0]._position == a2
+
+
+def test_accessors_share_cached_indexes():
+    fake_labware = labware.Labware(minimalLabwareDef,
+                                   Location(Point(0, 0, 0), 'Test Slot'))
+    first = fake_labware['A1']
+    assert fake_labware.wells_by_name()['A1'] is first
+    assert fake_labware.rows()[0][0] is first
+    assert fake_labware.columns_by_name()['1'][0] is first
+
+    # Mutating the results of an accessor must not affect later calls
+    fake_labware.rows()[0].clear()
+    fake_labware.columns_by_name()['2'].clear()
+    fake_labware.wells_by_name().clear()
+    assert fake_labware.rows()[0] == [first, fake_labware['A2']]
+    assert fake_labware.columns_by_name()['2'] == [fake_labware['A2']]
+    assert fake_labware.wells_by_name()['A1'] is first
+
+    # Applying a new offset rebuilds the wells and their indexes
+    fake_labware.set_calibration(Point(1, 1, 1))
+    assert fake_labware['A1'] is not first
+    assert fake_labware.rows()[0][0] is fake_labware['A1']
@@ -62,9 +62,11 @@ async def test_max_speeds(loop, monkeypatch):
     ctx.connect(hardware)
     ctx.home()
     mock_move = mock.Mock()
-    monkeypatch.setattr(ctx._hw_manager.hardware, 'move_to', mock_move)
+    monkeypatch.setattr(
+        ctx._hw_manager.hardware._api, 'move_through', mock_move)
     instr = ctx.load_instrument('p10_single', Mount.RIGHT)
     instr.move_to(Location(Point(0, 0, 0), None))
+    assert mock_move.call_args_list
     assert all(
         kwargs['max_speeds'] == {}
         for args, kwargs in mock_move.call_args_list)
@@ -131,10 +133,10 @@ def test_move_uses_arc(loop, monkeypatch, get_labware_def):
 
     targets = []
 
-    async def fake_move(mount, target_pos, **kwargs):
+    async def fake_move(mount, moves, **kwargs):
         nonlocal targets
-        targets.append((mount, target_pos, kwargs))
-    monkeypatch.setattr(hardware, 'move_to', fake_move)
+        targets.extend((mount, target_pos, kwargs) for target_pos, _ in moves)
+    monkeypatch.setattr(hardware, 'move_through', fake_move)
 
     right.move_to(lw.wells()[0].top())
     assert len(targets) == 3
@@ -302,18 +304,18 @@ def test_aspirate(loop, get_labware_def, monkeypatch):
     fake_move = mock.Mock()
     monkeypatch.setattr(ctx._hw_manager.hardware._api,
                         'aspirate', fake_hw_aspirate)
-    monkeypatch.setattr(ctx._hw_manager.hardware._api, 'move_to', fake_move)
+    monkeypatch.setattr(
+        ctx._hw_manager.hardware._api, 'move_through', fake_move)
 
     instr.aspirate(2.0, lw.wells()[0].bottom())
     assert 'aspirating' in ','.join([cmd.lower() for cmd in ctx.commands()])
 
     fake_hw_aspirate.assert_called_once_with(Mount.RIGHT, 2.0, 1.0)
-    assert fake_move.call_args_list[-2] ==\
-        mock.call(Mount.RIGHT, lw.wells()[0].top().point,
-                  critical_point=None, speed=400, max_speeds={})
+    assert fake_move.call_args_list[-2][0][1][-1] ==\
+        (lw.wells()[0].top().point, None)
     assert fake_move.call_args_list[-1] ==\
-        mock.call(Mount.RIGHT, lw.wells()[0].bottom().point,
-                  critical_point=None, speed=400, max_speeds={})
+        mock.call(Mount.RIGHT, [(lw.wells()[0].bottom().point, None)],
+                  speed=400, max_speeds={})
     fake_move.reset_mock()
     fake_hw_aspirate.reset_mock()
     instr.well_bottom_clearance.aspirate = 1.0
@@ -321,12 +323,11 @@ def test_aspirate(loop, get_labware_def, monkeypatch):
     dest_point, dest_lw = lw.wells()[0].bottom()
     dest_point = dest_point._replace(z=dest_point.z + 1.0)
     assert fake_move.call_args_list[-2] ==\
-        mock.call(Mount.RIGHT, lw.wells()[0].top().point,
-                  critical_point=None, speed=400, max_speeds={})
+        mock.call(Mount.RIGHT, [(lw.wells()[0].top().point, None)],
+                  speed=400, max_speeds={})
     assert fake_move.call_args_list[-1] ==\
-        mock.call(
-            Mount.RIGHT, dest_point, critical_point=None, speed=400,
-            max_speeds={})
+        mock.call(Mount.RIGHT, [(dest_point, None)],
+                  speed=400, max_speeds={})
     assert len(fake_move.call_args_list) == 2
     fake_move.reset_mock()
     ctx._hw_manager.hardware._api\
@@ -351,30 +352,28 @@ def test_dispense(loop, get_labware_def, monkeypatch):
 
     move_called_with = None
 
-    def fake_move(mount, loc, **kwargs):
+    def fake_move(mount, moves, **kwargs):
         nonlocal move_called_with
-        move_called_with = (mount, loc, kwargs)
+        move_called_with = (mount, moves[-1], kwargs)
 
     monkeypatch.setattr(ctx._hw_manager.hardware._api,
                         'dispense', fake_hw_dispense)
-    monkeypatch.setattr(ctx._hw_manager.hardware._api, 'move_to', fake_move)
+    monkeypatch.setattr(
+        ctx._hw_manager.hardware._api, 'move_through', fake_move)
 
     instr.dispense(2.0, lw.wells()[0].bottom())
     assert 'dispensing' in ','.join([cmd.lower() for cmd in ctx.commands()])
     assert disp_called_with == (Mount.RIGHT, 2.0, 1.0)
-    assert move_called_with == (Mount.RIGHT, lw.wells()[0].bottom().point,
-                                {'critical_point': None,
-                                 'speed': 400,
-                                 'max_speeds': {}})
+    assert move_called_with == (Mount.RIGHT,
+                                (lw.wells()[0].bottom().point, None),
+                                {'speed': 400, 'max_speeds': {}})
 
     instr.well_bottom_clearance.dispense = 2.0
     instr.dispense(2.0, lw.wells()[0])
     dest_point, dest_lw = lw.wells()[0].bottom()
     dest_point = dest_point._replace(z=dest_point.z + 2.0)
-    assert move_called_with == (Mount.RIGHT, dest_point,
-                                {'critical_point': None,
-                                 'speed': 400,
-                                 'max_speeds': {}})
+    assert move_called_with == (Mount.RIGHT, (dest_point, None),
+                                {'speed': 400, 'max_speeds': {}})
 
     move_called_with = None
     instr.dispense(2.0)
@@ -468,11 +467,20 @@ def test_touch_tip_default_args(loop, monkeypatch):
 
     async def fake_hw_move(mount, abs_position, speed=None,
                            critical_point=None, max_speeds=None):
-        nonlocal total_hw_moves
         total_hw_moves.append((abs_position, speed))
 
+    segments = []
+
+    async def fake_hw_move_through(mount, moves, speed=None,
+                                   max_speeds=None):
+        segments.append(len(moves))
+        total_hw_moves.extend(
+            (abs_position, speed) for abs_position, _ in moves)
+
     instr.aspirate(10, lw.wells()[0])
     monkeypatch.setattr(ctx._hw_manager.hardware._api, 'move_to', fake_hw_move)
+    monkeypatch.setattr(ctx._hw_manager.hardware._api, 'move_through',
+                        fake_hw_move_through)
     instr.touch_tip()
     z_offset = Point(0, 0, 1)   # default z offset of 1mm
     speed = 60                  # default speed
@@ -480,6 +488,9 @@ def test_touch_tip_default_args(loop, monkeypatch):
              lw.wells()[0]._from_center_cartesian(-1, 0, 1) - z_offset,
              lw.wells()[0]._from_center_cartesian(0, 1, 1) - z_offset,
              lw.wells()[0]._from_center_cartesian(0, -1, 1) - z_offset]
+    # The pipette is already in the well, so it moves straight up to the
+    # top before touching the edges
+    assert segments == [1]
     for i in range(1, 5):
         assert total_hw_moves[i] == (edges[i - 1], speed)
 
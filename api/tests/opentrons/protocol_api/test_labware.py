@@ -1,5 +1,7 @@
 import json
 import pkgutil
+import random
+from itertools import dropwhile, takewhile
 
 import pytest
 
@@ -329,6 +331,44 @@ def test_return_tips():
     assert not tiprack.wells()[8].has_tip
 
 
+def test_tip_tracking_matches_well_state():
+    labware_name = 'opentrons_96_tiprack_300ul'
+    labware_def = labware.get_labware_definition(labware_name)
+    tiprack = labware.Labware(labware_def,
+                              Location(Point(0, 0, 0), 'Test Slot'))
+    columns = tiprack.columns()
+
+    def first_run(column, has_tip):
+        run = list(takewhile(lambda w: w.has_tip is has_tip,
+                             dropwhile(lambda w: w.has_tip is not has_tip,
+                                       column)))
+        return run
+
+    rand = random.Random(1234)
+    for _ in range(200):
+        well = rand.choice(tiprack.wells())
+        well.has_tip = not well.has_tip
+        for num in range(1, 9):
+            expected_next = [first_run(col, True) for col in columns
+                             if len(first_run(col, True)) >= num]
+            assert tiprack.next_tip(num)\
+                is (expected_next[0][0] if expected_next else None)
+            after_filled = [list(dropwhile(lambda w: w.has_tip, col))
+                            for col in columns]
+            expected_prev = [first_run(col, False) for col in after_filled
+                             if len(first_run(col, False)) >= num]
+            assert tiprack.previous_tip(num)\
+                is (expected_prev[0][0] if expected_prev else None)
+
+    tiprack.reset()
+    assert all(well.has_tip for well in tiprack.wells())
+    tiprack.use_tips(columns[3][2], 8)
+    assert [well.has_tip for well in columns[3]]\
+        == [True, True, False, False, False, False, False, False]
+    assert tiprack.next_tip(3, starting_tip=columns[3][0]) is columns[4][0]
+    assert tiprack.next_tip(2, starting_tip=columns[3][0]) is columns[3][0]
+
+
 def test_module_load():
     module_names = ['tempdeck', 'magdeck']
     module_defs = json.loads(
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from opentrons import protocol_api as papi, types
 
@@ -30,6 +32,29 @@ def test_get_mixed_case_labware_def():
     assert dfn['parameters']['loadName'] == labware_name
 
 
+def test_definitions_cached():
+    dfn = papi.labware.get_labware_definition(labware_name)
+    assert papi.labware.get_labware_definition(labware_name) is dfn
+    with pytest.raises(TypeError):
+        dfn['parameters']['tipLength'] = 100
+
+    custom = copy.deepcopy(dfn)
+    custom['namespace'] = 'custom_beta'
+    custom['parameters']['loadName'] = 'cached_custom_plate'
+    papi.labware.save_definition(custom)
+    loaded = papi.labware.get_labware_definition('cached_custom_plate')
+    assert loaded == custom
+
+    # Custom definitions are loaded again when they change
+    custom['metadata']['displayName'] = 'Changed Custom Plate'
+    papi.labware.save_definition(custom, force=True)
+    loaded = papi.labware.get_labware_definition('cached_custom_plate')
+    assert loaded['metadata']['displayName'] == 'Changed Custom Plate'
+    papi.labware.delete_all_custom_labware()
+    with pytest.raises(FileNotFoundError):
+        papi.labware.get_labware_definition('cached_custom_plate')
+
+
 def test_load_label(loop):
     ctx = papi.ProtocolContext(loop=loop)
     labware = ctx.load_labware(labware_name, '1', 'my cool labware')
@@ -871,3 +871,91 @@ def test_oversized_transfer(_instr_labware):
              'args': [200, lw1.wells_by_index()['C1'], 1.0], 'kwargs': {}},
             {'method': 'drop_tip', 'args': [], 'kwargs': {}}]
     assert xfer_plan_list == exp1
+
+
+def test_lazy_transfers(_instr_labware):
+    _instr_labware['ctx'].home()
+    lw1 = _instr_labware['lw1']
+    lw2 = _instr_labware['lw2']
+    instr = _instr_labware['instr']
+    max_vol = instr.hw_pipette['working_volume']
+    options = tx.TransferOptions(
+        transfer=tx.Transfer(new_tip=TransferTipPolicy.ALWAYS))
+
+    # Generators of sources, dests and volumes plan the same steps as lists
+    vols = [100, 200, 400, 50, 700, 10, 20, 30]
+    list_plan = list(tx.TransferPlan(
+        vols, lw1.columns()[0], lw2.columns()[0], instr, max_vol,
+        options=options))
+    lazy_plan = list(tx.TransferPlan(
+        (v for v in vols), (w for w in lw1.columns()[0]),
+        iter(lw2.columns()[0]), instr, max_vol, options=options))
+    assert lazy_plan == list_plan
+
+    # Nested iterables are flattened as they are consumed
+    list_plan = list(tx.TransferPlan(
+        100, lw1.rows()[:2], lw2.rows()[:2], instr, max_vol))
+    lazy_plan = list(tx.TransferPlan(
+        100, (row for row in lw1.rows()[:2]), lw2.rows()[:2], instr,
+        max_vol))
+    assert lazy_plan == list_plan
+
+    for mode, src, dst in [
+            ('distribute', lw1.wells()[0], lw2.columns()[0]),
+            ('consolidate', lw1.columns()[0], lw2.wells()[0])]:
+        list_plan = list(tx.TransferPlan(
+            30, src, dst, instr, max_vol, mode=mode))
+        lazy_src = src if mode == 'distribute' else iter(src)
+        lazy_dst = iter(dst) if mode == 'distribute' else dst
+        lazy_plan = list(tx.TransferPlan(
+            30, lazy_src, lazy_dst, instr, max_vol, mode=mode))
+        assert lazy_plan == list_plan
+
+    # A single well on one side is used for every well on the other
+    lazy_plan = list(tx.TransferPlan(
+        50, lw1.wells()[0], iter(lw2.columns()[0]), instr, max_vol))
+    assert [step['args'][1] for step in lazy_plan
+            if step['method'] == 'aspirate'] == [lw1.wells()[0]] * 8
+
+    # Mismatched lengths can only be found once the shorter side runs out
+    with pytest.raises(ValueError):
+        list(tx.TransferPlan(
+            50, iter(lw1.columns()[0]), iter(lw2.columns()[0][:4]), instr,
+            max_vol))
+    with pytest.raises(RuntimeError):
+        list(tx.TransferPlan(
+            iter([10, 20]), lw1.columns()[0], lw2.columns()[0], instr,
+            max_vol))
+    with pytest.raises(ValueError):
+        tx.TransferPlan(
+            (10, 100), iter(lw1.columns()[0]), lw2.columns()[0], instr,
+            max_vol)
+
+
+def test_plan_count(_instr_labware):
+    _instr_labware['ctx'].home()
+    lw1 = _instr_labware['lw1']
+    lw2 = _instr_labware['lw2']
+    instr = _instr_labware['instr']
+    max_vol = instr.hw_pipette['working_volume']
+    options = tx.TransferOptions(
+        transfer=tx.Transfer(new_tip=TransferTipPolicy.ALWAYS))
+
+    plan = tx.TransferPlan(
+        400, lw1.wells(), lw2.wells(), instr, max_vol, options=options)
+    # Each oversized transfer is split in two, each with its own tip
+    assert plan.count() == {
+        'pick_up_tip': 192, 'aspirate': 192, 'dispense': 192,
+        'drop_tip': 192}
+    # Re-iterable inputs can be counted and then executed
+    assert len(list(plan)) == 768
+
+    # A very long stream of transfers is counted without holding its steps
+    def cycle_wells(repeats):
+        for _ in range(repeats):
+            yield from lw1.wells()
+
+    plan = tx.TransferPlan(
+        100, cycle_wells(100), lw2.wells()[0], instr, max_vol)
+    assert plan.count() == {
+        'pick_up_tip': 1, 'aspirate': 9600, 'dispense': 9600, 'drop_tip': 1}
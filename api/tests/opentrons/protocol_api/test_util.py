@@ -4,20 +4,24 @@ from opentrons.protocol_api.util import HardwareManager, AxisMaxSpeeds
 from opentrons.hardware_control import API, adapters, types
 
 
-def test_hw_manager(loop):
-    # When built without an input it should build its own adapter
+def test_hw_manager(loop, monkeypatch):
+    pool = adapters.SimulatorPool(maxsize=1)
+    monkeypatch.setattr(adapters, 'simulator_pool', pool)
+    # When built without an input it should get its own simulator
     mgr = HardwareManager(None)
     assert mgr._is_orig
     adapter = mgr.hardware
+    api = adapter._api
     # When "disconnecting" from its own simulator, the adapter should
-    # be stopped and a new one created
+    # be given back and a new simulator created
     assert adapter.is_alive()
     new = mgr.reset_hw()
-    assert new is not adapter
-    assert not adapter.is_alive()
-    # When deleted, the self-created adapter should be stopped
+    assert new._api is not api
+    assert pool.builds == 1
+    # When deleted, the self-created adapter should be given back
     del mgr
-    assert not new.is_alive()
+    assert new.is_alive()
+    assert pool.acquire() is new
     # When built with a hardware API input it should wrap it but not
     # build its own
     mgr = HardwareManager(
@@ -33,11 +37,18 @@ def test_hw_manager(loop):
     assert passed.is_alive()
     # When connecting to an adapter it shouldn’t rewrap it
     assert mgr.set_hw(passed) is passed
-    # And should kill its old one
-    assert not new.is_alive()
+    # And should give back its old one
+    assert pool.acquire() is new
     del mgr
     # but not its new one, even if deleted
     assert passed.is_alive()
+    # Simulators the pool has no room for are stopped
+    pool.maxsize = 0
+    mgr = HardwareManager(None)
+    own = mgr.hardware
+    del mgr
+    assert not own.is_alive()
+    pool.clear()
 
 
 def test_max_speeds_userdict():
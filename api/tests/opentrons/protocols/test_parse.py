@@ -286,3 +286,24 @@ def test_extra_contents(
                    extra_data=extra_data)
     assert parsed.extra_labware == bundled_labware
     assert parsed.bundled_data == extra_data
+
+
+def test_parse_cached(get_json_protocol_fixture):
+    text = 'metadata = {"apiLevel": "2.0"}\ndef run(ctx): pass\n'
+    first = parse(text, 'cached.py')
+    second = parse(text.encode('utf-8'), 'cached.py',
+                   extra_data={'hi': b'there'})
+    assert second.contents is first.contents
+    assert second.bundled_data == {'hi': b'there'}
+    second.metadata['apiLevel'] = '1'
+    assert parse(text, 'cached.py').metadata == {'apiLevel': '2.0'}
+    # Code objects know their filename, so other names compile again
+    assert parse(text, 'other.py').contents.co_filename == 'other.py'
+
+    protocol = get_json_protocol_fixture('3', 'simple', decode=False)
+    first = parse(protocol, 'simple.json')
+    second = parse(protocol, 'simple.json')
+    assert second.contents == first.contents
+    assert second.contents is not first.contents
+    with pytest.raises(jsonschema.ValidationError):
+        parse('{"schemaVersion": 3}')
@@ -212,6 +212,56 @@ async def test_execute_module_command_v1(
     assert body['message'] == 'Success'
 
 
+@pytest.mark.api2_only
+async def test_module_data_history(
+        virtual_smoothie_env, loop, async_server, async_client, monkeypatch):
+    hw = async_server['com.opentrons.hardware']
+    temp_module = await modules.build('', 'tempdeck', True, lambda x: None)
+
+    async def stub():
+        return [temp_module]
+
+    monkeypatch.setattr(hw, 'discover_modules', stub)
+    await temp_module.set_temperature(40)
+
+    resp = await async_client.get('/modules/dummySerialTD/data/history')
+    body = await resp.json()
+    assert resp.status == 200
+    assert body['fields'] == ['currentTemp', 'targetTemp']
+    # Sampled when the module connected and after the temperature was set
+    assert [sample['targetTemp'] for sample in body['samples']]\
+        == [None, 40]
+    last = body['samples'][-1]
+
+    resp = await async_client.get(
+        f'/modules/dummySerialTD/data/history?since={last["timestamp"]}')
+    body = await resp.json()
+    assert body['samples'] == [last]
+
+    resp = await async_client.get(
+        '/modules/dummySerialTD/data/history?since=yesterday')
+    assert resp.status == 400
+    resp = await async_client.get('/modules/notASerial/data/history')
+    assert resp.status == 404
+
+    resp = await async_client.get(
+        f'/modules/dummySerialTD/data/stream?since={last["timestamp"]}')
+    assert resp.status == 200
+    assert json.loads(await resp.content.readline()) == last
+    temp_module.deactivate()
+    sample = json.loads(await resp.content.readline())
+    assert sample['targetTemp'] is None
+    assert sample['timestamp'] >= last['timestamp']
+    resp.close()
+
+    # A simulated module has no serial connection to measure
+    resp = await async_client.get('/modules/dummySerialTD/metrics')
+    assert resp.status == 200
+    assert await resp.json() == {}
+    resp = await async_client.get('/modules/notASerial/metrics')
+    assert resp.status == 404
+
+
 @pytest.mark.api1_only
 async def test_get_cached_pipettes(async_server, async_client, monkeypatch):
     test_model = 'p300_multi_v1'
@@ -1,6 +1,13 @@
+import asyncio
 import json
+import os
+
+import pytest
+from aiohttp import web
+
 from opentrons import config
 from opentrons.server import init
+from opentrons.server.endpoints import logs
 
 
 async def test_log_endpoints(
@@ -28,3 +35,72 @@ async def test_log_endpoints(
     a1 = await cli.get('/logs/api.log')
     a1body = await a1.text()
     assert json.loads(a1body) == data2
+
+
+@pytest.fixture
+def fake_journalctl(tmpdir, monkeypatch):
+    """ A journalctl on the PATH that records its arguments and pid """
+    script = tmpdir.join('journalctl')
+    script.write(f'''#!/bin/sh
+echo $$ > {tmpdir.join('pid')}
+printf "%s\\n" "$@" > {tmpdir.join('args')}
+case "$*" in
+    *--since=bad*)
+        echo "Failed to parse timestamp: bad" >&2
+        exit 1 ;;
+    *--grep=noisy*)
+        # More warnings than will fit in the pipe and its reader
+        head -c 1000000 /dev/zero | tr '\\0' w >&2 ;;
+esac
+echo "record 1"
+echo "record 2"
+case "$*" in
+    *--follow*)
+        exec sleep 60 ;;
+esac
+''')
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f'{tmpdir}:{os.environ["PATH"]}')
+    return tmpdir
+
+
+async def test_stream_logs(loop, aiohttp_client, fake_journalctl):
+    app = web.Application()
+    app.router.add_get('/logs/{syslog_identifier}', logs.get_logs_by_id)
+    cli = await loop.create_task(aiohttp_client(app))
+
+    resp = await cli.get('/logs/api.log', params={
+        'records': '10', 'since': '-1h', 'until': '2019-10-02 12:00:00',
+        'grep': 'error'})
+    assert resp.status == 200
+    assert await resp.text() == 'record 1\nrecord 2\n'
+    assert fake_journalctl.join('args').read().splitlines() == [
+        '--no-pager', '-t', 'opentrons-api', '-n', '10', '-o', 'short', '-a',
+        '--since=-1h', '--until=2019-10-02 12:00:00', '--grep=error']
+
+    # Warnings on stderr don't hold up the records
+    resp = await cli.get('/logs/api.log', params={'grep': 'noisy'})
+    assert resp.status == 200
+    assert await resp.text() == 'record 1\nrecord 2\n'
+
+    resp = await cli.get('/logs/api.log', params={'since': 'bad'})
+    assert resp.status == 400
+    assert (await resp.json())['message']\
+        == 'Failed to parse timestamp: bad'
+
+    resp = await cli.get('/logs/serial.log', params={'follow': 'true'})
+    assert resp.status == 200
+    assert await resp.content.readline() == b'record 1\n'
+    assert await resp.content.readline() == b'record 2\n'
+    pid = int(fake_journalctl.join('pid').read())
+    os.kill(pid, 0)
+    # Once the client goes away, journalctl is stopped
+    resp.close()
+    for _ in range(100):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        await asyncio.sleep(0.01)
+    else:
+        assert False, 'journalctl is still running'
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import os
 import random
@@ -74,10 +75,87 @@ GENERAL.STATE:100 (connected)'''
             return '', 'this is a dummy error'
 
     monkeypatch.setattr(nmcli, '_call', mock_call)
+    # Otherwise the last status would be reused
+    app['com.opentrons.network_queries'].invalidate()
     resp = await cli.get('/networking/status')
     assert resp.status == 500
 
 
+@pytest.fixture
+def fake_nmcli(tmpdir, monkeypatch):
+    """ An nmcli on the PATH that records how it was called """
+    calls = tmpdir.join('calls')
+    script = tmpdir.join('nmcli')
+    script.write(f'''#!/bin/sh
+echo "$@" >> {calls}
+sleep 0.1
+case "$*" in
+    *connectivity*)
+        echo full ;;
+    *"dev show"*)
+        echo "GENERAL.HWADDR:B8:27:EB:39:C0:9A"
+        echo "IP4.ADDRESS[1]:169.254.229.173/16"
+        echo "GENERAL.TYPE:ethernet"
+        echo "GENERAL.STATE:100 (connected)" ;;
+    *"wifi list"*)
+        echo "Opentrons:81:yes:WPA2" ;;
+esac
+''')
+    script.chmod(0o755)
+    monkeypatch.setenv('PATH', f'{tmpdir}:{os.environ["PATH"]}')
+
+    def _calls():
+        if not calls.check():
+            return []
+        return calls.read().splitlines()
+    return _calls
+
+
+async def test_network_queries_shared(
+        virtual_smoothie_env, loop, aiohttp_client, monkeypatch,
+        fake_nmcli):
+    app = init()
+    cli = await loop.create_task(aiohttp_client(app))
+
+    responses = await asyncio.gather(
+        *(cli.get('/networking/status') for _ in range(5)))
+    bodies = [await resp.json() for resp in responses]
+    assert all(resp.status == 200 for resp in responses)
+    assert bodies[0]['status'] == 'full'
+    assert bodies[0]['interfaces']['eth0']['state'] == 'connected'
+    assert all(body == bodies[0] for body in bodies)
+    # One connectivity check and one query per interface, however many
+    # requests asked at the same time
+    assert len(fake_nmcli()) == 1 + len(nmcli.NETWORK_IFACES)
+
+    # ...and for a while afterwards
+    resp = await cli.get('/networking/status')
+    assert await resp.json() == bodies[0]
+    assert len(fake_nmcli()) == 1 + len(nmcli.NETWORK_IFACES)
+
+    for _ in range(2):
+        resp = await cli.get('/wifi/list')
+        assert resp.status == 200
+        assert [nw['ssid'] for nw in (await resp.json())['list']]\
+            == ['Opentrons']
+    assert [call for call in fake_nmcli() if 'wifi' in call] == [
+        'device wifi rescan',
+        '--terse --fields ssid,signal,active,security device wifi list']
+
+    # Connecting to a network makes the last status stale
+    async def mock_configure(ssid, securityType=None, psk=None, hidden=False):
+        return True, 'connected'
+
+    monkeypatch.setattr(nmcli, 'configure', mock_configure)
+    resp = await cli.post(
+        '/wifi/configure', json={'ssid': 'Opentrons', 'psk': 'scrt sqrl'})
+    assert resp.status == 201
+    called = len(fake_nmcli())
+    resp = await cli.get('/networking/status')
+    assert resp.status == 200
+    assert len(fake_nmcli()) == called + 1 + len(nmcli.NETWORK_IFACES)
+
+
 async def test_wifi_list(
         virtual_smoothie_env, loop, aiohttp_client, monkeypatch):
     app = init()
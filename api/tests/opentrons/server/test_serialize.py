@@ -1,7 +1,9 @@
+import gc
 import json
 import pytest
 
 from collections import OrderedDict
+from opentrons.commands import tree
 from opentrons.server import serialize
 
 
@@ -117,3 +119,36 @@ def test_ordered_dict():
                 'i': id(b),
                 't': type_id(b),
                 'v': {'b': 1}}}}
+
+
+def test_subtree_cache():
+    commands = tree.from_list([
+        {'level': 0, 'description': 'A', 'id': 0},
+        {'level': 1, 'description': 'B', 'id': 1},
+        {'level': 0, 'description': 'C', 'id': 2}])
+    plain = [{'a': 1}]
+
+    class Holder:
+        def __init__(self, commands, plain):
+            self.commands = commands
+            self.plain = plain
+
+    cache = serialize.SubtreeCache()
+    first, first_refs = serialize.get_object_tree(
+        Holder(commands, plain), cache=cache)
+    second, second_refs = serialize.get_object_tree(
+        Holder(commands, plain), cache=cache)
+    uncached, uncached_refs = serialize.get_object_tree(
+        Holder(commands, plain))
+
+    assert first['v'] == second['v'] == uncached['v']
+    assert len(first_refs) == len(second_refs)
+    assert len(cache) == 1
+    # Static values reuse their tree; anything else is walked every time
+    assert second['v']['commands'] is first['v']['commands']
+    assert second['v']['plain'] is not first['v']['plain']
+
+    # The registered holders keep the commands alive until they are gone
+    del commands, first_refs, second_refs, uncached_refs
+    gc.collect()
+    assert len(cache) == 0
@@ -3,7 +3,7 @@ import pytest
 import sys
 import time
 
-from opentrons.server import rpc
+from opentrons.server import rpc, serialize
 from opentrons.protocol_api.execute import ExceptionInProtocolError
 from threading import Event
 
@@ -436,3 +436,26 @@ def message_key(message):
     meta = message['$']
     data = message.get('data', '')
     return str(meta.get('type')) + meta.get('token', '') + str(data)
+
+
+def test_object_registry_collect():
+    registry = rpc.ObjectRegistry()
+    root = Foo(Foo(0))
+    system = object()
+    _, refs = serialize.get_object_tree(root)
+    registry.register(refs)
+    old, new = Foo(1), Foo(2)
+    registry.register({id(old): old})
+
+    # Recently registered objects survive one collection even when
+    # nothing reaches them from the root
+    assert registry.collect(root, pinned=[system]) == 0
+    assert id(old) in registry
+    assert id(system) in registry
+
+    registry.register({id(new): new})
+    assert registry.collect(root, pinned=[system]) == 1
+    assert id(old) not in registry
+    assert id(new) in registry
+    assert id(root.value) in registry
+    assert registry[id(type(root))] is Foo
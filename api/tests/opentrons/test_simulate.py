@@ -1,9 +1,12 @@
 # coding=utf-8
 import io
+import json
+import os
 
 import pytest
 
 from opentrons import simulate, protocols
+from opentrons.config import advanced_settings
 
 
 @pytest.mark.api2_only
@@ -22,6 +25,17 @@ def test_simulate_function_apiv2(ensure_api2,
         ]
 
 
+@pytest.mark.api2_only
+@pytest.mark.parametrize('protocol_file', ['testosaur_v2.py'])
+def test_simulate_reads_settings_once(ensure_api2,
+                                      protocol,
+                                      protocol_file):
+    reads = advanced_settings.disk_reads()
+    simulate.simulate(protocol.filelike, 'testosaur_v2.py')
+    # At most once, since the file may have changed since it was last read
+    assert advanced_settings.disk_reads() - reads <= 1
+
+
 @pytest.mark.api2_only
 def test_simulate_function_json_apiv2(ensure_api2,
                                       get_json_protocol_fixture):
@@ -79,3 +93,45 @@ def test_simulate_function_apiv1(ensure_api1, protocol, protocol_file):
         'Dispensing 10 uL into well H12 in "11"',
         'Dropping tip well A1 in "12"'
     ]
+
+
+@pytest.mark.api2_only
+def test_simulate_estimates_duration(ensure_api2,
+                                     get_json_protocol_fixture):
+    jp = get_json_protocol_fixture('3', 'simple', False)
+    runlog, _ = simulate.simulate(io.StringIO(jp), 'simple.json')
+    assert all(item['duration'] is not None for item in runlog)
+    delay = [item for item in runlog
+             if item['payload']['text'].startswith('Delaying')][0]
+    assert delay['duration'] == pytest.approx(42)
+    total = simulate.runlog_duration(runlog)
+    assert total > 42
+    formatted = simulate.format_runlog(runlog, durations=True)
+    assert formatted.splitlines()[-1].startswith('Estimated run time: 0:00:')
+    assert 'Estimated run time' not in simulate.format_runlog(runlog)
+
+
+@pytest.mark.api2_only
+def test_simulate_batch(ensure_api2, tmpdir, get_json_protocol_fixture):
+    tmpdir.join('simple.json').write(
+        get_json_protocol_fixture('3', 'simple', False))
+    tmpdir.join('broken.py').write('def run(ctx):\n    pass\n')
+    tmpdir.join('notes.txt').write('not a protocol')
+    paths = simulate.batch_protocols(str(tmpdir))
+    assert [os.path.basename(path) for path in paths]\
+        == ['broken.py', 'simple.json']
+
+    # Simulate the json protocol twice in the same worker, to check nothing
+    # carries over from one protocol to the next
+    broken, first, second = simulate.simulate_batch(
+        paths + paths[1:], jobs=1)
+    assert 'apiLevel' in broken['error']
+    assert broken['runlog'] == []
+    assert first['error'] is None
+    assert first['runlog'] == second['runlog']
+    assert [command['text'] for command in first['runlog']][:2] == [
+        'Picking up tip B1 of Opentrons 96 Tip Rack 10 µL on 1',
+        'Aspirating 5 uL from A1 of Source Plate on 2 at 1.0 speed']
+    assert first['duration'] > 42
+    assert first['elapsed'] > 0
+    json.dumps(first)
@@ -150,3 +150,25 @@ def test_change_base():
         .add('1-1', parent='1', point=Point(1, 0, 0))
 
     assert isclose(change_base(state, src='1-1'), (0.5, 0, 0)).all()
+
+
+def test_cached_queries_follow_changes(state):
+    # Query everything first so it is cached
+    assert max_z(state, ROOT) == 26.0
+    assert (change_base(state, src='1-1-1') == (12, 14, 16)).all()
+
+    # Moving a node moves its subtree, and only its subtree
+    state = update(state, '1', Point(1, 2, 50))
+    assert (change_base(state, src='1-1-1') == (12, 14, 63)).all()
+    assert (change_base(state, src='2-1') == (-12, -14, -16)).all()
+    assert max_z(state, ROOT) == 73.0
+    assert max_z(state, '1') == 23.0
+
+    state = state.add('1-1-1-1', parent='1-1-1', point=Point(0, 0, 100))
+    assert max_z(state, ROOT) == 163.0
+    assert max_z(state, '1-1') == 100.0
+
+    state = remove(state, '1-1')
+    assert max_z(state, ROOT) == 73.0
+    with pytest.raises(ValueError):
+        max_z(state, '2-1')
@@ -0,0 +1,80 @@
+import copy
+import json
+import pickle
+
+import pytest
+
+from opentrons.util.definitions import (DefinitionCache, FrozenDict,
+                                        FrozenList, freeze)
+
+
+def test_freeze():
+    data = {'a': [1, {'b': 2}], 'c': {'d': [3]}}
+    frozen = freeze(data)
+    assert frozen == data
+    assert isinstance(frozen, FrozenDict)
+    assert isinstance(frozen['a'], FrozenList)
+    assert isinstance(frozen['a'][1], FrozenDict)
+    assert freeze(frozen) is frozen
+
+    for change in [lambda: frozen.update(e=1),
+                   lambda: frozen.pop('a'),
+                   lambda: frozen.__setitem__('a', 1),
+                   lambda: frozen['a'].append(4),
+                   lambda: frozen['a'][1].__setitem__('b', 3),
+                   lambda: frozen['c']['d'].sort()]:
+        with pytest.raises(TypeError):
+            change()
+    assert frozen == data
+
+    # Copies can be changed, and frozen data still works as plain data
+    thawed = copy.deepcopy(frozen)
+    thawed['a'][1]['b'] = 3
+    assert type(thawed['a']) is list
+    assert frozen['a'][1]['b'] == 2
+    assert json.loads(json.dumps(frozen)) == data
+    assert pickle.loads(pickle.dumps(frozen)) == data
+
+
+def test_definition_cache(tmpdir):
+    cache = DefinitionCache(maxsize=2)
+    loads = []
+
+    def loader(key):
+        def load():
+            loads.append(key)
+            return {'key': key}
+        return load
+
+    first = cache.get('a', loader('a'))
+    assert cache.get('a', loader('a')) is first
+    assert loads == ['a']
+
+    # The least recently used entry goes first
+    cache.get('b', loader('b'))
+    cache.get('a', loader('a'))
+    cache.get('c', loader('c'))
+    assert len(cache) == 2
+    cache.get('a', loader('a'))
+    cache.get('b', loader('b'))
+    assert loads == ['a', 'b', 'c', 'b']
+
+    # Entries watching files are loaded again when the files change
+    watched = tmpdir.join('watched.json')
+    watched.write('{}')
+    cache.get('d', loader('d'), [watched])
+    cache.get('d', loader('d'), [watched])
+    assert loads[-1:] == ['d']
+    watched.write('{"changed": true}')
+    cache.get('d', loader('d'), [watched])
+    watched.remove()
+    cache.get('d', loader('d'), [watched])
+    assert loads[-3:] == ['d', 'd', 'd']
+    assert cache.loads == len(loads)
+
+    def broken():
+        raise FileNotFoundError()
+
+    with pytest.raises(FileNotFoundError):
+        cache.get('e', broken)
+    assert cache.get('e', loader('e')) == {'key': 'e'}
@@ -0,0 +1,42 @@
+import copy
+import threading
+
+import jsonschema  # type: ignore
+import pytest
+
+from opentrons.util import schemas
+
+
+def test_validate_remembers_valid(get_labware_fixture, monkeypatch):
+    schemas.clear_validated()
+    definition = get_labware_fixture('fixture_96_plate')
+    schemas.validate(definition, schemas.LABWARE_SCHEMA_V2)
+    assert schemas.get_validator(schemas.LABWARE_SCHEMA_V2)\
+        is schemas.get_validator(schemas.LABWARE_SCHEMA_V2)
+
+    # The same contents aren't validated again
+    with monkeypatch.context() as m:
+        m.setattr(schemas, 'get_validator', None)
+        schemas.validate(copy.deepcopy(definition), schemas.LABWARE_SCHEMA_V2)
+
+    # but anything else is, and failures aren't remembered
+    broken = copy.deepcopy(definition)
+    del broken['wells']
+    for _ in range(2):
+        with pytest.raises(jsonschema.ValidationError):
+            schemas.validate(broken, schemas.LABWARE_SCHEMA_V2)
+    with pytest.raises(jsonschema.ValidationError):
+        schemas.validate({'wells': object()}, schemas.LABWARE_SCHEMA_V2)
+
+
+def test_validators_per_thread():
+    validators = []
+    thread = threading.Thread(target=lambda: validators.append(
+        schemas.get_validator(schemas.LABWARE_SCHEMA_V2)))
+    thread.start()
+    thread.join()
+    # Resolving references isn't thread safe, so threads don't share
+    assert validators[0] is not schemas.get_validator(
+        schemas.LABWARE_SCHEMA_V2)
+    assert validators[0].schema is schemas.get_validator(
+        schemas.LABWARE_SCHEMA_V2).schema
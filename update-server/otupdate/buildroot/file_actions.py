@@ -25,6 +25,13 @@ ROOTFS_NAME = 'rootfs.ext4'
 UPDATE_FILES = [ROOTFS_NAME, ROOTFS_SIG_NAME, ROOTFS_HASH_NAME]
 LOG = logging.getLogger(__name__)
 
+#: The size of the reads and writes when streaming an update to a partition.
+#: This is a multiple of the partition's block size, so writes stay aligned.
+STREAM_CHUNK_SIZE = 1024 * 1024
+#: How much progress (between 0 and 1) to make between progress callbacks
+#: when streaming an update
+PROGRESS_STEP = 0.01
+
 
 class Partition(NamedTuple):
     number: int
@@ -355,6 +362,113 @@ def write_update(rootfs_filepath: str,
     return unused
 
 
+def check_update(filepath: str, cert_path: Optional[str]) -> bytes:
+    """ Check that an update file has what it needs without unzipping the
+    rootfs, and get the hash it should have.
+
+    The hash (and its signature, if required) are unzipped to the same
+    directory as the zipfile.
+
+    :param filepath: The path to the update zip file
+    :param cert_path: Path to an x.509 certificate to check the signature of
+                      the hash against. If ``None``, signature checking is
+                      disabled
+    :returns: The packaged rootfs hash as ascii hex
+
+    :raises FileMissing: If a required file is missing
+    :raises SignatureMismatch: If the signature does not verify
+    """
+    required = [ROOTFS_NAME, ROOTFS_HASH_NAME]
+    if cert_path:
+        required.append(ROOTFS_SIG_NAME)
+    with zipfile.ZipFile(filepath, 'r') as zf:
+        names = zf.namelist()
+        for name in required:
+            if name not in names:
+                raise FileMissing(f'File {name} missing from zip')
+        paths = {}
+        for name in required[1:]:
+            paths[name] = os.path.join(os.path.dirname(filepath), name)
+            with open(paths[name], 'wb') as unzipped:
+                unzipped.write(zf.read(name))
+    if cert_path:
+        verify_signature(paths[ROOTFS_HASH_NAME], paths[ROOTFS_SIG_NAME],
+                         cert_path)
+    with open(paths[ROOTFS_HASH_NAME], 'rb') as hashfile:
+        return hashfile.read().strip()
+
+
+def _throttle_progress(
+        progress_callback: Callable[[float], None],
+        step: float = PROGRESS_STEP) -> Callable[[float], None]:
+    """ Wrap ``progress_callback`` so it is only called once progress has
+    moved by at least ``step`` (and when it is complete) """
+    last = -step
+
+    def throttled(progress: float):
+        nonlocal last
+        if progress - last >= step or progress >= 1.0:
+            last = progress
+            progress_callback(progress)
+    return throttled
+
+
+def stream_update(filepath: str,
+                  expected_hash: bytes,
+                  progress_callback: Callable[[float], None],
+                  chunk_size: int = STREAM_CHUNK_SIZE,
+                  algo: str = 'sha256') -> RootPartitions:
+    """ Write the rootfs in an update file to the next root partition,
+    checking its hash on the way.
+
+    This does in one pass what :py:meth:`validate_update` and
+    :py:meth:`write_update` do in three: the rootfs is decompressed straight
+    from the zip to the partition and hashed as it goes. Check the rest of
+    the update with :py:meth:`check_update` first.
+
+    A hash mismatch is only found once the partition has been written, but
+    it is the unused partition, and it must not be committed to.
+
+    :param filepath: The path to the update zip file
+    :param expected_hash: The hash the rootfs should have, as ascii hex
+    :param progress_callback: A callback to call with progress between 0 and
+                              1.0, every :py:data:`PROGRESS_STEP`
+    :param chunk_size: The size of the reads and writes
+    :param algo: The algorithm to use. Can be anything used by
+                 :py:mod:`hashlib`
+    :returns: The root partition that the rootfs image was written to
+    :raises HashMismatch: If the rootfs does not match ``expected_hash``
+    """
+    unused = _find_unused_partition()
+    part_path = unused.value.path
+    progress = _throttle_progress(progress_callback)
+    hasher = hashlib.new(algo)
+    total_written = 0
+    with zipfile.ZipFile(filepath, 'r') as zf:
+        file_size = zf.getinfo(ROOTFS_NAME).file_size
+        LOG.info(f'stream_update: writing {ROOTFS_NAME} ({file_size}B) '
+                 f'from {filepath} to {part_path} in {chunk_size}B chunks')
+        # Unbuffered, so each chunk is written as it is
+        with zf.open(ROOTFS_NAME) as zipped,\
+                open(part_path, 'wb', buffering=0) as part:
+            while True:
+                chunk = zipped.read(chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                part.write(chunk)
+                total_written += len(chunk)
+                # The size is what the zip says, which may be nothing at all
+                progress(total_written / file_size if file_size else 1.0)
+    rootfs_hash = binascii.hexlify(hasher.digest())
+    if rootfs_hash != expected_hash:
+        msg = f"Hash mismatch: calculated {rootfs_hash!r} != "\
+            f"packaged {expected_hash!r}"
+        LOG.error(msg)
+        raise HashMismatch(msg)
+    return unused
+
+
 def _mountpoint_root():
     """ provides mountpoint location for :py:meth:`mount_update`.
 
@@ -86,12 +86,17 @@ async def _save_file(part: BodyPartReader, path: str):
 
 def _begin_write(session: UpdateSession,
                  loop: asyncio.AbstractEventLoop,
-                 rootfs_file_path: str):
-    """ Start the write process. """
+                 update_file_path: str,
+                 rootfs_hash: bytes):
+    """ Start the write process.
+
+    The rootfs is only hashed as it is written, so the session only gets to
+    done (and can only be committed) if the hash matches.
+    """
     session.set_progress(0)
     session.set_stage(Stages.WRITING)
     write_future = asyncio.ensure_future(loop.run_in_executor(
-        None, file_actions.write_update, rootfs_file_path,
+        None, file_actions.stream_update, update_file_path, rootfs_hash,
         session.set_progress))
 
     def write_done(fut):
@@ -111,15 +116,19 @@ def _begin_validation(
         loop: asyncio.AbstractEventLoop,
         downloaded_update_path: str)\
         -> asyncio.futures.Future:
-    """ Start the validation process. """
+    """ Start the validation process.
+
+    This checks the update's files and the signature of the rootfs hash; the
+    rootfs itself is checked while it is written.
+    """
     session.set_stage(Stages.VALIDATING)
     cert_path = config.update_cert_path\
         if config.signature_required else None
 
     validation_future \
         = asyncio.ensure_future(loop.run_in_executor(
-            None, file_actions.validate_update,
-            downloaded_update_path, session.set_progress, cert_path))
+            None, file_actions.check_update,
+            downloaded_update_path, cert_path))
 
     def validation_done(fut):
         exc = fut.exception()
@@ -127,11 +136,12 @@ def _begin_validation(
             session.set_error(getattr(exc, 'short', str(type(exc))),
                               str(exc))
         else:
-            rootfs_file = fut.result()
+            rootfs_hash = fut.result()
             loop.call_soon_threadsafe(_begin_write,
                                       session,
                                       loop,
-                                      rootfs_file)
+                                      downloaded_update_path,
+                                      rootfs_hash)
     validation_future.add_done_callback(validation_done)
     return validation_future
 
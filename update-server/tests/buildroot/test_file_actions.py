@@ -200,6 +200,57 @@ def test_write_update(extracted_update_file, testing_partition):
             'rb').read().strip()
 
 
+def test_check_update(downloaded_update_file, testing_cert):
+    rootfs_hash = file_actions.check_update(downloaded_update_file,
+                                            testing_cert)
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        assert rootfs_hash == zf.read('rootfs.ext4.hash').strip()
+
+
+@pytest.mark.bad_sig
+def test_check_update_catches_bad_sig(downloaded_update_file, testing_cert):
+    with pytest.raises(file_actions.SignatureMismatch):
+        file_actions.check_update(downloaded_update_file, testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4_hash_sig
+def test_check_update_sig_only_if_required(
+        downloaded_update_file, testing_cert):
+    assert file_actions.check_update(downloaded_update_file, None)
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.check_update(downloaded_update_file, testing_cert)
+
+
+@pytest.mark.exclude_rootfs_ext4
+def test_check_update_catches_missing_image(downloaded_update_file):
+    with pytest.raises(file_actions.FileMissing):
+        file_actions.check_update(downloaded_update_file, None)
+
+
+def test_stream_update(downloaded_update_file, testing_partition):
+    cb = mock.Mock()
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        rootfs = zf.read('rootfs.ext4')
+        rootfs_hash = zf.read('rootfs.ext4.hash').strip()
+    file_actions.stream_update(downloaded_update_file, rootfs_hash, cb,
+                               chunk_size=256)
+    assert open(testing_partition, 'rb').read() == rootfs
+    # Progress is throttled rather than reported for every chunk
+    assert cb.call_count <= 1 / file_actions.PROGRESS_STEP + 1
+    assert cb.call_count < len(rootfs) // 256
+    cb.assert_called_with(1.0)
+
+
+@pytest.mark.bad_hash
+def test_stream_update_catches_bad_hash(
+        downloaded_update_file, testing_partition):
+    with zipfile.ZipFile(downloaded_update_file) as zf:
+        rootfs_hash = zf.read('rootfs.ext4.hash').strip()
+    with pytest.raises(file_actions.HashMismatch):
+        file_actions.stream_update(downloaded_update_file, rootfs_hash,
+                                   mock.Mock())
+
+
 def test_commit_update(monkeypatch):
     unused = file_actions.RootPartitions.TWO
     new = file_actions.RootPartitions.TWO
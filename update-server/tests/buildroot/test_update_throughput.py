@@ -0,0 +1,121 @@
+""" Benchmark of writing an update to a root partition, with a file standing
+in for the partition.
+
+The reference is the pipeline updates used before: unzip the rootfs to disk,
+hash it, and then copy it to the partition, each in 1KiB chunks. That reads
+the image three times (out of the zip, and twice back off the disk) where
+streaming it reads it once, which is what the test checks; how much faster
+that is depends on the disk. Run with ``pytest -s`` to see the measured
+times.
+"""
+import binascii
+import hashlib
+import os
+import time
+import zipfile
+
+from otupdate.buildroot import file_actions
+
+IMAGE_SIZE = 64 * 1024 * 1024
+BLOCK_SIZE = 4096
+
+
+def _build_update(tmpdir):
+    # Half random, half empty blocks, so the image compresses a bit like a
+    # real filesystem does
+    hasher = hashlib.sha256()
+    zip_path = os.path.join(tmpdir, 'ot2-system.zip')
+    with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        with zf.open(file_actions.ROOTFS_NAME, 'w') as rootfs:
+            for _ in range(IMAGE_SIZE // BLOCK_SIZE):
+                block = os.urandom(BLOCK_SIZE // 2) + bytes(BLOCK_SIZE // 2)
+                hasher.update(block)
+                rootfs.write(block)
+        zf.writestr(file_actions.ROOTFS_HASH_NAME,
+                    binascii.hexlify(hasher.digest()))
+    return zip_path
+
+
+class _CountingFile:
+    """ A file whose reads are added to ``counter['read']`` """
+    def __init__(self, wrapped, counter):
+        self._wrapped = wrapped
+        self._counter = counter
+
+    def read(self, *args):
+        data = self._wrapped.read(*args)
+        self._counter['read'] += len(data)
+        return data
+
+    def __getattr__(self, name):
+        return getattr(self._wrapped, name)
+
+    def __enter__(self):
+        self._wrapped.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        return self._wrapped.__exit__(*args)
+
+
+def _count_reads(monkeypatch):
+    """ Count the bytes read out of zips and files by the update code """
+    counter = {'read': 0}
+
+    def counting_open(*args, **kwargs):
+        return _CountingFile(open(*args, **kwargs), counter)
+
+    zip_read = zipfile.ZipExtFile.read
+
+    def counting_zip_read(self, *args):
+        data = zip_read(self, *args)
+        counter['read'] += len(data)
+        return data
+
+    monkeypatch.setattr(file_actions, 'open', counting_open, raising=False)
+    monkeypatch.setattr(zipfile.ZipExtFile, 'read', counting_zip_read)
+    return counter
+
+
+def _hash_partition(path):
+    with open(path, 'rb') as part:
+        return binascii.hexlify(hashlib.sha256(part.read()).digest())
+
+
+def test_update_throughput(tmpdir, testing_partition, monkeypatch):
+    zip_path = _build_update(tmpdir)
+    calls = 0
+
+    def progress(_):
+        nonlocal calls
+        calls += 1
+
+    counter = _count_reads(monkeypatch)
+    start = time.perf_counter()
+    rootfs_hash = file_actions.check_update(zip_path, None)
+    file_actions.stream_update(zip_path, rootfs_hash, progress)
+    stream_time = time.perf_counter() - start
+    stream_calls = calls
+    stream_read = counter['read']
+    assert _hash_partition(testing_partition) == rootfs_hash
+    os.unlink(testing_partition)
+
+    calls = 0
+    counter['read'] = 0
+    start = time.perf_counter()
+    rootfs = file_actions.validate_update(zip_path, progress, None)
+    file_actions.write_update(rootfs, progress)
+    ref_time = time.perf_counter() - start
+    ref_read = counter['read']
+
+    assert _hash_partition(testing_partition) == rootfs_hash
+    megabytes = IMAGE_SIZE / 1024 / 1024
+    print(f'{megabytes:.0f}MiB update: {stream_time:.2f}s, '
+          f'{megabytes / stream_time:.0f}MiB/s, '
+          f'{stream_read / IMAGE_SIZE:.2f} reads of the image, '
+          f'{stream_calls} progress callbacks (reference {ref_time:.2f}s, '
+          f'{megabytes / ref_time:.0f}MiB/s, {ref_read / IMAGE_SIZE:.2f} '
+          f'reads, {calls} callbacks)')
+    # Apart from the small hash file, the image is read once
+    assert IMAGE_SIZE <= stream_read < 1.01 * IMAGE_SIZE
+    assert ref_read >= 3 * IMAGE_SIZE